@@ -0,0 +1,62 @@
+"""Benchmark of the PNG backend (`curvipy.RasterBackend`), rasterizing a long \
+polyline and a vector field.
+
+Run it from the repository root:
+
+    python -m benchmarks.raster_backend
+"""
+
+import io
+import math
+import timeit
+
+import curvipy
+
+POINTS = 100_000
+VECTORS = 400
+REPEAT = 3
+
+
+def create_plotter() -> curvipy.Plotter:
+    return curvipy.Plotter(
+        screen_config=curvipy.ScreenConfiguration(backend="png", output=io.BytesIO())
+    )
+
+
+def plot_polyline(points: list[tuple[float, float]]) -> None:
+    plotter = create_plotter()
+    plotter.plot_points(points)
+    plotter.wait()
+
+
+def plot_vector_field(vectors: list[curvipy.Vector]) -> None:
+    plotter = create_plotter()
+    plotter.plot_vectors(vectors)
+    plotter.wait()
+
+
+def main() -> None:
+    points = [
+        (20 * i / POINTS - 10, 5 * math.sin(40 * math.pi * i / POINTS))
+        for i in range(POINTS)
+    ]
+    best = min(timeit.repeat(lambda: plot_polyline(points), number=1, repeat=REPEAT))
+    print(f"{POINTS} points polyline: {best * 1000:.1f} ms")
+
+    side = math.isqrt(VECTORS)
+    vectors = [
+        curvipy.Vector(
+            (i - side / 2 + 0.5, j - side / 2 + 0.3 * math.sin(i + j)),
+            (i - side / 2, j - side / 2),
+        )
+        for i in range(side)
+        for j in range(side)
+    ]
+    best = min(
+        timeit.repeat(lambda: plot_vector_field(vectors), number=1, repeat=REPEAT)
+    )
+    print(f"{len(vectors)} vectors field: {best * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Micro-benchmark of bulk `curvipy.Vector` arithmetic.
+
+Run it from the repository root:
+
+    python -m benchmarks.vector_arithmetic
+"""
+
+import timeit
+
+import curvipy
+
+VECTORS = 10_000
+REPEAT = 5
+
+
+def bulk_arithmetic(vectors: list[curvipy.Vector]) -> None:
+    for v, w in zip(vectors, reversed(vectors)):
+        u = (v + w) * 0.5 - w
+        u.norm, u.angle, v.norm, v.angle, u[0], u[1]
+
+
+def main() -> None:
+    vectors = [curvipy.Vector((i, i % 7 - 3), (i % 5, -i)) for i in range(VECTORS)]
+    best = min(timeit.repeat(lambda: bulk_arithmetic(vectors), number=1, repeat=REPEAT))
+    print(
+        f"{VECTORS} vectors: {best * 1000:.1f} ms ({best / VECTORS * 1e6:.2f} µs/vector)"
+    )
+
+
+if __name__ == "__main__":
+    main()
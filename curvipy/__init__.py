@@ -1,4 +1,15 @@
 from ._plotter import *
+from ._animation import *
+from ._backend import *
+from ._cache import *
 from ._curve import *
+from ._curve_points import *
+from ._display_list import *
+from ._drawing_queue import *
 from ._interval import *
+from ._parallel import *
+from ._raster_backend import *
+from ._sampling import *
+from ._svg_backend import *
+from ._turtle_backend import *
 from ._vector import *
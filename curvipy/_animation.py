@@ -0,0 +1,121 @@
+from math import ceil as _ceil
+from math import floor as _floor
+
+from time import perf_counter as _perf_counter
+
+from typing import Callable as _Callable
+
+
+class Animation:
+    """Animation that draws a fixed number of steps (e.g. vectors or curve segments) \
+    in a fixed amount of time, at a fixed frame rate, without blocking the caller.
+
+    Frames are scheduled with a timer of the drawing backend (see \
+    `DrawingBackend.ontimer()`). Each frame draws every step due by the time it runs, \
+    so the number of steps drawn per frame depends on the time budget and not on the \
+    drawing speed. When a frame runs late, the frames that should have run meanwhile \
+    are dropped, and the next frame catches up, so the animation takes `duration` \
+    seconds however many steps it has.
+
+    Animations are returned by `Plotter.plot_animated_curve()`.
+
+    Parameters
+    ----------
+    draw_steps : Callable[[int, int], None]
+        Function that draws the steps from its first argument (included) to its \
+        second argument (excluded).
+    total_steps : int
+        Number of steps of the animation.
+    duration : int or float
+        Duration of the animation (in seconds).
+    frame_rate : int or float
+        Number of frames per second.
+    ontimer : Callable[[Callable[[], None], int], None] or None
+        Function that calls its first argument after its second argument milliseconds \
+        (e.g. `DrawingBackend.ontimer()`). If None, every step is drawn at once by \
+        `start()`, in a single frame.
+
+    Attributes
+    ----------
+    drawn_steps : int
+        Number of steps drawn so far.
+    frames : int
+        Number of frames drawn so far.
+    dropped_frames : int
+        Number of frames skipped because the previous frames ran late.
+    done : bool
+        Whether every step has been drawn.
+    cancelled : bool
+        Whether the animation has been cancelled (see `cancel()`).
+    """
+
+    def __init__(
+        self,
+        draw_steps: _Callable[[int, int], None],
+        total_steps: int,
+        duration: float,
+        frame_rate: float,
+        ontimer: _Callable[[_Callable[[], None], int], None] = None,
+    ):
+        if duration <= 0:
+            raise ValueError("duration must be greater than 0")
+        if frame_rate <= 0:
+            raise ValueError("frame_rate must be greater than 0")
+
+        self.draw_steps = draw_steps
+        self.total_steps = total_steps
+        self.duration = duration
+        self.frame_rate = frame_rate
+        self.ontimer = ontimer
+
+        self.drawn_steps = 0
+        self.frames = 0
+        self.dropped_frames = 0
+        self.done = False
+        self.cancelled = False
+
+        self.__start_time = None
+        # Index of the next frame, counted from the start of the animation
+        self.__frame_index = 0
+
+    def start(self) -> None:
+        """Draws the first frame and schedules the next ones."""
+        if self.__start_time is not None:
+            raise RuntimeError("animation already started")
+        self.__start_time = _perf_counter()
+        if self.ontimer is None:
+            self.__draw_until(self.total_steps)
+            return
+        self.__draw_frame()
+
+    def cancel(self) -> None:
+        """Stops the animation. Steps already drawn are left on screen."""
+        self.cancelled = True
+
+    def __draw_until(self, steps: int) -> None:
+        if steps > self.drawn_steps:
+            self.draw_steps(self.drawn_steps, steps)
+            self.drawn_steps = steps
+        self.frames += 1
+        self.done = self.drawn_steps >= self.total_steps
+
+    def __draw_frame(self) -> None:
+        if self.cancelled:
+            return
+
+        # Draw every step due by now
+        elapsed_time = _perf_counter() - self.__start_time
+        progress = min(elapsed_time / self.duration, 1)
+        self.__draw_until(_ceil(progress * self.total_steps))
+        if self.done:
+            return
+
+        # Schedule the next frame, skipping the frames whose time has already passed
+        elapsed_time = _perf_counter() - self.__start_time
+        next_frame_index = max(
+            self.__frame_index + 1, _floor(elapsed_time * self.frame_rate) + 1
+        )
+        self.dropped_frames += next_frame_index - self.__frame_index - 1
+        self.__frame_index = next_frame_index
+        delay = next_frame_index / self.frame_rate - elapsed_time
+        self.ontimer(self.__draw_frame, max(round(delay * 1000), 0))
@@ -0,0 +1,326 @@
+from abc import ABC as _ABC
+from abc import abstractmethod as _abstractmethod
+
+from math import sin as _sin
+from math import cos as _cos
+from math import pi as _pi
+
+from typing import Any as _Any
+from typing import Callable as _Callable
+from typing import Iterable as _Iterable
+from typing import Union as _Union
+
+from ._curve_points import CurvePoints as _CurvePoints
+
+_TNumber = _Union[int, float]
+_TRealPoint = tuple[_TNumber, _TNumber]
+
+
+class DrawingBackend(_ABC):
+    """Interface of the drawing backends used by `Plotter`.
+
+    A drawing backend draws lines, polylines, arrows and text on a drawing surface \
+    (a window, an image, a file...). It works with *real points*: positions in pixels \
+    relative to the center of the drawing surface, with the y-axis pointing up. \
+    `Plotter` translates the logical points of curves and vectors into real points \
+    before passing them to the backend.
+
+    New backends are defined by subclassing `DrawingBackend` and implementing \
+    `get_size()`, `draw_polyline()`, `draw_text()` and `clean()`. `draw_line()`, \
+    `draw_arrow()` and `draw_polylines()` are implemented with `draw_polyline()`, and \
+    can be overridden for efficiency.
+
+    Drawings are grouped in layers (e.g. the axes and the plotted curves). Backends \
+    that can remove, hide and restack the drawings of a single layer set \
+    `SUPPORTS_LAYERS` to True and implement `set_layer()`, `clean_layer()`, \
+    `hide_layer()`, `show_layer()` and `set_layer_order()`. Otherwise, `Plotter` \
+    never calls those methods (they do nothing by default): it updates a layer by \
+    cleaning the whole backend and replaying the drawings of the visible layers.
+
+    Interactive backends, whose drawings are shown while the program runs, set \
+    `SUPPORTS_TIMERS` to True and implement `ontimer()`, so animations are drawn frame \
+    by frame (see `Animation`). Otherwise, `Plotter` never calls `ontimer()` (which \
+    does nothing by default) and animations are drawn at once.
+    """
+
+    MIN_DRAWING_SPEED = 1
+    MAX_DRAWING_SPEED = 10
+
+    SUPPORTS_LAYERS = False
+    DEFAULT_LAYER = "default"
+
+    SUPPORTS_TIMERS = False
+
+    @_abstractmethod
+    def get_size(self) -> tuple[int, int]:
+        """Returns the width and height (in pixels) of the area in which curves, \
+        vectors and axes are drawn."""
+        pass
+
+    def bind_resize(self, callback: _Callable[[], None]) -> None:
+        """Registers a function that is called whenever the drawing surface is \
+        resized, i.e. whenever `get_size()` might return a different size. Backends \
+        whose surface cannot be resized do not need to override this method.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Function called on resize.
+        """
+        pass
+
+    def draw_line(
+        self,
+        start_point: _TRealPoint,
+        end_point: _TRealPoint,
+        line_width: int,
+        line_color: str,
+        drawing_speed: int,
+    ) -> None:
+        """Draws a line from start position to end position.
+
+        Parameters
+        ----------
+        start_point : tuple[int or float, int or float]
+            Real position at which the line starts.
+        end_point : tuple[int or float, int or float]
+            Real position at which the line ends.
+        line_width : int
+            Line width.
+        line_color : str
+            Line color.
+        drawing_speed : int
+            Drawing speed. Integer from 1 to 10.
+        """
+        self.draw_polyline(
+            _CurvePoints.from_points((start_point, end_point)),
+            line_width,
+            line_color,
+            drawing_speed,
+        )
+
+    @_abstractmethod
+    def draw_polyline(
+        self,
+        points: _CurvePoints,
+        polyline_width: int,
+        polyline_color: str,
+        drawing_speed: int,
+    ) -> None:
+        """Draws a polyline by joining the given points.
+
+        Parameters
+        ----------
+        points : CurvePoints
+            Real position of the polyline points. It has at least two points.
+        polyline_width : int
+            Polyline width.
+        polyline_color : str
+            Polyline color.
+        drawing_speed : int
+            Drawing speed. Integer from 1 to 10. Backends that cannot animate drawings \
+            ignore it.
+        """
+        pass
+
+    def draw_polylines(
+        self,
+        polylines: _Iterable[_CurvePoints],
+        polylines_width: int,
+        polylines_color: str,
+    ) -> None:
+        """Draws many polylines with the same style at `MAX_DRAWING_SPEED`.
+
+        Parameters
+        ----------
+        polylines : Iterable[CurvePoints]
+            Real position of the points of each polyline.
+        polylines_width : int
+            Polylines width.
+        polylines_color : str
+            Polylines color.
+        """
+        for points in polylines:
+            self.draw_polyline(
+                points, polylines_width, polylines_color, self.MAX_DRAWING_SPEED
+            )
+
+    def draw_arrow(
+        self,
+        point: _TRealPoint,
+        arrow_size: int,
+        arrow_angle: _TNumber,
+        arrow_width: int,
+        arrow_color: str,
+        drawing_speed: int,
+    ) -> None:
+        """Draws an arrow `>` at the given point.
+
+        Parameters
+        ----------
+        point : tuple[int or float, int or float]
+            Real position where the arrow will be drawn.
+        arrow_size : int
+            Size of the arrow.
+        arrow_angle : int or float
+            Angle in radians. Indicates arrow direction.
+        arrow_width : int
+            Width of the arrow.
+        arrow_color : str
+            Color of the arrow.
+        drawing_speed : int
+            Drawing speed. Integer from 1 to 10.
+        """
+        left_arrow_endpoint, right_arrow_endpoint = _arrow_endpoints(
+            point, arrow_size, arrow_angle
+        )
+        self.draw_polyline(
+            _CurvePoints.from_points(
+                (left_arrow_endpoint, point, right_arrow_endpoint)
+            ),
+            arrow_width,
+            arrow_color,
+            drawing_speed,
+        )
+
+    @_abstractmethod
+    def draw_text(
+        self,
+        text: str,
+        point: _TRealPoint,
+        text_font: tuple[str, str, str],
+        text_color: str,
+        align: str,
+    ) -> None:
+        """Display the given text at the specified point.
+
+        Parameters
+        ----------
+        text : str
+            Text to be displayed.
+        point : tuple[int or float, int or float]
+            Real position of the text baseline.
+        text_font : tuple[str, str, str]
+            A triple (fontname, fontsize, fonttype).
+        text_color : str
+            Text color.
+        align : str
+            Text alignment. Can either be "left", "center" or "right".
+        """
+        pass
+
+    @_abstractmethod
+    def clean(self) -> None:
+        """Removes all drawings."""
+        pass
+
+    def set_layer(self, layer: str) -> None:
+        """Sets the layer of the next drawings. Layers are stacked in the order in \
+        which they are first set, i.e. the drawings of the first layer are below the \
+        others. Until this method is called, drawings are made on `DEFAULT_LAYER`. \
+        Only needed if `SUPPORTS_LAYERS` is True.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        pass
+
+    def clean_layer(self, layer: str) -> None:
+        """Removes the drawings of the given layer. Only needed if `SUPPORTS_LAYERS` \
+        is True.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        pass
+
+    def hide_layer(self, layer: str) -> None:
+        """Hides the drawings of the given layer, including the ones made after this \
+        method is called, until `show_layer()` is called. Only needed if \
+        `SUPPORTS_LAYERS` is True.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        pass
+
+    def show_layer(self, layer: str) -> None:
+        """Shows the drawings of the given layer (see `hide_layer()`). Only needed if \
+        `SUPPORTS_LAYERS` is True.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        pass
+
+    def set_layer_order(self, layers: list[str]) -> None:
+        """Stacks the given layers from the bottom to the top, i.e. the drawings of \
+        `layers[0]` are below the others. Layers that are not given are stacked above \
+        them. Only needed if `SUPPORTS_LAYERS` is True.
+
+        Parameters
+        ----------
+        layers : list[str]
+            Layer names, from the bottom layer to the top one.
+        """
+        pass
+
+    def ontimer(self, callback: _Callable[[], None], delay: int) -> None:
+        """Calls the given function after the given delay, without blocking the \
+        caller. Only needed if `SUPPORTS_TIMERS` is True.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Function to be called.
+        delay : int
+            Delay (in milliseconds).
+        """
+        pass
+
+    def process_events(self) -> None:
+        """Processes the pending events of the drawing surface (e.g. window repaints, \
+        resizes and clicks), so it stays responsive while `Plotter` waits for curves \
+        to be evaluated (see `Plotter.aplot_curves()`). Backends without events do \
+        not need to override this method."""
+        pass
+
+    def flush(self) -> None:
+        """Shows every drawing made so far. Backends that show drawings as soon as \
+        they are made do not need to override this method."""
+        pass
+
+    def wait(self) -> None:
+        """Called by `Plotter.wait()` once every drawing has been made. Interactive \
+        backends wait until the user closes the drawing, other backends do nothing."""
+        pass
+
+
+def _arrow_endpoints(
+    point: _TRealPoint, arrow_size: int, arrow_angle: _TNumber
+) -> tuple[_TRealPoint, _TRealPoint]:
+    # Both sides of the arrow `>` form a 45° angle with the opposite of its direction
+    left_arrow_endpoint = (
+        point[0] + arrow_size * _cos(arrow_angle + _pi * 5 / 4),
+        point[1] + arrow_size * _sin(arrow_angle + _pi * 5 / 4),
+    )
+    right_arrow_endpoint = (
+        point[0] + arrow_size * _cos(arrow_angle - _pi * 5 / 4),
+        point[1] + arrow_size * _sin(arrow_angle - _pi * 5 / 4),
+    )
+    return left_arrow_endpoint, right_arrow_endpoint
+
+
+def _reorder(layers: dict[str, _Any], order: list[str]) -> dict[str, _Any]:
+    # Sorts the layers of a backend as `order`, stacking the other layers above them
+    reordered = {layer: layers[layer] for layer in order if layer in layers}
+    reordered.update(layers)
+    return reordered
@@ -0,0 +1,130 @@
+import threading as _threading
+
+from collections import OrderedDict as _OrderedDict
+
+from typing import Hashable as _Hashable
+
+from ._curve_points import CurvePoints as _CurvePoints
+
+
+class PointsCache:
+    """Least recently used (LRU) cache of curve points.
+
+    Points are stored under the key returned by `Curve.cache_key()`, which identifies \
+    the curve function and interval (start, end and samples). Curves whose key is None \
+    (the default, see `Function` and `ParametricFunction`) or is not hashable are never \
+    cached. When the cached points exceed `max_bytes`, the least recently \
+    used points are evicted.
+
+    The cache is thread-safe: curves can be evaluated concurrently by many threads \
+    (e.g. by `Plotter.aplot_curves()`), although a curve that is not cached yet might \
+    be evaluated by more than one of them.
+
+    `Plotter` uses the cache shared by all curves, `Curve.points_cache`, so plotting \
+    the same cached curve again (e.g. after `Plotter.clean()`) does not evaluate it \
+    again. Points are cached by function identity: if the function of a cached curve \
+    depends on mutable state, `invalidate()` must be called whenever that state \
+    changes, or stale points are plotted.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum size of the cached points in bytes. Each point takes 16 bytes. \
+        Defaults to 64 MiB.
+
+    Attributes
+    ----------
+    hits : int
+        Number of times the points of a curve were found in the cache.
+    misses : int
+        Number of times the points of a curve had to be computed.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.__entries = _OrderedDict()
+        self.__size = 0
+        # Guards the entries, but not the evaluation of curves, so many curves can be
+        # evaluated at once
+        self.__lock = _threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Size of the cached points in bytes."""
+        return self.__size
+
+    def get_points(self, curve: "Curve") -> _CurvePoints:
+        """Returns the points of the given curve, computing them with \
+        `Curve.points()` only if they are not cached.
+
+        Parameters
+        ----------
+        curve : Curve
+            Curve whose points are returned.
+
+        Returns
+        -------
+        CurvePoints
+            The curve points.
+        """
+        key = curve.cache_key()
+        if key is not None:
+            try:
+                hash(key)
+            except TypeError:
+                # E.g. a callable object that defines `__eq__` but not `__hash__`
+                key = None
+        if key is None:
+            return _CurvePoints.from_points(curve.points())
+
+        with self.__lock:
+            if key in self.__entries:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                return self.__entries[key]
+            self.misses += 1
+
+        points = _CurvePoints.from_points(curve.points())
+        with self.__lock:
+            self.__store(key, points)
+        return points
+
+    def __store(self, key: _Hashable, points: _CurvePoints) -> None:
+        size = 16 * len(points)
+        if size > self.max_bytes:
+            return
+        if key in self.__entries:
+            self.__size -= 16 * len(self.__entries[key])
+        self.__entries[key] = points
+        self.__size += size
+        while self.__size > self.max_bytes:
+            _, evicted = self.__entries.popitem(last=False)
+            self.__size -= 16 * len(evicted)
+
+    def invalidate(self, curve: "Curve" = None) -> None:
+        """Removes the points of the given curve from the cache. If `curve` is None, \
+        every cached point is removed.
+
+        Parameters
+        ----------
+        curve : Curve or None
+            Curve whose points are removed. Defaults to None.
+        """
+        with self.__lock:
+            if curve is None:
+                self.__entries.clear()
+                self.__size = 0
+                return
+
+            try:
+                points = self.__entries.pop(curve.cache_key(), None)
+            except TypeError:
+                # Curves with unhashable keys are never cached
+                return
+            if points is not None:
+                self.__size -= 16 * len(points)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
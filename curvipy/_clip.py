@@ -0,0 +1,276 @@
+from array import array as _array
+from math import isfinite as _isfinite
+
+from typing import Optional as _Optional
+from typing import Union as _Union
+
+from ._curve_points import CurvePoints as _CurvePoints
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+
+_TNumber = _Union[int, float]
+_TPoint = tuple[_TNumber, _TNumber]
+_TRectangle = tuple[_TNumber, _TNumber, _TNumber, _TNumber]
+
+
+def clip_segment(
+    start: _TPoint, end: _TPoint, rectangle: _TRectangle
+) -> _Optional[tuple[_TPoint, _TPoint]]:
+    """Clips a segment to a rectangle with the Liang–Barsky algorithm.
+
+    Parameters
+    ----------
+    start : tuple[int or float, int or float]
+        Point at which the segment starts.
+    end : tuple[int or float, int or float]
+        Point at which the segment ends.
+    rectangle : tuple[int or float, int or float, int or float, int or float]
+        Clipping rectangle `(x_min, y_min, x_max, y_max)`.
+
+    Returns
+    -------
+    tuple[tuple[float, float], tuple[float, float]] or None
+        Start and end of the visible part of the segment, or None if the segment is \
+        outside the rectangle.
+    """
+    t = _clip_parameters(start[0], start[1], end[0], end[1], rectangle)
+    if t is None:
+        return None
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    return (
+        (start[0] + t[0] * dx, start[1] + t[0] * dy),
+        (start[0] + t[1] * dx, start[1] + t[1] * dy),
+    )
+
+
+def clip_segments(
+    x0: "_np.ndarray",
+    y0: "_np.ndarray",
+    x1: "_np.ndarray",
+    y1: "_np.ndarray",
+    rectangle: _TRectangle,
+) -> tuple["_np.ndarray", "_np.ndarray", "_np.ndarray", "_np.ndarray"]:
+    """Clips many segments to a rectangle at once, with the Liang–Barsky algorithm. \
+    Requires NumPy.
+
+    Parameters
+    ----------
+    x0, y0 : numpy.ndarray
+        Points at which the segments start.
+    x1, y1 : numpy.ndarray
+        Points at which the segments end.
+    rectangle : tuple[int or float, int or float, int or float, int or float]
+        Clipping rectangle `(x_min, y_min, x_max, y_max)`.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        Starts and ends of the visible parts of the segments, as `(x0, y0, x1, y1)`, \
+        followed by a mask of the visible segments. Segments outside the rectangle \
+        (or with non-finite ends) are left out.
+    """
+    dx, dy = x1 - x0, y1 - y0
+    t0, t1, visible = _clip_parameters_numpy(x0, y0, dx, dy, rectangle)
+    x0, y0, dx, dy = x0[visible], y0[visible], dx[visible], dy[visible]
+    t0, t1 = t0[visible], t1[visible]
+    return x0 + t0 * dx, y0 + t0 * dy, x0 + t1 * dx, y0 + t1 * dy, visible
+
+
+def contains_point(point: _TPoint, rectangle: _TRectangle) -> bool:
+    """Returns True if the given point is inside the rectangle (or on its border).
+
+    Parameters
+    ----------
+    point : tuple[int or float, int or float]
+        Point to be checked.
+    rectangle : tuple[int or float, int or float, int or float, int or float]
+        Rectangle `(x_min, y_min, x_max, y_max)`.
+    """
+    x_min, y_min, x_max, y_max = rectangle
+    return x_min <= point[0] <= x_max and y_min <= point[1] <= y_max
+
+
+def clip_polyline(points: _CurvePoints, rectangle: _TRectangle) -> list[_CurvePoints]:
+    """Clips a polyline to a rectangle.
+
+    Every segment of the polyline is clipped with the Liang–Barsky algorithm \
+    (vectorized with NumPy when it is installed). Segments with non-finite points are \
+    dropped. Consecutive visible segments are joined into runs, so the result is the \
+    list of visible pieces of the polyline.
+
+    Parameters
+    ----------
+    points : CurvePoints
+        Polyline points.
+    rectangle : tuple[int or float, int or float, int or float, int or float]
+        Clipping rectangle `(x_min, y_min, x_max, y_max)`.
+
+    Returns
+    -------
+    list[CurvePoints]
+        Visible runs of the polyline.
+    """
+    if len(points) < 2:
+        return []
+    if _np is not None:
+        return _clip_polyline_numpy(points, rectangle)
+    return _clip_polyline_python(points, rectangle)
+
+
+def split_polyline(points: _CurvePoints) -> list[_CurvePoints]:
+    """Splits a polyline into runs of consecutive finite points, i.e. drops the points \
+    with infinite or NaN coordinates (e.g. the value of `1 / x` at 0), which cannot be \
+    drawn, and the segments they belong to.
+
+    Parameters
+    ----------
+    points : CurvePoints
+        Polyline points.
+
+    Returns
+    -------
+    list[CurvePoints]
+        Runs of finite points of the polyline. If every point is finite, the polyline \
+        itself is its only run.
+    """
+    if _np is not None:
+        x, y = _as_numpy(points.x), _as_numpy(points.y)
+        finite = _np.isfinite(x) & _np.isfinite(y)
+        if finite.all():
+            return [points]
+        # Runs start where a finite point follows a non-finite one, and end where a
+        # non-finite point follows a finite one
+        edges = _np.flatnonzero(_np.diff(_np.concatenate(([False], finite, [False]))))
+        return [
+            _CurvePoints(x[start:end], y[start:end])
+            for start, end in zip(edges[0::2].tolist(), edges[1::2].tolist())
+        ]
+
+    runs, run = [], None
+    for point in points:
+        if not (_isfinite(point[0]) and _isfinite(point[1])):
+            run = None
+            continue
+        if run is None:
+            run = _CurvePoints(_array("d"), _array("d"))
+            runs.append(run)
+        run.x.append(point[0])
+        run.y.append(point[1])
+    if len(runs) == 1 and len(runs[0]) == len(points):
+        return [points]
+    return runs
+
+
+def _clip_parameters(
+    x0: float, y0: float, x1: float, y1: float, rectangle: _TRectangle
+) -> _Optional[tuple[float, float]]:
+    if not all(map(_isfinite, (x0, y0, x1, y1))):
+        return None
+    x_min, y_min, x_max, y_max = rectangle
+    dx, dy = x1 - x0, y1 - y0
+    t0, t1 = 0.0, 1.0
+    for p, q in (
+        (-dx, x0 - x_min),
+        (dx, x_max - x0),
+        (-dy, y0 - y_min),
+        (dy, y_max - y0),
+    ):
+        if p == 0:
+            if q < 0:
+                return None
+        elif p < 0:
+            t0 = max(t0, q / p)
+        else:
+            t1 = min(t1, q / p)
+    return (t0, t1) if t0 <= t1 else None
+
+
+def _clip_parameters_numpy(
+    x0: "_np.ndarray",
+    y0: "_np.ndarray",
+    dx: "_np.ndarray",
+    dy: "_np.ndarray",
+    rectangle: _TRectangle,
+) -> tuple["_np.ndarray", "_np.ndarray", "_np.ndarray"]:
+    x_min, y_min, x_max, y_max = rectangle
+    t0 = _np.zeros(len(dx))
+    t1 = _np.ones(len(dx))
+    visible = _np.isfinite(dx) & _np.isfinite(dy)
+    with _np.errstate(all="ignore"):
+        for p, q in (
+            (-dx, x0 - x_min),
+            (dx, x_max - x0),
+            (-dy, y0 - y_min),
+            (dy, y_max - y0),
+        ):
+            r = q / p
+            visible &= (p != 0) | (q >= 0)
+            t0 = _np.where(p < 0, _np.maximum(t0, r), t0)
+            t1 = _np.where(p > 0, _np.minimum(t1, r), t1)
+    visible &= t0 <= t1
+    return t0, t1, visible
+
+
+def _clip_polyline_numpy(
+    points: _CurvePoints, rectangle: _TRectangle
+) -> list[_CurvePoints]:
+    x, y = _as_numpy(points.x), _as_numpy(points.y)
+    x0, y0 = x[:-1], y[:-1]
+    dx, dy = _np.diff(x), _np.diff(y)
+    t0, t1, visible = _clip_parameters_numpy(x0, y0, dx, dy, rectangle)
+
+    # Segment i continues into segment i + 1 if both are visible and the clipped
+    # segment i ends (and segment i + 1 starts) on their shared point.
+    continues = visible[:-1] & visible[1:] & (t1[:-1] == 1) & (t0[1:] == 0)
+    visible_segments = _np.flatnonzero(visible)
+    starts = visible_segments[~_np.concatenate(([False], continues))[visible_segments]]
+    ends = visible_segments[~_np.concatenate((continues, [False]))[visible_segments]]
+
+    runs = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        runs.append(
+            _CurvePoints(
+                _np.concatenate(
+                    (
+                        [x0[start] + t0[start] * dx[start]],
+                        x[start + 1 : end + 1],
+                        [x0[end] + t1[end] * dx[end]],
+                    )
+                ),
+                _np.concatenate(
+                    (
+                        [y0[start] + t0[start] * dy[start]],
+                        y[start + 1 : end + 1],
+                        [y0[end] + t1[end] * dy[end]],
+                    )
+                ),
+            )
+        )
+    return runs
+
+
+def _clip_polyline_python(
+    points: _CurvePoints, rectangle: _TRectangle
+) -> list[_CurvePoints]:
+    x, y = points.x, points.y
+    runs = []
+    run = None
+    for i in range(len(x) - 1):
+        t = _clip_parameters(x[i], y[i], x[i + 1], y[i + 1], rectangle)
+        if t is None:
+            run = None
+            continue
+        dx, dy = x[i + 1] - x[i], y[i + 1] - y[i]
+        if run is None or t[0] != 0:
+            run = _CurvePoints(
+                _array("d", [x[i] + t[0] * dx]), _array("d", [y[i] + t[0] * dy])
+            )
+            runs.append(run)
+        if t[1] == 1:
+            run.x.append(x[i + 1])
+            run.y.append(y[i + 1])
+        else:
+            run.x.append(x[i] + t[1] * dx)
+            run.y.append(y[i] + t[1] * dy)
+            run = None
+    return runs
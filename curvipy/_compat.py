@@ -0,0 +1,19 @@
+from typing import Sequence as _Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional dependency
+    np = None
+
+
+def as_numpy(column: _Sequence[float]) -> "np.ndarray":
+    """Returns a NumPy view of the given column of floats. `array.array` columns \
+    are exposed through the buffer protocol, so no copy is made."""
+    if isinstance(column, np.ndarray):
+        return column
+    return np.frombuffer(column, dtype=np.float64)
+
+
+def is_numpy(column: _Sequence[float]) -> bool:
+    """Returns True if NumPy is installed and the given column is a NumPy array."""
+    return np is not None and isinstance(column, np.ndarray)
@@ -1,31 +1,117 @@
 from abc import ABC as _ABC
 from abc import abstractmethod as _abstractmethod
+from array import array as _array
+from math import ceil as _ceil
+from math import hypot as _hypot
+from math import isfinite as _isfinite
+from math import sqrt as _sqrt
 
 from typing import Callable as _Callable
+from typing import Hashable as _Hashable
+from typing import Iterator as _Iterator
+from typing import Optional as _Optional
+from typing import Sequence as _Sequence
 from typing import Union as _Union
 
 from ._interval import Interval as _Interval
+from ._cache import PointsCache as _PointsCache
+from ._curve_points import CurvePoints as _CurvePoints
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+from ._evaluation import evaluate_function as _evaluate_function
+from ._evaluation import evaluate_parametric_function as _evaluate_parametric_function
+from ._sampling import AdaptiveSampling as _AdaptiveSampling
+from ._parallel import ParallelEvaluation as _ParallelEvaluation
 
 _TNumber = _Union[int, float]
 _TVector = tuple[_TNumber, _TNumber]
+_TColumns = tuple[_Sequence[float], _Sequence[float]]
+_TMatrix = tuple[tuple[_TNumber, _TNumber], tuple[_TNumber, _TNumber]]
+_TAffineMatrix = tuple[
+    tuple[_TNumber, _TNumber, _TNumber],
+    tuple[_TNumber, _TNumber, _TNumber],
+    tuple[_TNumber, _TNumber, _TNumber],
+]
 
 
 class Curve(_ABC):
-    """Base class for all two-dimensional curves."""
+    """Base class for all two-dimensional curves.
+
+    Attributes
+    ----------
+    points_cache : PointsCache
+        Cache, shared by all curves, where `Plotter` stores the points of the curves \
+        it plots whose key is not None (see `Curve.cache_key()`), e.g. the ones \
+        created with `cache=True`.
+    """
+
+    points_cache = _PointsCache()
 
     @_abstractmethod
-    def points(self) -> list[_TNumber]:
+    def points(self) -> _CurvePoints:
         """Returns a sorted list of curve point. The position of the points \
         indicates the order in which they will be plotted. 
 
         Returns
         -------
-        list[int or float]
-            A list of curve points. The position of the points indicates the \
-            order in which they will be plotted.
+        CurvePoints or list[tuple[int or float, int or float]]
+            The curve points. The position of the points indicates the order in \
+            which they will be plotted. Curves provided by Curvipy return a \
+            `CurvePoints`, but any sequence of `(x, y)` points is accepted.
         """
         pass
 
+    def iter_points(self, chunk_size: int) -> _Iterator[_CurvePoints]:
+        """Yields the curve points in consecutive chunks of at most `chunk_size` \
+        points. Concatenating the chunks gives the points returned by `points()`.
+
+        By default, the points are computed with `points()` and then split. Curves \
+        provided by Curvipy compute each chunk only when it is requested, so the \
+        memory used does not depend on the number of samples.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of points per chunk.
+
+        Yields
+        ------
+        CurvePoints
+            A chunk of curve points.
+        """
+        points = _CurvePoints.from_points(self.points())
+        for i in range(0, len(points), chunk_size):
+            yield points[i : i + chunk_size]
+
+    def cache_key(self) -> _Optional[_Hashable]:
+        """Returns a hashable key that identifies the curve points in \
+        `Curve.points_cache`, or None if the points must not be cached. Two curves \
+        with equal keys must have the same points. By default, None is returned.
+
+        Returns
+        -------
+        Hashable or None
+            Key of the curve points.
+        """
+        return None
+
+    def for_resolution(self, pixel_size: tuple[float, float]) -> "Curve":
+        """Returns a curve whose "auto" intervals (see `Interval`) have as many \
+        samples as screen pixels they span. `Plotter` calls this method before \
+        plotting a curve. By default, the curve is returned as it is.
+
+        Parameters
+        ----------
+        pixel_size : tuple[float, float]
+            Logical width and height of a screen pixel.
+
+        Returns
+        -------
+        Curve
+            Curve ready to be plotted at the given resolution.
+        """
+        return self
+
 
 class Function(Curve):
     """Function that given a real number returns another real number `y = f(x)`.
@@ -36,21 +122,151 @@ class Function(Curve):
         Function that given an integer or float returns another integer or float.
     interval : Interval
             The interval from which the curve will be plotted.
+    vectorize : bool or None
+        If True, `function` is called once with a NumPy array containing every interval \
+        value (e.g. `numpy.sin`). If False, `function` is called once per interval value. \
+        If None, vectorized evaluation is used whenever NumPy is installed and `function` \
+        supports arrays, falling back to the scalar loop otherwise. Defaults to None.
+    sampling : AdaptiveSampling or None
+        If given, the interval values are used as a coarse grid that is refined where \
+        the function bends (see `AdaptiveSampling`). If None, the function is evaluated \
+        on the interval values only. Defaults to None.
+    parallel : ParallelEvaluation or None
+        If given, the function is evaluated by a pool of workers (see \
+        `ParallelEvaluation`) and `vectorize` is ignored. Useful for expensive functions \
+        that cannot be vectorized. Defaults to None.
+    cache : bool
+        If True, the function points are stored in `Curve.points_cache`, so plotting \
+        the function again does not evaluate it again. Points are cached by function \
+        identity, so if `function` depends on mutable state, the cached points must be \
+        removed (see `PointsCache.invalidate()`) whenever that state changes. \
+        Defaults to False.
     """
 
-    def __init__(self, function: _Callable[[_TNumber], _TNumber], interval: _Interval):
+    MAX_AUTO_SAMPLES = 100_000
+
+    def __init__(
+        self,
+        function: _Callable[[_TNumber], _TNumber],
+        interval: _Interval,
+        vectorize: bool = None,
+        sampling: _AdaptiveSampling = None,
+        parallel: _ParallelEvaluation = None,
+        cache: bool = False,
+    ):
         self.function = function
         self.interval = interval
+        self.vectorize = vectorize
+        self.sampling = sampling
+        self.parallel = parallel
+        self.cache = cache
+
+    def evaluate(self) -> _TColumns:
+        """Evaluates the function on each value in the given interval.
+
+        Returns
+        -------
+        tuple[array or numpy.ndarray, array or numpy.ndarray]
+            The x-coordinates and the y-coordinates of the function points, as two \
+            columns of floats.
+        """
+        if self.sampling is not None:
+            return self.sampling.sample(
+                self.function, self.interval.as_array(), self.vectorize, self.parallel
+            )
+        return _evaluate_function(
+            self.function, self.interval.as_array(), self.vectorize, self.parallel
+        )
+
+    def cache_key(self) -> _Optional[tuple]:
+        """Returns a key built from the function identity, the interval and the \
+        evaluation options, or None if `cache` is False.
+
+        Returns
+        -------
+        tuple or None
+            Key of the function points.
+        """
+        if not self.cache:
+            return None
+        sampling = self.sampling
+        if sampling is not None:
+            sampling = (
+                sampling.tolerance,
+                sampling.max_depth,
+                sampling.max_samples,
+                sampling.pixel_size,
+            )
+        return (Function, self.function, self.interval, self.vectorize, sampling)
+
+    def for_resolution(self, pixel_size: tuple[float, float]) -> "Function":
+        """Returns a copy of the function whose "auto" interval has one sample \
+        per screen pixel column, and whose `sampling` tolerance is measured in pixels \
+        of the given size (see `AdaptiveSampling.for_resolution()`).
+
+        The number of samples is limited to `Function.MAX_AUTO_SAMPLES`, so intervals \
+        much wider than the screen do not exhaust the memory.
+
+        Parameters
+        ----------
+        pixel_size : tuple[float, float]
+            Logical width and height of a screen pixel.
+        """
+        interval = self.interval
+        if interval.auto:
+            columns = abs(interval.end - interval.start) / pixel_size[0]
+            samples = _ceil(min(columns, __class__.MAX_AUTO_SAMPLES))
+            interval = interval.with_samples(max(samples, 2))
+        sampling = self.sampling
+        if sampling is not None:
+            sampling = sampling.for_resolution(pixel_size)
+        if interval is self.interval and sampling is self.sampling:
+            return self
+        return Function(
+            self.function,
+            interval,
+            self.vectorize,
+            sampling,
+            self.parallel,
+            self.cache,
+        )
+
+    def iter_points(self, chunk_size: int) -> _Iterator[_CurvePoints]:
+        """Yields the function points in chunks of at most `chunk_size` points, \
+        evaluating the function on each chunk of the interval only when it is \
+        requested. When `sampling` is given, the whole function is evaluated first.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of points per chunk.
+
+        Yields
+        ------
+        CurvePoints
+            A chunk of function points.
+        """
+        if self.sampling is not None:
+            yield from super().iter_points(chunk_size)
+            return
+
+        for i in range(0, len(self.interval), chunk_size):
+            values = self.interval[i : i + chunk_size].as_array()
+            yield _CurvePoints(
+                *_evaluate_function(
+                    self.function, values, self.vectorize, self.parallel
+                )
+            )
 
-    def points(self) -> list[_TNumber]:
+    def points(self) -> _CurvePoints:
         """Returns the function point for each value in the given interval.
 
         Returns
         -------
-        list[int or float]
-            A list of function points.
+        CurvePoints
+            The function points.
         """
-        return [(x, self.function(x)) for x in self.interval]
+        return _CurvePoints(*self.evaluate())
 
 
 class ParametricFunction(Curve):
@@ -63,35 +279,163 @@ class ParametricFunction(Curve):
                 integers or floats.
     interval : Interval
             The interval from which the parametric function will be plotted.
+    vectorize : bool or None
+        If True, `parametric_function` is called once with a NumPy array containing every \
+        interval value and must return a pair of arrays `(x(t), y(t))`. If False, it is \
+        called once per interval value. If None, vectorized evaluation is used whenever \
+        NumPy is installed and `parametric_function` supports arrays, falling back to the \
+        scalar loop otherwise. Defaults to None.
+    parallel : ParallelEvaluation or None
+        If given, the parametric function is evaluated by a pool of workers (see \
+        `ParallelEvaluation`) and `vectorize` is ignored. Useful for expensive functions \
+        that cannot be vectorized. Defaults to None.
+    cache : bool
+        If True, the parametric function points are stored in `Curve.points_cache` \
+        (see `Function`). Defaults to False.
     """
 
+    RESOLUTION_PROBE_SAMPLES = 64
+    MAX_AUTO_SAMPLES = 100_000
+
     def __init__(
-        self, parametric_function: _Callable[[_TNumber], _TVector], interval: _Interval
+        self,
+        parametric_function: _Callable[[_TNumber], _TVector],
+        interval: _Interval,
+        vectorize: bool = None,
+        parallel: _ParallelEvaluation = None,
+        cache: bool = False,
     ):
         self.parametric_function = parametric_function
         self.interval = interval
+        self.vectorize = vectorize
+        self.parallel = parallel
+        self.cache = cache
+
+    def evaluate(self) -> _TColumns:
+        """Evaluates the parametric function on each value in the given interval.
+
+        Returns
+        -------
+        tuple[array or numpy.ndarray, array or numpy.ndarray]
+            The x-coordinates and the y-coordinates of the parametric function points, \
+            as two columns of floats.
+        """
+        return _evaluate_parametric_function(
+            self.parametric_function,
+            self.interval.as_array(),
+            self.vectorize,
+            self.parallel,
+        )
+
+    def cache_key(self) -> _Optional[tuple]:
+        """Returns a key built from the parametric function identity, the interval \
+        and the evaluation options, or None if `cache` is False.
+
+        Returns
+        -------
+        tuple or None
+            Key of the parametric function points.
+        """
+        if not self.cache:
+            return None
+        return (
+            ParametricFunction,
+            self.parametric_function,
+            self.interval,
+            self.vectorize,
+        )
 
-    def points(self) -> list[_TNumber]:
+    def for_resolution(self, pixel_size: tuple[float, float]) -> "ParametricFunction":
+        """Returns a copy of the parametric function whose "auto" interval has one \
+        sample per screen pixel of curve length.
+
+        The curve length is estimated by evaluating the parametric function on \
+        `ParametricFunction.RESOLUTION_PROBE_SAMPLES` values of the interval, and \
+        the number of samples is limited to `ParametricFunction.MAX_AUTO_SAMPLES`.
+
+        Parameters
+        ----------
+        pixel_size : tuple[float, float]
+            Logical width and height of a screen pixel.
+        """
+        if not self.interval.auto:
+            return self
+        probe = self.interval.with_samples(__class__.RESOLUTION_PROBE_SAMPLES)
+        xs, ys = _evaluate_parametric_function(
+            self.parametric_function, probe.as_array(), self.vectorize, self.parallel
+        )
+        # Segments with a non-finite end (e.g. at a pole) are left out of the length
+        lengths = (
+            _hypot((x1 - x0) / pixel_size[0], (y1 - y0) / pixel_size[1])
+            for x0, x1, y0, y1 in zip(xs, xs[1:], ys, ys[1:])
+        )
+        length = sum(length for length in lengths if _isfinite(length))
+        samples = _ceil(min(length, __class__.MAX_AUTO_SAMPLES))
+        return ParametricFunction(
+            self.parametric_function,
+            self.interval.with_samples(max(samples, 2)),
+            self.vectorize,
+            self.parallel,
+            self.cache,
+        )
+
+    def iter_points(self, chunk_size: int) -> _Iterator[_CurvePoints]:
+        """Yields the parametric function points in chunks of at most `chunk_size` \
+        points, evaluating the parametric function on each chunk of the interval only \
+        when it is requested.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of points per chunk.
+
+        Yields
+        ------
+        CurvePoints
+            A chunk of parametric function points.
+        """
+        for i in range(0, len(self.interval), chunk_size):
+            values = self.interval[i : i + chunk_size].as_array()
+            yield _CurvePoints(
+                *_evaluate_parametric_function(
+                    self.parametric_function, values, self.vectorize, self.parallel
+                )
+            )
+
+    def points(self) -> _CurvePoints:
         """Returns the parametric function point for each value in the given interval.
 
         Returns
         -------
-        list[int or float]
-            A list of parametric function points.
+        CurvePoints
+            The parametric function points.
         """
-        return [self.parametric_function(t) for t in self.interval]
+        return _CurvePoints(*self.evaluate())
 
 
 class TransformedCurve(Curve):
-    """Applies a linear transformation (defined as a 2x2 matrix) to the given curve.
+    """Applies a linear transformation (defined as a 2x2 matrix) or an affine \
+    transformation (defined as a 3x3 matrix in homogeneous coordinates) to the given \
+    curve.
+
+    Transforming a `TransformedCurve` does not nest transformations: both matrices are \
+    multiplied into a single one when the curve is created, so the points of the \
+    original curve are transformed only once, no matter how many transformations are \
+    chained.
 
     Parameters
     ----------
     matrix : tuple[\
             tuple[int or float, int or float],\
             tuple[int or float, int or float]\
+            ] or tuple[\
+            tuple[int or float, int or float, int or float],\
+            tuple[int or float, int or float, int or float],\
+            tuple[int or float, int or float, int or float]\
             ]
-        Linear transformation represented as a 2x2 matrix.
+        Linear transformation represented as a 2x2 matrix, or affine transformation \
+        represented as a 3x3 matrix whose last row is `(0, 0, 1)`. E.g. the matrix \
+        `((1, 0, tx), (0, 1, ty), (0, 0, 1))` translates the curve by `(tx, ty)`.
         
     curve : Curve
         Curve to be transformed.
@@ -99,29 +443,107 @@ class TransformedCurve(Curve):
 
     def __init__(
         self,
-        matrix: tuple[
-            tuple[_TNumber, _TNumber],
-            tuple[_TNumber, _TNumber],
-        ],
+        matrix: _Union[_TMatrix, _TAffineMatrix],
         curve: Curve,
     ):
+        matrix = _as_affine_matrix(matrix)
+        if isinstance(curve, TransformedCurve):
+            matrix = _multiply_matrices(matrix, curve.matrix)
+            curve = curve.__curve
         self.__curve = curve
         self.__matrix = matrix
 
-    def points(self) -> list[_TNumber]:
-        """Applies a linear transformation to each point of the curve.
+    @property
+    def matrix(self) -> _TAffineMatrix:
+        """Affine transformation applied to the curve, as a 3x3 matrix in homogeneous \
+        coordinates."""
+        return self.__matrix
+
+    def cache_key(self) -> _Optional[tuple]:
+        """Returns a key built from the transformation matrix and the key of the \
+        transformed curve, or None if the transformed curve cannot be cached.
 
         Returns
         -------
-        list[int or float]
-            A list of transformed curve points.
-        """
-        points = []
-        for point in self.__curve.points():
-            points.append(
-                [
-                    point[0] * self.__matrix[0][0] + point[1] * self.__matrix[0][1],
-                    point[0] * self.__matrix[1][0] + point[1] * self.__matrix[1][1],
-                ]
-            )
-        return points
+        tuple or None
+            Key of the transformed curve points.
+        """
+        curve_key = self.__curve.cache_key()
+        if curve_key is None:
+            return None
+        return (TransformedCurve, self.__matrix, curve_key)
+
+    def for_resolution(self, pixel_size: tuple[float, float]) -> "TransformedCurve":
+        """Returns a copy of the transformed curve whose inner curve is ready to be \
+        plotted at the given resolution.
+
+        The pixel size is divided by the Frobenius norm of the linear part of the \
+        transformation matrix, which bounds how much the transformation can stretch \
+        the inner curve.
+
+        Parameters
+        ----------
+        pixel_size : tuple[float, float]
+            Logical width and height of a screen pixel.
+        """
+        stretch = _sqrt(sum(m**2 for row in self.__matrix[:2] for m in row[:2]))
+        size = min(pixel_size) / stretch if stretch else min(pixel_size)
+        curve = self.__curve.for_resolution((size, size))
+        if curve is self.__curve:
+            return self
+        return TransformedCurve(self.__matrix, curve)
+
+    def iter_points(self, chunk_size: int) -> _Iterator[_CurvePoints]:
+        """Yields the transformed curve points in chunks of at most `chunk_size` \
+        points, transforming each chunk of the curve as it is yielded.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of points per chunk.
+
+        Yields
+        ------
+        CurvePoints
+            A chunk of transformed curve points.
+        """
+        for points in self.__curve.iter_points(chunk_size):
+            yield self.__transform(_CurvePoints.from_points(points))
+
+    def points(self) -> _CurvePoints:
+        """Applies the transformation to each point of the curve.
+
+        Returns
+        -------
+        CurvePoints
+            The transformed curve points.
+        """
+        return self.__transform(_CurvePoints.from_points(self.__curve.points()))
+
+    def __transform(self, points: _CurvePoints) -> _CurvePoints:
+        (a, b, tx), (c, d, ty), _ = self.__matrix
+
+        if _np is not None:
+            x, y = _as_numpy(points.x), _as_numpy(points.y)
+            return _CurvePoints(a * x + b * y + tx, c * x + d * y + ty)
+
+        return _CurvePoints(
+            _array("d", [a * x + b * y + tx for x, y in points]),
+            _array("d", [c * x + d * y + ty for x, y in points]),
+        )
+
+
+def _as_affine_matrix(matrix: _Union[_TMatrix, _TAffineMatrix]) -> _TAffineMatrix:
+    if len(matrix) == 2:
+        (a, b), (c, d) = matrix
+        return ((a, b, 0), (c, d, 0), (0, 0, 1))
+    if len(matrix) == 3 and tuple(matrix[2]) == (0, 0, 1):
+        return tuple(tuple(row) for row in matrix)
+    raise ValueError("matrix must be a 2x2 matrix or a 3x3 affine matrix")
+
+
+def _multiply_matrices(m: _TAffineMatrix, n: _TAffineMatrix) -> _TAffineMatrix:
+    return tuple(
+        tuple(sum(m[i][k] * n[k][j] for k in range(3)) for j in range(3))
+        for i in range(3)
+    )
@@ -0,0 +1,69 @@
+from array import array as _array
+
+from typing import Iterable as _Iterable
+from typing import Iterator as _Iterator
+from typing import Sequence as _Sequence
+from typing import Union as _Union
+
+from ._compat import is_numpy as _is_numpy
+
+_TNumber = _Union[int, float]
+_TPoint = tuple[_TNumber, _TNumber]
+
+
+class CurvePoints:
+    """Sequence of two-dimensional points stored as two contiguous columns of floats.
+
+    `CurvePoints` behaves like a list of `(x, y)` tuples (it supports `len()`, iteration, \
+    indexing and slicing) but it stores its coordinates in two buffers, either \
+    `array.array("d")` or NumPy arrays, which takes 16 bytes per point.
+
+    Parameters
+    ----------
+    x : Sequence[float]
+        X-coordinates of the points. `array.array("d")` and NumPy arrays are kept \
+        as they are (no copy is made), any other sequence is copied into an \
+        `array.array("d")`.
+    y : Sequence[float]
+        Y-coordinates of the points. Must have the same length as `x`.
+    """
+
+    def __init__(self, x: _Sequence[float] = (), y: _Sequence[float] = ()):
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        self.x = x if _is_numpy(x) or isinstance(x, _array) else _array("d", x)
+        self.y = y if _is_numpy(y) or isinstance(y, _array) else _array("d", y)
+
+    @classmethod
+    def from_points(cls, points: _Iterable[_TPoint]) -> "CurvePoints":
+        """Builds a `CurvePoints` from an iterable of `(x, y)` points. If `points` \
+        already is a `CurvePoints`, it is returned as it is.
+
+        Parameters
+        ----------
+        points : Iterable[tuple[int or float, int or float]]
+            Points to be stored.
+        """
+        if isinstance(points, CurvePoints):
+            return points
+        x, y = _array("d"), _array("d")
+        for point in points:
+            x.append(point[0])
+            y.append(point[1])
+        return cls(x, y)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __iter__(self) -> _Iterator[_TPoint]:
+        return zip(self.x, self.y)
+
+    def __getitem__(self, i: _Union[int, slice]) -> _Union[_TPoint, "CurvePoints"]:
+        """Returns the point at index `i`. If `i` is a slice, a `CurvePoints` \
+        containing the sliced points is returned."""
+        if isinstance(i, slice):
+            return CurvePoints(self.x[i], self.y[i])
+        return self.x[i], self.y[i]
+
+    def __repr__(self) -> str:
+        return f"CurvePoints({list(self)!r})"
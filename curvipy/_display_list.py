@@ -0,0 +1,255 @@
+import json as _json
+import struct as _struct
+import sys as _sys
+
+from array import array as _array
+
+from typing import Any as _Any
+from typing import Iterable as _Iterable
+from typing import Iterator as _Iterator
+from typing import Union as _Union
+
+from ._curve_points import CurvePoints as _CurvePoints
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+
+_TNumber = _Union[int, float]
+_TPoint = tuple[_TNumber, _TNumber]
+_TCommand = tuple[int, _CurvePoints, tuple]
+
+
+class DisplayList:
+    """Compact record of drawing operations, i.e. of the lines, polylines, arrows and \
+    texts drawn by `Plotter`, in logical coordinates.
+
+    Each command is stored as an opcode, its logical points (packed with the points of \
+    every other command in a single buffer of floats) and its arguments (width, color, \
+    text...). Since points are logical, a display list can be replayed at any screen \
+    size and on any drawing backend (see `Plotter.replay()`), without evaluating curves \
+    again.
+
+    Iterating over a display list yields `(opcode, points, arguments)` tuples, where \
+    `points` is a `CurvePoints` and `arguments` depends on the opcode:
+
+    - `LINE` and `POLYLINE`: `(width, color, drawing_speed)`.
+    - `ARROW`: `(arrow_size, arrow_angle, width, color, drawing_speed)`, with a single \
+      point (the arrow position). The arrow size is in pixels and its angle is the one \
+      on screen.
+    - `TEXT`: `(text, text_font, text_color, align)`, with a single point.
+    """
+
+    LINE = 0
+    POLYLINE = 1
+    ARROW = 2
+    TEXT = 3
+
+    # Serialization format identifier and version
+    MAGIC = b"CVDL"
+    VERSION = 1
+
+    def __init__(self):
+        self.__opcodes = _array("B")
+        # Command `i` points are coordinates `offsets[i]` to `offsets[i + 1]`
+        self.__offsets = _array("Q", [0])
+        # x and y coordinates of every point, interleaved
+        self.__coordinates = _array("d")
+        self.__arguments = []
+
+    def record(self, opcode: int, points: _Iterable[_TPoint], *arguments: _Any) -> None:
+        """Appends a command to the display list.
+
+        Parameters
+        ----------
+        opcode : int
+            Either `LINE`, `POLYLINE`, `ARROW` or `TEXT`.
+        points : CurvePoints or Iterable[tuple[int or float, int or float]]
+            Logical points of the command.
+        *arguments : Any
+            Arguments of the command (see `DisplayList`).
+        """
+        points = _CurvePoints.from_points(points)
+        if _np is not None:
+            coordinates = _np.empty(2 * len(points))
+            coordinates[0::2] = _as_numpy(points.x)
+            coordinates[1::2] = _as_numpy(points.y)
+            self.__coordinates.frombytes(coordinates.tobytes())
+        else:
+            self.__coordinates.extend(c for point in points for c in point)
+
+        self.__opcodes.append(opcode)
+        self.__offsets.append(len(self.__coordinates))
+        self.__arguments.append(arguments)
+
+    def record_many(
+        self,
+        opcode: int,
+        x: "_np.ndarray",
+        y: "_np.ndarray",
+        arguments: _Iterable[tuple],
+    ) -> None:
+        """Appends many commands with the same opcode and number of points at once. \
+        Requires NumPy.
+
+        Parameters
+        ----------
+        opcode : int
+            Either `LINE`, `POLYLINE`, `ARROW` or `TEXT`.
+        x : numpy.ndarray
+            Logical x-coordinates of the points of each command, one row per command.
+        y : numpy.ndarray
+            Logical y-coordinates of the points of each command, one row per command.
+        arguments : Iterable[tuple]
+            Arguments of each command (see `DisplayList`).
+        """
+        commands, points = x.shape
+        coordinates = _np.empty((commands, points, 2))
+        coordinates[..., 0] = x
+        coordinates[..., 1] = y
+        offsets = self.__offsets[-1] + 2 * points * _np.arange(
+            1, commands + 1, dtype=_np.uint64
+        )
+        self.__coordinates.frombytes(coordinates.tobytes())
+        self.__opcodes.extend([opcode] * commands)
+        self.__offsets.frombytes(offsets.tobytes())
+        self.__arguments.extend(arguments)
+
+    def extend(self, display_list: "DisplayList") -> None:
+        """Appends every command of the given display list.
+
+        Parameters
+        ----------
+        display_list : DisplayList
+            Display list whose commands are appended.
+        """
+        for command in display_list:
+            self.record(command[0], command[1], *command[2])
+
+    def clear(self) -> None:
+        """Removes every command."""
+        self.__init__()
+
+    def diff(self, display_list: "DisplayList") -> int:
+        """Returns the index of the first command that differs between this display \
+        list and the given one. If one of them starts with the other, the length of the \
+        shortest one is returned.
+
+        This is useful for redrawing only what changed: if a display list `new` has \
+        been drawn on top of what `old` drew, only `new[old.diff(new):]` must be drawn \
+        (provided that `old.diff(new) == len(old)`).
+
+        Parameters
+        ----------
+        display_list : DisplayList
+            Display list to compare with.
+        """
+        for i, (command, other_command) in enumerate(zip(self, display_list)):
+            if not _commands_equal(command, other_command):
+                return i
+        return min(len(self), len(display_list))
+
+    def to_bytes(self) -> bytes:
+        """Serializes the display list (see `from_bytes()`)."""
+        arguments = _json.dumps(self.__arguments).encode("utf-8")
+        sections = [
+            self.__opcodes.tobytes(),
+            _little_endian(self.__offsets).tobytes(),
+            _little_endian(self.__coordinates).tobytes(),
+            arguments,
+        ]
+        header = __class__.MAGIC + _struct.pack("<B", __class__.VERSION)
+        return header + b"".join(
+            _struct.pack("<Q", len(section)) + section for section in sections
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DisplayList":
+        """Deserializes a display list serialized by `to_bytes()`.
+
+        Parameters
+        ----------
+        data : bytes
+            Serialized display list.
+        """
+        header_size = len(cls.MAGIC) + 1
+        if data[: len(cls.MAGIC)] != cls.MAGIC or data[header_size - 1] != cls.VERSION:
+            raise ValueError("data is not a serialized display list")
+
+        sections, position = [], header_size
+        for _ in range(4):
+            (size,) = _struct.unpack_from("<Q", data, position)
+            position += 8
+            sections.append(data[position : position + size])
+            position += size
+
+        display_list = cls()
+        display_list.__opcodes = _array("B", sections[0])
+        display_list.__offsets = _array("Q")
+        display_list.__offsets.frombytes(sections[1])
+        display_list.__coordinates = _array("d")
+        display_list.__coordinates.frombytes(sections[2])
+        if _sys.byteorder == "big":
+            display_list.__offsets.byteswap()
+            display_list.__coordinates.byteswap()
+        display_list.__arguments = [
+            _as_tuple(arguments) for arguments in _json.loads(sections[3])
+        ]
+        return display_list
+
+    def __len__(self) -> int:
+        return len(self.__opcodes)
+
+    def __getitem__(self, i: _Union[int, slice]) -> _Union[_TCommand, "DisplayList"]:
+        """Returns the command at index `i` as an `(opcode, points, arguments)` tuple. \
+        If `i` is a slice, returns a new display list with the sliced commands."""
+        if isinstance(i, slice):
+            display_list = __class__()
+            for j in range(*i.indices(len(self))):
+                command = self[j]
+                display_list.record(command[0], command[1], *command[2])
+            return display_list
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("display list index out of range")
+        start, end = self.__offsets[i], self.__offsets[i + 1]
+        points = _CurvePoints(
+            self.__coordinates[start:end:2], self.__coordinates[start + 1 : end : 2]
+        )
+        return self.__opcodes[i], points, self.__arguments[i]
+
+    def __iter__(self) -> _Iterator[_TCommand]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, display_list: "DisplayList") -> bool:
+        return len(self) == len(display_list) == self.diff(display_list)
+
+    def __repr__(self) -> str:
+        return (
+            f"DisplayList(commands={len(self)}, points={len(self.__coordinates) // 2})"
+        )
+
+
+def _commands_equal(command: _TCommand, other_command: _TCommand) -> bool:
+    return (
+        command[0] == other_command[0]
+        and command[2] == other_command[2]
+        and command[1].x == other_command[1].x
+        and command[1].y == other_command[1].y
+    )
+
+
+def _little_endian(array: _array) -> _array:
+    if _sys.byteorder == "little":
+        return array
+    array = _array(array.typecode, array)
+    array.byteswap()
+    return array
+
+
+def _as_tuple(value: _Any) -> _Any:
+    # JSON turns tuples (e.g. text fonts) into lists
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
@@ -0,0 +1,302 @@
+import queue as _queue
+import threading as _threading
+import traceback as _traceback
+
+from time import perf_counter as _perf_counter
+
+from typing import Callable as _Callable
+from typing import Iterable as _Iterable
+from typing import Union as _Union
+
+from ._curve import Curve as _Curve
+from ._curve_points import CurvePoints as _CurvePoints
+from ._vector import Vector as _Vector
+from ._vector import VectorArray as _VectorArray
+
+_TNumber = _Union[int, float]
+_TPoint = tuple[_TNumber, _TNumber]
+
+# Commands kinds
+_CURVE = 0
+_VECTOR = 1
+_VECTORS = 2
+_POINTS = 3
+
+
+class DrawingQueue:
+    """Thread-safe bounded queue of curves, vectors and points to be plotted.
+
+    Turtle (and Tk) must only be used from the thread that created the plotter, so \
+    other threads (e.g. threads producing data) cannot plot directly. Instead, they \
+    put what they want to plot in a drawing queue, from which the plotter thread \
+    plots it in batches: consecutive vectors are plotted at once (see \
+    `Plotter.plot_vectors()`) and the screen is repainted once per batch.
+
+    The queue is bounded, so producers faster than the plotter are slowed down \
+    (backpressure): when the queue is full, putting waits until there is room for it, \
+    or raises `queue.Full` if `block` is False or `timeout` expires.
+
+    Drawing queues are created by `Plotter.start_queue()`. If the drawing backend \
+    supports timers (see `DrawingBackend.SUPPORTS_TIMERS`), the queue is drained by \
+    the event loop of the backend (e.g. while `Plotter.wait()` waits). Otherwise, \
+    `drain()` must be called by the plotter thread.
+
+    Parameters
+    ----------
+    plotter : Plotter
+        Plotter that plots the queued curves, vectors and points.
+    max_size : int
+        Maximum number of commands (curves, vectors or points) in the queue. Defaults \
+        to 1024.
+    batch_size : int
+        Maximum number of commands plotted by each scheduled drain. Defaults to 256.
+    interval : int
+        Delay (in milliseconds) between scheduled drains when the queue is empty. \
+        Defaults to 10.
+    ontimer : Callable[[Callable[[], None], int], None] or None
+        Function that calls its first argument after its second argument milliseconds \
+        (e.g. `DrawingBackend.ontimer()`). If None, drains are not scheduled. Defaults \
+        to None.
+    on_error : Callable[[Exception], None] or None
+        Function called with the exception raised by a command that could not be \
+        plotted. Draining goes on with the next commands. If None, the traceback of \
+        the exception is printed to `sys.stderr`. Defaults to None.
+
+    Attributes
+    ----------
+    submitted : int
+        Number of commands put in the queue.
+    plotted : int
+        Number of commands plotted.
+    failed : int
+        Number of commands that raised an exception when plotted (see `on_error`).
+    batches : int
+        Number of batches plotted.
+    full_waits : int
+        Number of puts that found the queue full and had to wait.
+    """
+
+    def __init__(
+        self,
+        plotter: "Plotter",
+        max_size: int = 1024,
+        batch_size: int = 256,
+        interval: int = 10,
+        ontimer: _Callable[[_Callable[[], None], int], None] = None,
+        on_error: _Callable[[Exception], None] = None,
+    ):
+        self.plotter = plotter
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.interval = interval
+        self.ontimer = ontimer
+        self.on_error = on_error if on_error is not None else _print_error
+
+        # Metrics. Puts can be made by any thread, so their metrics are updated with
+        # a lock.
+        self.submitted = 0
+        self.plotted = 0
+        self.failed = 0
+        self.batches = 0
+        self.full_waits = 0
+        self.__metrics_lock = _threading.Lock()
+
+        self.__queue = _queue.Queue(max_size)
+        self.__start_time = None
+        self.__running = False
+
+    @property
+    def throughput(self) -> float:
+        """Number of commands plotted per second since the queue was started."""
+        if self.__start_time is None:
+            return 0.0
+        elapsed_time = _perf_counter() - self.__start_time
+        return self.plotted / elapsed_time if elapsed_time else 0.0
+
+    def __len__(self) -> int:
+        """Returns the approximate number of commands in the queue."""
+        return self.__queue.qsize()
+
+    def __put(
+        self, command: tuple, block: bool, timeout: _Union[_TNumber, None]
+    ) -> None:
+        try:
+            self.__queue.put_nowait(command)
+        except _queue.Full:
+            if not block:
+                raise
+            with self.__metrics_lock:
+                self.full_waits += 1
+            self.__queue.put(command, timeout=timeout)
+        with self.__metrics_lock:
+            self.submitted += 1
+
+    def put_curve(
+        self, curve: _Curve, block: bool = True, timeout: _TNumber = None
+    ) -> None:
+        """Puts a curve in the queue (see `Plotter.plot_curve()`). Can be called from \
+        any thread.
+
+        Parameters
+        ----------
+        curve : Curve
+            Curve to be plotted.
+        block : bool
+            If True and the queue is full, waits until there is room for the curve. \
+            Otherwise, raises `queue.Full`. Defaults to True.
+        timeout : int or float or None
+            If given, maximum number of seconds to wait. `queue.Full` is raised if \
+            there is still no room for the curve. Defaults to None.
+        """
+        self.__put((_CURVE, curve), block, timeout)
+
+    def put_vector(
+        self, vector: _Vector, block: bool = True, timeout: _TNumber = None
+    ) -> None:
+        """Puts a vector in the queue (see `Plotter.plot_vector()`). Can be called \
+        from any thread.
+
+        Parameters
+        ----------
+        vector : Vector
+            Vector to be plotted.
+        block : bool
+            See `put_curve()`. Defaults to True.
+        timeout : int or float or None
+            See `put_curve()`. Defaults to None.
+        """
+        self.__put((_VECTOR, vector), block, timeout)
+
+    def put_vectors(
+        self,
+        vectors: _Union[_VectorArray, _Iterable[_Vector]],
+        block: bool = True,
+        timeout: _TNumber = None,
+    ) -> None:
+        """Puts many vectors in the queue, as a single command (see \
+        `Plotter.plot_vectors()`). Can be called from any thread.
+
+        Parameters
+        ----------
+        vectors : VectorArray or Iterable[Vector]
+            Vectors to be plotted.
+        block : bool
+            See `put_curve()`. Defaults to True.
+        timeout : int or float or None
+            See `put_curve()`. Defaults to None.
+        """
+        if not isinstance(vectors, _VectorArray):
+            vectors = _VectorArray.from_vectors(vectors)
+        self.__put((_VECTORS, vectors), block, timeout)
+
+    def put_points(
+        self,
+        points: _Union[_CurvePoints, _Iterable[_TPoint]],
+        block: bool = True,
+        timeout: _TNumber = None,
+    ) -> None:
+        """Puts points in the queue, which are plotted joined by a polyline (see \
+        `Plotter.plot_points()`). Can be called from any thread.
+
+        Parameters
+        ----------
+        points : CurvePoints or Iterable[tuple[int or float, int or float]]
+            Points to be plotted.
+        block : bool
+            See `put_curve()`. Defaults to True.
+        timeout : int or float or None
+            See `put_curve()`. Defaults to None.
+        """
+        self.__put((_POINTS, _CurvePoints.from_points(points)), block, timeout)
+
+    def drain(self, max_commands: int = None) -> int:
+        """Plots the commands in the queue, in the order in which they were put, and \
+        repaints the screen once. Must be called from the thread that created the \
+        plotter. A command that raises an exception is reported to `on_error` and \
+        counted in `failed`, and the next commands are still plotted.
+
+        Parameters
+        ----------
+        max_commands : int or None
+            Maximum number of commands plotted. If None, every command in the queue \
+            is plotted. Defaults to None.
+
+        Returns
+        -------
+        int
+            Number of commands taken from the queue, whether they were plotted or \
+            failed.
+        """
+        commands = []
+        while max_commands is None or len(commands) < max_commands:
+            try:
+                commands.append(self.__queue.get_nowait())
+            except _queue.Empty:
+                break
+        if not commands:
+            return 0
+
+        # Consecutive vectors are plotted at once
+        vectors = []
+        for kind, item in commands:
+            if kind == _VECTOR:
+                vectors.append(item)
+                continue
+            if vectors:
+                self.__plot(self.plotter.plot_vectors, vectors, len(vectors))
+                vectors = []
+
+            if kind == _CURVE:
+                self.__plot(self.plotter.plot_curve, item)
+            elif kind == _VECTORS:
+                self.__plot(self.plotter.plot_vectors, item)
+            else:
+                self.__plot(self.plotter.plot_points, item)
+        if vectors:
+            self.__plot(self.plotter.plot_vectors, vectors, len(vectors))
+
+        self.batches += 1
+        try:
+            self.plotter.flush()
+        except Exception as error:
+            self.on_error(error)
+        return len(commands)
+
+    def __plot(self, plot: _Callable, item: object, commands: int = 1) -> None:
+        try:
+            plot(item)
+        except Exception as error:
+            self.failed += commands
+            self.on_error(error)
+        else:
+            self.plotted += commands
+
+    def start(self) -> None:
+        """Starts measuring `throughput` and, if `ontimer` is given, schedules drains \
+        of up to `batch_size` commands until `stop()` is called."""
+        if self.__running:
+            return
+        self.__running = True
+        self.__start_time = _perf_counter()
+        if self.ontimer is not None:
+            self.ontimer(self.__drain_on_timer, 0)
+
+    def stop(self) -> None:
+        """Stops scheduling drains. Commands left in the queue are not plotted."""
+        self.__running = False
+
+    def __drain_on_timer(self) -> None:
+        if not self.__running:
+            return
+        try:
+            self.drain(self.batch_size)
+        finally:
+            # While commands are left, they are drained as soon as the event loop is
+            # idle. Otherwise, the queue is checked again after `interval`. Drains go on
+            # even if `on_error` raised, so producers are never blocked for good.
+            delay = 1 if self.__queue.qsize() else self.interval
+            self.ontimer(self.__drain_on_timer, delay)
+
+
+def _print_error(error: Exception) -> None:
+    _traceback.print_exception(type(error), error, error.__traceback__)
@@ -0,0 +1,124 @@
+from array import array as _array
+
+from typing import Callable as _Callable
+from typing import Union as _Union
+
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+from ._parallel import ParallelEvaluation as _ParallelEvaluation
+
+_TNumber = _Union[int, float]
+_TVector = tuple[_TNumber, _TNumber]
+_TColumns = tuple["_array | _np.ndarray", "_array | _np.ndarray"]
+
+
+def _is_numeric_column(column, shape: tuple, broadcast: bool) -> bool:
+    # Columns that must be broadcast (e.g. a constant) are only accepted when
+    # vectorization was requested explicitly. Otherwise, a function that ignores its
+    # argument (e.g. `lambda x: random.random()`) or reduces it (e.g. `max`) would be
+    # taken as vectorized, so it falls back to the scalar loop instead.
+    if not (isinstance(column, _np.ndarray) and column.dtype.kind in "biuf"):
+        return False
+    if broadcast:
+        return _np.broadcast_shapes(column.shape, shape) == shape
+    return column.shape == shape
+
+
+def _check_vectorize(vectorize: bool) -> None:
+    if vectorize and _np is None:
+        raise ImportError("NumPy is required for vectorized evaluation")
+
+
+def evaluate_function(
+    function: _Callable[[_TNumber], _TNumber],
+    values: _array,
+    vectorize: bool = None,
+    parallel: _ParallelEvaluation = None,
+) -> _TColumns:
+    """Evaluates `function` on each of the given values.
+
+    If `vectorize` is True, `function` is called once with a NumPy array containing all \
+    the values. If it is False, `function` is called once per value. If it is None, the \
+    vectorized evaluation is tried first and the scalar loop is used as a fallback when \
+    NumPy is not installed or `function` does not return an array of the same shape as \
+    the values. Numbers (e.g. a constant) are only broadcast to every value when \
+    `vectorize` is True.
+
+    If `parallel` is given, `function` is called once per value by the workers of a \
+    pool (see `ParallelEvaluation`) and `vectorize` is ignored.
+
+    Returns
+    -------
+    tuple[array or numpy.ndarray, array or numpy.ndarray]
+        The x and y columns of the evaluated points.
+    """
+    if parallel is not None:
+        return values, _array("d", parallel.map(function, values))
+
+    _check_vectorize(vectorize)
+    if vectorize is not False and _np is not None:
+        x = _as_numpy(values)
+        try:
+            with _np.errstate(all="ignore"):
+                y = _np.asarray(function(x))
+            if not _is_numeric_column(y, x.shape, vectorize):
+                raise TypeError("function does not return an array of numbers")
+        except Exception:
+            if vectorize:
+                raise
+        else:
+            return x, _np.broadcast_to(y, x.shape).astype(_np.float64)
+
+    return values, _array("d", map(function, values))
+
+
+def evaluate_parametric_function(
+    parametric_function: _Callable[[_TNumber], _TVector],
+    values: _array,
+    vectorize: bool = None,
+    parallel: _ParallelEvaluation = None,
+) -> _TColumns:
+    """Evaluates `parametric_function` on each of the given values.
+
+    See `evaluate_function` for the meaning of `vectorize` and `parallel`. When \
+    vectorized, `parametric_function` must return a pair of arrays `(x(t), y(t))` \
+    (or numbers, if `vectorize` is True).
+
+    Returns
+    -------
+    tuple[array or numpy.ndarray, array or numpy.ndarray]
+        The x and y columns of the evaluated points.
+    """
+    if parallel is not None:
+        points = parallel.map(parametric_function, values)
+        return (
+            _array("d", [point[0] for point in points]),
+            _array("d", [point[1] for point in points]),
+        )
+
+    _check_vectorize(vectorize)
+    if vectorize is not False and _np is not None:
+        t = _as_numpy(values)
+        try:
+            with _np.errstate(all="ignore"):
+                x, y = (_np.asarray(column) for column in parametric_function(t))
+            if not (
+                _is_numeric_column(x, t.shape, vectorize)
+                and _is_numeric_column(y, t.shape, vectorize)
+            ):
+                raise TypeError("function does not return a pair of arrays of numbers")
+        except Exception:
+            if vectorize:
+                raise
+        else:
+            return (
+                _np.broadcast_to(x, t.shape).astype(_np.float64),
+                _np.broadcast_to(y, t.shape).astype(_np.float64),
+            )
+
+    xs, ys = _array("d"), _array("d")
+    for t in values:
+        x, y = parametric_function(t)
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
@@ -1,5 +1,10 @@
+from array import array as _array
+
+from typing import Iterator as _Iterator
 from typing import Union as _Union
 
+from ._compat import np as _np
+
 _TNumber = _Union[int, float]
 
 
@@ -9,21 +14,138 @@ class Interval:
     The interval is splitted into a list of values in which the curve will be evaluated. \
     These values are defined by the number of `samples` specified. The more samples, the \
     more precise the curve plot is.
-    
+
+    Values are computed lazily: an `Interval` behaves like a read-only sequence (it \
+    supports `len()`, indexing and slicing) but it only stores its start, end and number \
+    of samples, so its memory usage does not depend on the number of samples.
+
     Parameters
     ----------
     start : int or float
         Real number in which the interval starts.
     end : int or float
         Real number in which the interval ends.
-    samples: int
+    samples: int or str
         Number of values within the interval. The more samples, the more precise the \
-        curve plot is.
+        curve plot is. If "auto", `Plotter` chooses the number of samples from the \
+        number of screen pixels the interval spans, so that no two samples fall on the \
+        same pixel. When an "auto" interval is used outside a `Plotter`, it has \
+        `Interval.DEFAULT_AUTO_SAMPLES` samples.
     """
 
-    def __init__(self, start: _TNumber, end: _TNumber, samples: int):
-        dx = (end - start) / samples
-        self.__interval = [start + dx * i for i in range(samples)]
+    AUTO = "auto"
+    DEFAULT_AUTO_SAMPLES = 1000
+
+    def __init__(self, start: _TNumber, end: _TNumber, samples: _Union[int, str]):
+        self.__start = start
+        self.__end = end
+        self.__auto = samples == __class__.AUTO
+        if self.__auto:
+            samples = __class__.DEFAULT_AUTO_SAMPLES
+        self.__samples = samples
+        self.__dx = (end - start) / samples if samples else 0
+
+    @property
+    def start(self) -> _TNumber:
+        """Real number in which the interval starts."""
+        return self.__start
+
+    @property
+    def end(self) -> _TNumber:
+        """Real number in which the interval ends."""
+        return self.__end
+
+    @property
+    def samples(self) -> int:
+        """Number of values within the interval."""
+        return self.__samples
+
+    @property
+    def auto(self) -> bool:
+        """True if the number of samples is chosen by the `Plotter`."""
+        return self.__auto
+
+    def with_samples(self, samples: int) -> "Interval":
+        """Returns an interval with the same start and end and the given number \
+        of samples.
+
+        Parameters
+        ----------
+        samples : int
+            Number of values within the new interval.
+        """
+        return Interval(self.__start, self.__end, samples)
+
+    def as_array(self) -> _array:
+        """Returns the interval values as a contiguous buffer of floats.
+
+        The returned `array.array` supports the buffer protocol, so it can be handed \
+        to vectorized code without copying (e.g. `numpy.frombuffer(interval.as_array())`).
+        When NumPy is installed, the values are computed at once by NumPy, instead of \
+        one by one.
+
+        Returns
+        -------
+        array.array
+            Array of type `"d"` containing the interval values.
+        """
+        if _np is None:
+            return _array("d", iter(self))
+        # Same values as `__iter__()`, i.e. `start + dx * i`
+        values = _np.arange(self.__samples, dtype=_np.float64)
+        values *= self.__dx
+        values += self.__start
+        buffer = _array("d")
+        buffer.frombytes(memoryview(values).cast("B"))
+        return buffer
+
+    def __len__(self) -> int:
+        return self.__samples
+
+    def __iter__(self) -> _Iterator[float]:
+        start, dx = self.__start, self.__dx
+        return (start + dx * i for i in range(self.__samples))
+
+    def __getitem__(self, i: _Union[int, slice]) -> _Union[float, "Interval"]:
+        """Returns the value at index `i`. If `i` is a slice, the sub-interval \
+        containing the sliced values is returned.
+
+        Example
+        -------
+        .. code-block:: python
+
+            interval = curvipy.Interval(start=0, end=10, samples=10)
+            interval[2]
+            >>> 2.0
+            sub_interval = interval[2:6]
+            list(sub_interval)
+            >>> [2.0, 3.0, 4.0, 5.0]
+        """
+        if isinstance(i, slice):
+            indices = range(self.__samples)[i]
+            start = self.__start + self.__dx * indices.start
+            dx = self.__dx * indices.step
+            return Interval(start, start + dx * len(indices), len(indices))
+
+        if i < 0:
+            i += self.__samples
+        if not 0 <= i < self.__samples:
+            raise IndexError("interval index out of range")
+        return self.__start + self.__dx * i
+
+    def __eq__(self, interval: "Interval") -> bool:
+        if not isinstance(interval, Interval):
+            return NotImplemented
+        return (self.__start, self.__end, self.__samples, self.__auto) == (
+            interval.start,
+            interval.end,
+            interval.samples,
+            interval.auto,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.__start, self.__end, self.__samples, self.__auto))
 
-    def __iter__(self):
-        return iter(self.__interval)
+    def __repr__(self) -> str:
+        samples = repr(__class__.AUTO) if self.__auto else self.__samples
+        return f"Interval(start={self.__start}, end={self.__end}, samples={samples})"
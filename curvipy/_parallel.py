@@ -0,0 +1,150 @@
+import pickle as _pickle
+import threading as _threading
+
+from concurrent.futures import Executor as _Executor
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool as _BrokenProcessPool
+from itertools import repeat as _repeat
+
+from typing import Any as _Any
+from typing import Callable as _Callable
+from typing import Sequence as _Sequence
+
+
+class ParallelEvaluation:
+    """Defines how a curve is evaluated in parallel.
+
+    The interval values are split into chunks of `chunk_size` values, which are \
+    evaluated concurrently by a pool of `workers` and then reassembled in order. This \
+    is useful for expensive functions that cannot be vectorized (e.g. numerical \
+    solvers or simulations).
+
+    A process pool requires the function to be picklable, i.e. defined at the top \
+    level of a module (lambdas and nested functions are not picklable). If it is not, \
+    a thread pool is used instead. When using a process pool, the code that plots the \
+    curve must be protected by an `if __name__ == "__main__":` guard. If the workers \
+    cannot load the function anyway (e.g. functions defined in `__main__` when \
+    processes are started with "spawn"), the pool breaks and the values are \
+    evaluated again by a thread pool, which is used from then on.
+
+    Pools are created on first use and kept alive, so evaluating many curves or \
+    chunks (e.g. with `AdaptiveSampling` or `PlottingConfiguration.stream_chunk_size`) \
+    starts the workers only once. They are shut down by `close()`, or when leaving \
+    a `with` block:
+
+    .. code-block:: python
+
+        with curvipy.ParallelEvaluation() as parallel:
+            plotter.plot_curve(curvipy.Function(function, interval, parallel=parallel))
+
+    Parameters
+    ----------
+    executor : str
+        Can either be "process" or "thread". Defines whether the function is evaluated \
+        by a pool of processes (best for CPU-bound functions) or by a pool of threads \
+        (best for functions that release the GIL, e.g. I/O or native code). Defaults \
+        to "process".
+    workers : int or None
+        Number of workers of the pool. If None, it equals the number of processors of \
+        the machine. Defaults to None.
+    chunk_size : int
+        Number of values evaluated by a worker at once. Defaults to 1024.
+    """
+
+    def __init__(
+        self,
+        executor: str = "process",
+        workers: int = None,
+        chunk_size: int = 1024,
+    ):
+        self.executor = executor
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+        # Pools by executor class, created on first use
+        self.__pools = {}
+        self.__pools_lock = _threading.Lock()
+        # Whether a process pool broke, so a thread pool is used instead
+        self.__processes_failed = False
+
+    def __enter__(self) -> "ParallelEvaluation":
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts the pools down, waiting for their workers to finish. Pools are \
+        created again if the curve is evaluated again."""
+        with self.__pools_lock:
+            pools, self.__pools = self.__pools, {}
+        for pool in pools.values():
+            pool.shutdown()
+
+    def __get_pool(self, executor_class: type) -> _Executor:
+        with self.__pools_lock:
+            if executor_class not in self.__pools:
+                self.__pools[executor_class] = executor_class(max_workers=self.workers)
+            return self.__pools[executor_class]
+
+    def __discard_pool(self, executor_class: type) -> None:
+        with self.__pools_lock:
+            pool = self.__pools.pop(executor_class, None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def map(self, function: _Callable, values: _Sequence) -> list:
+        """Returns the result of `function` for each of the given values, in the \
+        same order as the values.
+
+        Parameters
+        ----------
+        function : Callable
+            Function to be evaluated.
+        values : Sequence
+            Values on which `function` is evaluated.
+
+        Returns
+        -------
+        list
+            Results of `function`.
+        """
+        chunks = [
+            values[i : i + self.chunk_size]
+            for i in range(0, len(values), self.chunk_size)
+        ]
+        use_processes = (
+            self.executor == "process"
+            and not self.__processes_failed
+            and _is_picklable(function)
+        )
+        if use_processes:
+            try:
+                return _map_chunks(
+                    self.__get_pool(_ProcessPoolExecutor), function, chunks
+                )
+            except (_BrokenProcessPool, _pickle.PicklingError):
+                # Workers could not load the function (or send its results back), so
+                # threads are used instead
+                self.__processes_failed = True
+                self.__discard_pool(_ProcessPoolExecutor)
+
+        return _map_chunks(self.__get_pool(_ThreadPoolExecutor), function, chunks)
+
+
+def _map_chunks(executor: _Executor, function: _Callable, chunks: list) -> list:
+    results = executor.map(_evaluate_chunk, _repeat(function), chunks)
+    return [result for chunk in results for result in chunk]
+
+
+def _evaluate_chunk(function: _Callable, values: _Sequence) -> list:
+    return [function(value) for value in values]
+
+
+def _is_picklable(function: _Any) -> bool:
+    try:
+        _pickle.dumps(function)
+    except Exception:
+        return False
+    return True
@@ -0,0 +1,93 @@
+import turtle as _turtle
+
+from typing import Any as _Any
+from typing import Callable as _Callable
+from typing import Union as _Union
+
+_TNumber = _Union[int, float]
+_TRealPoint = tuple[_TNumber, _TNumber]
+
+
+class PenState:
+    """Turtle pen that only forwards actual state changes to turtle.
+
+    Every `turtle.Turtle.width()`, `color()`, `speed()`, `up()` and `down()` call \
+    updates the turtle and might redraw the screen, even if the pen state does not \
+    change. `PenState` tracks the width, color, speed and up/down state of the pen, \
+    and drops calls that would leave them unchanged.
+
+    Parameters
+    ----------
+    pen : turtle.Turtle
+        Pen to which state changes are forwarded.
+
+    Attributes
+    ----------
+    issued : int
+        Number of state changes forwarded to turtle.
+    suppressed : int
+        Number of state changes dropped because the pen already was in that state.
+    """
+
+    def __init__(self, pen: _turtle.Turtle):
+        self.issued = 0
+        self.suppressed = 0
+        self.reset(pen)
+
+    def reset(self, pen: _turtle.Turtle) -> None:
+        """Replaces the pen (e.g. after `turtle.Screen.clear()`, which unregisters \
+        the previous one). Its state is unknown, so the next state changes are \
+        forwarded. `issued` and `suppressed` are not reset.
+
+        Parameters
+        ----------
+        pen : turtle.Turtle
+            New pen.
+        """
+        self.pen = pen
+        self.__state = {}
+
+    def __change(self, attribute: str, value: _Any, apply: _Callable[[], None]) -> None:
+        if attribute in self.__state and self.__state[attribute] == value:
+            self.suppressed += 1
+            return
+        apply()
+        self.__state[attribute] = value
+        self.issued += 1
+
+    def width(self, width: int) -> None:
+        """Sets the pen width."""
+        self.__change("width", width, lambda: self.pen.width(width))
+
+    def color(self, color: str) -> None:
+        """Sets the pen color."""
+        self.__change("color", color, lambda: self.pen.color(color))
+
+    def speed(self, speed: int) -> None:
+        """Sets the pen speed."""
+        self.__change("speed", speed, lambda: self.pen.speed(speed))
+
+    def up(self) -> None:
+        """Pulls the pen up, so moving it does not draw."""
+        self.__change("down", False, self.pen.up)
+
+    def down(self) -> None:
+        """Pulls the pen down, so moving it draws."""
+        self.__change("down", True, self.pen.down)
+
+    @property
+    def items(self) -> list[int]:
+        """Canvas items drawn by the pen (see `turtle.RawTurtle.items`)."""
+        return self.pen.items
+
+    def clear(self) -> None:
+        """Removes the drawings of the pen (see `turtle.Turtle.clear()`)."""
+        self.pen.clear()
+
+    def goto(self, point: _TRealPoint) -> None:
+        """Moves the pen to the given point."""
+        self.pen.goto(point)
+
+    def write(self, text: str, **kwargs) -> None:
+        """Writes text at the pen position (see `turtle.Turtle.write()`)."""
+        self.pen.write(text, **kwargs)
@@ -1,11 +1,29 @@
+import asyncio as _asyncio
+
+from concurrent.futures import Executor as _Executor
 from math import ceil as _ceil
 from math import pi as _pi
 
+from typing import Callable as _Callable
+from typing import Iterable as _Iterable
+from typing import BinaryIO as _BinaryIO
+from typing import TextIO as _TextIO
 from typing import Union as _Union
 
+from ._animation import Animation as _Animation
 from ._vector import Vector as _Vector
+from ._vector import VectorArray as _VectorArray
 from ._curve import Curve as _Curve
+from ._curve_points import CurvePoints as _CurvePoints
 from ._screen import ScreenFacade as _ScreenFacade
+from ._display_list import DisplayList as _DisplayList
+from ._drawing_queue import DrawingQueue as _DrawingQueue
+from ._backend import DrawingBackend as _DrawingBackend
+from ._turtle_backend import TurtleBackend as _TurtleBackend
+from ._svg_backend import SVGBackend as _SVGBackend
+from ._raster_backend import RasterBackend as _RasterBackend
+from ._clip import clip_segment as _clip_segment
+from ._clip import contains_point as _contains_point
 
 _TNumber = _Union[int, float]
 
@@ -25,6 +43,27 @@ class ScreenConfiguration:
     window_height : int or None
         Height of the screen window (in pixels). If None, `window_height` equals to 75% of \
         the display height.
+    instant_render : bool
+        If True, drawings are not animated and the screen is only repainted when \
+        `Plotter.flush()` is called (or every `frame_interval` drawing operations), so \
+        drawing many curves and vectors costs a single screen update. Defaults to False.
+    frame_interval : int
+        When `instant_render` is True, number of drawing operations between screen \
+        repaints. If 0, the screen is only repainted by `Plotter.flush()`. Defaults to 0.
+    backend : str or DrawingBackend
+        Backend on which curves, vectors and axes are drawn. Can either be "turtle" (a \
+        window, see `TurtleBackend`), "svg" (an SVG document, see `SVGBackend`), "png" \
+        (a PNG image, see `RasterBackend`) or an instance of a `DrawingBackend` \
+        subclass, in which case the other screen attributes are ignored. The "svg" and \
+        "png" backends need no display. Defaults to "turtle".
+    output : str or TextIO or BinaryIO or None
+        Path of the file, or buffer, to which the "svg" and "png" backends save the \
+        drawing when `Plotter.wait()` is called. Defaults to None.
+    record_drawings : bool
+        If True, every drawing is recorded in `Plotter.display_list`, so that it can be \
+        redrawn without evaluating curves again (see `Plotter.redraw()`). Recorded \
+        points take 16 bytes each. Streamed curves are never recorded (see \
+        `PlottingConfiguration.stream_chunk_size`). Defaults to True.
     """
 
     def __init__(
@@ -33,11 +72,21 @@ class ScreenConfiguration:
         background_color: str = "#FFFFFF",
         window_width: int = None,
         window_height: int = None,
+        instant_render: bool = False,
+        frame_interval: int = 0,
+        backend: _Union[str, _DrawingBackend] = "turtle",
+        output: _Union[str, _TextIO, _BinaryIO] = None,
+        record_drawings: bool = True,
     ):
         self.window_title = window_title
         self.background_color = background_color
         self.window_width = window_width
         self.window_height = window_height
+        self.instant_render = instant_render
+        self.frame_interval = frame_interval
+        self.backend = backend
+        self.output = output
+        self.record_drawings = record_drawings
 
 
 class PlottingConfiguration:
@@ -57,6 +106,22 @@ class PlottingConfiguration:
         Vector width. Defaults to 3.
     vector_head_size : int
         Size of vectors' head. Defaults to 10.
+    simplify_tolerance : float
+        Curve points closer than `simplify_tolerance` pixels to the line joining their \
+        neighbours are not drawn. Small values (e.g. 0.5) make dense curves much faster \
+        to draw without visible changes. If 0, every curve point is drawn. Defaults to 0.
+    clip : bool
+        If True, curves and vectors are clipped to the rectangle covered by the axes, and \
+        vectors lying completely outside of it are not drawn. Defaults to True.
+    stream_chunk_size : int or None
+        If given, curves are evaluated and drawn in chunks of `stream_chunk_size` points \
+        (see `Curve.iter_points()`), so drawing starts as soon as the first chunk is \
+        evaluated and memory usage does not depend on the number of samples. Streamed \
+        points are neither stored in `Curve.points_cache` nor recorded in \
+        `Plotter.display_list`, so streamed curves are not drawn again by \
+        `Plotter.redraw()` (nor when a layer is updated on a backend without layers, \
+        see `DrawingBackend.SUPPORTS_LAYERS`). If None, curves are evaluated \
+        completely before being drawn. Defaults to None.
     """
 
     def __init__(
@@ -67,13 +132,19 @@ class PlottingConfiguration:
         vector_color: str = "#E63946",
         vector_width: int = 3,
         vector_head_size: int = 10,
+        simplify_tolerance: float = 0,
+        clip: bool = True,
+        stream_chunk_size: int = None,
     ):
         # General attributes
         self.plotting_speed = plotting_speed
+        self.clip = clip
 
         # Curves attributes
         self.curve_color = curve_color
         self.curve_width = curve_width
+        self.simplify_tolerance = simplify_tolerance
+        self.stream_chunk_size = stream_chunk_size
 
         # Vectors
         self.vector_color = vector_color
@@ -173,8 +244,19 @@ class Plotter:
     axes_config : AxesConfiguration
         Axes configuration.  By default, `axes_config` takes the defaults attributes values \
         of `AxesConfiguration`.
+
+    Curves and vectors are plotted on layers (see `set_layer()`), which can be cleared, \
+    hidden and restacked on their own, so updating a plot only draws again the layers \
+    that changed. Axes are drawn on a layer of their own (`AXES_LAYER`) when the first \
+    curve or vector is plotted (or when the screen is flushed), and they are only drawn \
+    again if `axes_config` changes.
     """
 
+    AXES_LAYER = "axes"
+
+    # Seconds between two processings of the backend events while awaiting curves
+    EVENTS_INTERVAL = 0.02
+
     def __init__(
         self,
         screen_config: ScreenConfiguration = None,
@@ -233,16 +315,73 @@ class Plotter:
         self.__logical_height = total_y_ticks * self.axes_config.y_ticks_distance
 
         self.__screen = _ScreenFacade(
-            self.screen_config.window_title,
-            self.screen_config.background_color,
-            self.screen_config.window_width,
-            self.screen_config.window_height,
+            self.__create_backend(),
             self.__logical_width,
             self.__logical_height,
+            self.screen_config.record_drawings,
         )
 
+        # Axes are drawn on their own layer, below curves and vectors, which is left
+        # intact by `clean()`. They are drawn on the first plot (see `__update_axes()`).
+        self.__screen.set_layer(__class__.AXES_LAYER)
+        self.__screen.set_layer(_DrawingBackend.DEFAULT_LAYER)
+        self.__axes_state = None
+
+    def __update_axes(self) -> None:
+        # Draws the axes if they have not been drawn yet, or if the axes configuration
+        # has changed since they were drawn
+        if self.axes_config.show_axes:
+            axes_state = tuple(vars(self.axes_config).items())
+        else:
+            axes_state = None
+        if axes_state == self.__axes_state:
+            return
+
+        layer = self.__screen.layer
+        self.__screen.set_layer(__class__.AXES_LAYER)
+        self.__screen.clean_layer(__class__.AXES_LAYER)
         if self.axes_config.show_axes:
             self._draw_axis()
+        self.__screen.set_layer(layer)
+        self.__axes_state = axes_state
+
+    def __create_backend(self) -> _DrawingBackend:
+        config = self.screen_config
+        if isinstance(config.backend, _DrawingBackend):
+            return config.backend
+
+        if config.backend == "turtle":
+            return _TurtleBackend(
+                config.window_title,
+                config.background_color,
+                config.window_width,
+                config.window_height,
+                config.instant_render,
+                config.frame_interval,
+            )
+
+        if config.backend == "svg":
+            return _SVGBackend(
+                config.window_title,
+                config.background_color,
+                config.window_width,
+                config.window_height,
+                config.output,
+            )
+
+        if config.backend == "png":
+            return _RasterBackend(
+                config.window_title,
+                config.background_color,
+                config.window_width,
+                config.window_height,
+                config.output,
+            )
+
+        raise ValueError(
+            f"unknown backend {config.backend!r}, expected 'turtle', 'svg', 'png' or "
+            "a DrawingBackend"
+        )
 
     def _draw_axis(self) -> None:
         w, h = self.__logical_width, self.__logical_height
@@ -418,6 +557,8 @@ class Plotter:
         vector : Vector
             Vector to be plotted.
         """
+        self.__update_axes()
+
         # NOTE: for plotting the vector arrow, we cannot use the vector angle because
         # the vector components do not reflect the real coordinates where it will be
         # drawn. Because of that, we need the angle of a scaled version of itself, that
@@ -430,6 +571,12 @@ class Plotter:
         if not vector.norm:
             return
 
+        # Check if vector is outside the axes (see `PlottingConfiguration.clip`)
+        clip = self.plotting_config.clip
+        rectangle = self.__screen.get_logical_rectangle()
+        if clip and _clip_segment(vector.tail, vector.head, rectangle) is None:
+            return
+
         # Draw vector
         self.__screen.draw_line(
             vector.tail,
@@ -437,9 +584,13 @@ class Plotter:
             self.plotting_config.vector_width,
             self.plotting_config.vector_color,
             self.plotting_config.plotting_speed,
+            clip,
         )
 
         # Draw vector head
+        if clip and not _contains_point(vector.head, rectangle):
+            return
+
         scaled_vector = _Vector(self.__screen.get_real_point(vector.components))
         self.__screen.draw_arrow(
             point=vector.head,
@@ -450,27 +601,156 @@ class Plotter:
             drawing_speed=self.__screen.MAX_DRAWING_SPEED,
         )
 
+    def plot_vectors(self, vectors: _Union[_VectorArray, _Iterable[_Vector]]) -> None:
+        """Plots all the given two-dimensional vectors in a single pass. This is much \
+        faster than calling `plot_vector()` for each vector, e.g. for plotting a vector \
+        field.
+
+        Parameters
+        ----------
+        vectors : VectorArray or Iterable[Vector]
+            Vectors to be plotted.
+        """
+        self.__update_axes()
+        if not isinstance(vectors, _VectorArray):
+            vectors = _VectorArray.from_vectors(vectors)
+
+        self.__screen.draw_vectors(
+            vectors.tails,
+            vectors.heads,
+            self.plotting_config.vector_head_size,
+            self.plotting_config.vector_width,
+            self.plotting_config.vector_color,
+            self.plotting_config.plotting_speed,
+            self.plotting_config.clip,
+        )
+
     def plot_curve(self, curve: _Curve) -> None:
         """Plots the given two-dimensional curve in the specified interval.
 
+        If the curve interval has "auto" samples (see `Interval`), the number of \
+        samples is derived from the number of screen pixels the curve spans.
+
         Parameters
         ----------
         curve : Curve
             Curve to be plotted.
         """
+        self.__update_axes()
+
         # Draw curve
-        curve_points = curve.points()
+        curve = curve.for_resolution(self.__screen.get_pixel_size())
+        polyline_style = (
+            self.plotting_config.curve_width,
+            self.plotting_config.curve_color,
+            self.plotting_config.plotting_speed,
+            self.plotting_config.simplify_tolerance,
+            self.plotting_config.clip,
+        )
+
+        if self.plotting_config.stream_chunk_size:
+            chunks = curve.iter_points(self.plotting_config.stream_chunk_size)
+            self.__screen.draw_polyline_stream(chunks, *polyline_style)
+        else:
+            self.__draw_curve_points(_Curve.points_cache.get_points(curve))
+
+    def __draw_curve_points(self, curve_points: _CurvePoints) -> None:
         self.__screen.draw_polyline(
             curve_points,
             self.plotting_config.curve_width,
             self.plotting_config.curve_color,
             self.plotting_config.plotting_speed,
+            self.plotting_config.simplify_tolerance,
+            self.plotting_config.clip,
         )
 
-    def plot_animated_curve(self, curve: _Curve, samples_per_vector: int) -> None:
+    async def aplot_curve(self, curve: _Curve, executor: _Executor = None) -> None:
+        """Plots the given curve like `plot_curve()`, but evaluates it in an executor \
+        while processing the backend events (see `DrawingBackend.process_events()`), \
+        so the window stays responsive and other coroutines keep running.
+
+        Parameters
+        ----------
+        curve : Curve
+            Curve to be plotted.
+        executor : concurrent.futures.Executor or None
+            Thread pool in which the curve is evaluated. If None, the default executor \
+            of the event loop is used. Defaults to None.
+        """
+        await self.aplot_curves(curve, executor=executor)
+
+    async def aplot_curves(self, *curves: _Curve, executor: _Executor = None) -> None:
+        """Plots the given curves like `plot_curve()`, but evaluates all of them \
+        concurrently in an executor while processing the backend events (see \
+        `DrawingBackend.process_events()`). Curves are drawn in the given order, each \
+        as soon as it and the previous ones are evaluated, so drawing overlaps with \
+        the evaluation of the next curves. Curves are not streamed (see \
+        `PlottingConfiguration.stream_chunk_size`).
+
+        Parameters
+        ----------
+        *curves : Curve
+            Curves to be plotted.
+        executor : concurrent.futures.Executor or None
+            Thread pool in which the curves are evaluated. If None, the default \
+            executor of the event loop is used. Defaults to None.
+        """
+        self.__update_axes()
+        pixel_size = self.__screen.get_pixel_size()
+        loop = _asyncio.get_running_loop()
+        evaluations = [
+            loop.run_in_executor(
+                executor,
+                _Curve.points_cache.get_points,
+                curve.for_resolution(pixel_size),
+            )
+            for curve in curves
+        ]
+
+        try:
+            for evaluation in evaluations:
+                while not evaluation.done():
+                    self.__screen.backend.process_events()
+                    await _asyncio.wait({evaluation}, timeout=__class__.EVENTS_INTERVAL)
+                self.__draw_curve_points(evaluation.result())
+        finally:
+            # Evaluations that have not started yet are not needed anymore (e.g. if
+            # this coroutine is cancelled)
+            for evaluation in evaluations:
+                evaluation.cancel()
+
+    def plot_points(
+        self, points: _Union[_CurvePoints, _Iterable[tuple[_TNumber, _TNumber]]]
+    ) -> None:
+        """Plots a polyline joining the given points, with the style of curves (e.g. \
+        for plotting measured data).
+
+        Parameters
+        ----------
+        points : CurvePoints or Iterable[tuple[int or float, int or float]]
+            Points to be plotted.
+        """
+        self.__update_axes()
+        self.__draw_curve_points(_CurvePoints.from_points(points))
+
+    def plot_animated_curve(
+        self,
+        curve: _Curve,
+        samples_per_vector: int,
+        duration: _TNumber = None,
+        frame_rate: _TNumber = 30,
+    ) -> _Union[_Animation, None]:
         """Plots the given curve by drawing a set of vectors pointing at the curve \
         points and then joining the vector heads.
 
+        By default, vectors and curve are drawn at `PlottingConfiguration.plotting_speed` \
+        and this method returns once they are drawn, so the animation lasts longer the \
+        more samples the curve has. If `duration` is given, the animation is instead \
+        drawn frame by frame by the event loop of the backend (e.g. while `wait()` \
+        waits) in `duration` seconds, however many samples the curve has, and this \
+        method returns at once (see `Animation`). Backends that cannot schedule frames \
+        (see `DrawingBackend.SUPPORTS_TIMERS`) draw the whole animation at once.
+
         Parameters
         ----------
         curve : Curve
@@ -478,22 +758,275 @@ class Plotter:
         samples_per_vector : int
             Number of samples per each vector plotted. The less `samples_per_vector` \
             is, the more vectors are drawn. 
+        duration : int or float or None
+            Duration of the animation (in seconds). Defaults to None.
+        frame_rate : int or float
+            Number of frames per second of the animation, if `duration` is given. \
+            Defaults to 30.
+
+        Returns
+        -------
+        Animation or None
+            If `duration` is given, the animation, which can be cancelled. Otherwise, \
+            None.
         """
+        if duration is not None:
+            return self.__start_animation(
+                curve, samples_per_vector, duration, frame_rate
+            )
+
         # Plot vectors:
-        for i, vector in enumerate(curve.points()):
+        self.__update_axes()
+        curve = curve.for_resolution(self.__screen.get_pixel_size())
+        points = _Curve.points_cache.get_points(curve)
+        for i, vector in enumerate(points):
             if i % samples_per_vector != 0:
                 continue
             self.plot_vector(_Vector(vector))
 
-        # Plot curve:
+        # Plot curve, with the points already evaluated (they may not be cached)
+        self.__draw_curve_points(points)
+
+    def __start_animation(
+        self,
+        curve: _Curve,
+        samples_per_vector: int,
+        duration: _TNumber,
+        frame_rate: _TNumber,
+    ) -> _Animation:
+        self.__update_axes()
+        curve = curve.for_resolution(self.__screen.get_pixel_size())
+        points = _Curve.points_cache.get_points(curve)
+        vector_heads = points[::samples_per_vector]
+
+        # Steps are the vectors, and then the curve segments
+        total_vectors = len(vector_heads)
+        total_segments = max(len(points) - 1, 0)
+        layer = self.__screen.layer
+
+        def draw_steps(start: int, end: int) -> None:
+            # Steps are drawn on the layer on which the animation started
+            current_layer = self.__screen.layer
+            if layer != current_layer:
+                self.__screen.set_layer(layer)
+
+            vectors_start, vectors_end = min(start, total_vectors), min(
+                end, total_vectors
+            )
+            if vectors_start < vectors_end:
+                tails = [0.0] * (vectors_end - vectors_start)
+                self.__screen.draw_vectors(
+                    _CurvePoints(tails, tails),
+                    vector_heads[vectors_start:vectors_end],
+                    self.plotting_config.vector_head_size,
+                    self.plotting_config.vector_width,
+                    self.plotting_config.vector_color,
+                    self.__screen.MAX_DRAWING_SPEED,
+                    self.plotting_config.clip,
+                )
+
+            segments_start = max(start - total_vectors, 0)
+            segments_end = max(end - total_vectors, 0)
+            if segments_start < segments_end:
+                self.__screen.draw_polyline(
+                    points[segments_start : segments_end + 1],
+                    self.plotting_config.curve_width,
+                    self.plotting_config.curve_color,
+                    self.__screen.MAX_DRAWING_SPEED,
+                    self.plotting_config.simplify_tolerance,
+                    self.plotting_config.clip,
+                )
+
+            if layer != current_layer:
+                self.__screen.set_layer(current_layer)
+            self.__screen.flush()
+
+        backend = self.__screen.backend
+        animation = _Animation(
+            draw_steps,
+            total_vectors + total_segments,
+            duration,
+            frame_rate,
+            backend.ontimer if backend.SUPPORTS_TIMERS else None,
+        )
+        animation.start()
+        return animation
+
+    def start_queue(
+        self,
+        max_size: int = 1024,
+        batch_size: int = 256,
+        interval: int = 10,
+        on_error: _Callable[[Exception], None] = None,
+    ) -> _DrawingQueue:
+        """Creates a drawing queue, in which any thread can put curves, vectors and \
+        points to be plotted by this plotter (see `DrawingQueue`). If the backend \
+        supports timers (see `DrawingBackend.SUPPORTS_TIMERS`), the queue is drained \
+        by the backend event loop, e.g. while `wait()` waits. Otherwise, \
+        `DrawingQueue.drain()` must be called by the thread that created the plotter.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum number of commands in the queue. Defaults to 1024.
+        batch_size : int
+            Maximum number of commands plotted at once. Defaults to 256.
+        interval : int
+            Delay (in milliseconds) between checks of an empty queue. Defaults to 10.
+        on_error : Callable[[Exception], None] or None
+            Function called with the exception raised by a command that could not \
+            be plotted. If None, its traceback is printed to `sys.stderr`. Defaults \
+            to None.
+
+        Returns
+        -------
+        DrawingQueue
+            Started drawing queue.
+        """
+        backend = self.__screen.backend
+        drawing_queue = _DrawingQueue(
+            self,
+            max_size,
+            batch_size,
+            interval,
+            backend.ontimer if backend.SUPPORTS_TIMERS else None,
+            on_error,
+        )
+        drawing_queue.start()
+        return drawing_queue
+
+    @property
+    def simplification_stats(self) -> tuple[int, int]:
+        """Total number of curve points received and actually drawn by the plotter. \
+        Both numbers differ when `PlottingConfiguration.simplify_tolerance` is set."""
+        return self.__screen.polyline_points_in, self.__screen.polyline_points_drawn
+
+    @property
+    def display_list(self) -> _DisplayList:
+        """Drawings (axes, curves and vectors) made since the plotter was last cleaned \
+        (see `ScreenConfiguration.record_drawings`). Streamed curves are not included \
+        (see `PlottingConfiguration.stream_chunk_size`)."""
+        return self.__screen.display_list
+
+    def replay(self, display_list: _DisplayList) -> None:
+        """Draws the given display list, e.g. the `display_list` of another plotter \
+        (which might use a different backend or screen size) or one deserialized with \
+        `DisplayList.from_bytes()`. Drawings are not animated.
+
+        Parameters
+        ----------
+        display_list : DisplayList
+            Drawings to be replayed.
+        """
+        self.__update_axes()
+        self.__screen.replay(display_list)
+
+    def redraw(self) -> None:
+        """Removes every drawing and draws it again from `display_list`, at the current \
+        screen size (e.g. after resizing the window). Curves are not evaluated again."""
+        self.__screen.redraw()
+
+    @property
+    def layers(self) -> list[str]:
+        """Names of the layers, from the bottom layer to the top one. At first, there \
+        are two layers: `AXES_LAYER` and `DrawingBackend.DEFAULT_LAYER`."""
+        return list(self.__screen.layers)
+
+    @property
+    def layer(self) -> str:
+        """Layer on which curves and vectors are plotted (see `set_layer()`)."""
+        return self.__screen.layer
+
+    def set_layer(self, layer: str) -> None:
+        """Sets the layer on which the next curves and vectors are plotted. A layer \
+        that does not exist yet is created on top of the others.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        self.__screen.set_layer(layer)
+
+    def clear_layer(self, layer: str) -> None:
+        """Removes the curves and vectors plotted on the given layer. The drawings of \
+        the other layers are left intact.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        self.__screen.clean_layer(layer)
+
+    def hide_layer(self, layer: str) -> None:
+        """Hides the curves and vectors plotted on the given layer, including the ones \
+        plotted after this method is called, until `show_layer()` is called.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        self.__screen.hide_layer(layer)
+
+    def show_layer(self, layer: str) -> None:
+        """Shows the curves and vectors plotted on the given layer (see \
+        `hide_layer()`).
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        self.__screen.show_layer(layer)
+
+    def set_layer_order(self, layers: list[str]) -> None:
+        """Stacks the given layers in the given order, from the bottom to the top. \
+        The given layers swap places among themselves and the other layers keep their \
+        place, e.g. `set_layer_order(["b", "a"])` puts layer "a" above layer "b".
+
+        Parameters
+        ----------
+        layers : list[str]
+            Names of existing layers, from the bottom layer to the top one.
+        """
+        self.__screen.set_layer_order(layers)
+
+    def replace_curve(self, curve: _Curve, layer: str) -> None:
+        """Removes the drawings of the given layer and plots the given curve on it, \
+        keeping the place of the layer in the stack. Only this layer is drawn again, \
+        e.g. for updating one curve out of many.
+
+        Parameters
+        ----------
+        curve : Curve
+            Curve to be plotted.
+        layer : str
+            Layer name. A layer that does not exist yet is created on top of the \
+            others.
+        """
+        current_layer = self.__screen.layer
+        self.__screen.set_layer(layer)
+        self.__screen.clean_layer(layer)
         self.plot_curve(curve)
+        self.__screen.set_layer(current_layer)
 
     def clean(self) -> None:
-        """Removes curves and vectors plotted."""
-        self.__screen.clean()
-        if self.axes_config.show_axes:
-            self._draw_axis()
+        """Removes curves and vectors plotted on every layer. Axes are left intact."""
+        for layer in list(self.__screen.layers):
+            if layer != __class__.AXES_LAYER:
+                self.__screen.clean_layer(layer)
+
+    def flush(self) -> None:
+        """Repaints the screen. When `ScreenConfiguration.instant_render` is True, \
+        curves and vectors plotted are not shown until this method is called."""
+        self.__update_axes()
+        self.__screen.flush()
 
     def wait(self) -> None:
-        """Waits until plotter screen is clicked. When clicked, exits plotter."""
-        self.__screen.exit_on_click()
+        """Waits until plotter screen is clicked. When clicked, exits plotter. With the \
+        "svg" and "png" backends, saves the drawing to `ScreenConfiguration.output` \
+        instead."""
+        self.flush()
+        self.__screen.wait()
@@ -0,0 +1,387 @@
+import struct as _struct
+import zlib as _zlib
+
+from math import floor as _floor
+
+from typing import BinaryIO as _BinaryIO
+from typing import Iterable as _Iterable
+from typing import Union as _Union
+
+from ._backend import DrawingBackend as _DrawingBackend
+from ._backend import _reorder
+from ._clip import clip_segments as _clip_segments
+from ._curve_points import CurvePoints as _CurvePoints
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+
+_TNumber = _Union[int, float]
+_TRealPoint = tuple[_TNumber, _TNumber]
+
+_COLOR_NAMES = {
+    "black": "#000000",
+    "white": "#FFFFFF",
+    "red": "#FF0000",
+    "green": "#00FF00",
+    "blue": "#0000FF",
+    "yellow": "#FFFF00",
+    "cyan": "#00FFFF",
+    "magenta": "#FF00FF",
+    "gray": "#BEBEBE",
+    "grey": "#BEBEBE",
+    "orange": "#FFA500",
+    "purple": "#A020F0",
+    "pink": "#FFC0CB",
+    "brown": "#A52A2A",
+}
+
+
+class RasterBackend(_DrawingBackend):
+    """Drawing backend that rasterizes drawings into a NumPy pixel buffer and encodes \
+    it as a PNG image. It needs no display, so it can be used on headless machines \
+    (e.g. for generating thumbnails). Requires NumPy.
+
+    Lines are anti-aliased: the coverage of each pixel is computed from its distance \
+    to the line. Segments are rasterized in batches, computing the coverage of the \
+    pixels around many segments with each NumPy operation. Text is not drawn, since \
+    the standard library has no font rasterizer, so axes ticks have no numbers.
+
+    Each layer is drawn on its own transparent pixel buffer, and visible layers are \
+    composited on top of the background when the image is read.
+
+    The image is kept in memory: `pixels` holds it, `to_png()` encodes it and `save()` \
+    writes it to a file or buffer. If `output` is given, the image is saved to it when \
+    `Plotter.wait()` is called.
+
+    Parameters
+    ----------
+    window_title : str
+        Title of the image. It is stored as PNG metadata.
+    background_color : str
+        Background color. Can either be a hex color code or one of a few basic color \
+        names (e.g. "white", "black", "red").
+    width : int or None
+        Width of the image (in pixels). If None, `width` equals to `DEFAULT_WIDTH`.
+    height : int or None
+        Height of the image (in pixels). If None, `height` equals to `DEFAULT_HEIGHT`.
+    output : str or BinaryIO or None
+        Path of the file, or binary buffer, to which the PNG image is saved by \
+        `Plotter.wait()`. Defaults to None.
+    """
+
+    SUPPORTS_LAYERS = True
+
+    DEFAULT_WIDTH = 800
+    DEFAULT_HEIGHT = 600
+
+    # Size of the margin between the drawing area and the image borders, the same as
+    # the one of `TurtleBackend`, so both backends produce the same layout
+    MARGIN = 65
+
+    # Maximum length (in pixels) of the pieces into which segments are split, and
+    # maximum number of pixels whose coverage is computed at once
+    PIECE_LENGTH = 4
+    WINDOW_PIXELS = 1 << 20
+
+    def __init__(
+        self,
+        window_title: str,
+        background_color: str,
+        width: int = None,
+        height: int = None,
+        output: _Union[str, _BinaryIO] = None,
+    ):
+        if _np is None:
+            raise ImportError("NumPy is required for the raster backend")
+
+        self.window_title = window_title
+        self.background_color = background_color
+        self.width = width or __class__.DEFAULT_WIDTH
+        self.height = height or __class__.DEFAULT_HEIGHT
+        self.output = output
+        # Pixels of each layer, one row per image row, as premultiplied RGBA channels
+        # from 0 to 1 (i.e. RGB channels are multiplied by the alpha channel). Layers are
+        # sorted from the bottom layer to the top one.
+        self.__layers = {}
+        self.__layer = __class__.DEFAULT_LAYER
+        self.__hidden_layers = set()
+
+    def __get_layer_pixels(self, layer: str) -> "_np.ndarray":
+        # Layers are created on first use
+        if layer not in self.__layers:
+            self.__layers[layer] = _np.zeros(
+                (self.height, self.width, 4), dtype=_np.float32
+            )
+        return self.__layers[layer]
+
+    @property
+    def __pixels(self) -> "_np.ndarray":
+        return self.__get_layer_pixels(self.__layer)
+
+    @property
+    def pixels(self) -> "_np.ndarray":
+        """Image as a `(height, width, 3)` array of 8-bit RGB pixels."""
+        image = _np.empty((self.height, self.width, 3), dtype=_np.float32)
+        image[...] = _parse_color(self.background_color)
+        for layer, pixels in self.__layers.items():
+            if layer in self.__hidden_layers:
+                continue
+            image *= 1 - pixels[..., 3:]
+            image += pixels[..., :3]
+        return _np.rint(image * 255).astype(_np.uint8)
+
+    def get_size(self) -> tuple[int, int]:
+        return self.width - __class__.MARGIN, self.height - __class__.MARGIN
+
+    def draw_polyline(
+        self,
+        points: _CurvePoints,
+        polyline_width: int,
+        polyline_color: str,
+        drawing_speed: int,
+    ) -> None:
+        x, y = self.__to_pixels(points)
+        self.__draw_segments(
+            x[:-1], y[:-1], x[1:], y[1:], polyline_width, polyline_color
+        )
+
+    def draw_polylines(
+        self,
+        polylines: _Iterable[_CurvePoints],
+        polylines_width: int,
+        polylines_color: str,
+    ) -> None:
+        """Draws many polylines with the same style at once. Their segments are \
+        rasterized together, as if they were the segments of a single polyline, so \
+        where polylines overlap their coverage is not added up (see `draw_polyline()`).
+        """
+        segments = ([], [], [], [])
+        for points in polylines:
+            x, y = self.__to_pixels(points)
+            for coordinates, values in zip(segments, (x[:-1], y[:-1], x[1:], y[1:])):
+                coordinates.append(values)
+        if segments[0]:
+            self.__draw_segments(
+                *(_np.concatenate(coordinates) for coordinates in segments),
+                polylines_width,
+                polylines_color,
+            )
+
+    def __to_pixels(self, points: _CurvePoints) -> tuple["_np.ndarray", "_np.ndarray"]:
+        # Real points are centered and their y-axis points up, whereas pixels start at
+        # the top left corner and their y-axis points down
+        x = self.width / 2 + _as_numpy(points.x)
+        y = self.height / 2 - _as_numpy(points.y)
+        return x, y
+
+    def __draw_segments(
+        self,
+        x0: "_np.ndarray",
+        y0: "_np.ndarray",
+        x1: "_np.ndarray",
+        y1: "_np.ndarray",
+        width: int,
+        color: str,
+    ) -> None:
+        radius = max(width / 2, 0.5)
+
+        # Segments with a non-finite end are not drawn
+        finite = (
+            _np.isfinite(x0) & _np.isfinite(y0) & _np.isfinite(x1) & _np.isfinite(y1)
+        )
+        if not finite.all():
+            x0, y0, x1, y1 = x0[finite], y0[finite], x1[finite], y1[finite]
+        if not len(x0):
+            return
+
+        # Segments bounding box, clamped to the image
+        margin = radius + 1
+        left = max(_floor(min(x0.min(), x1.min()) - margin), 0)
+        top = max(_floor(min(y0.min(), y1.min()) - margin), 0)
+        right = min(_floor(max(x0.max(), x1.max()) + margin) + 1, self.width)
+        bottom = min(_floor(max(y0.max(), y1.max()) + margin) + 1, self.height)
+        if left >= right or top >= bottom:
+            return
+
+        # Parts of the segments farther than the margin from the bounding box cover no
+        # pixel of it, so they are clipped off before the segments are split into
+        # pieces (a segment to a far-off point would otherwise have countless pieces)
+        x0, y0, x1, y1, _ = _clip_segments(
+            x0,
+            y0,
+            x1,
+            y1,
+            (left - margin, top - margin, right + margin, bottom + margin),
+        )
+        if not len(x0):
+            return
+
+        # Coverage of each pixel of the bounding box by the segments. Segments overlap
+        # at their joints, so the coverage of a polyline is the maximum coverage of its
+        # segments (adding them would darken the joints).
+        coverage = _np.zeros((bottom - top, right - left), dtype=_np.float32)
+        self.__cover_segments(coverage, left, top, x0, y0, x1, y1, radius)
+
+        color = _np.append(_parse_color(color), 1)
+        region = self.__pixels[top:bottom, left:right]
+        region += (color - region) * coverage[..., None]
+
+    def __cover_segments(
+        self,
+        coverage: "_np.ndarray",
+        left: int,
+        top: int,
+        x0: "_np.ndarray",
+        y0: "_np.ndarray",
+        x1: "_np.ndarray",
+        y1: "_np.ndarray",
+        radius: float,
+    ) -> None:
+        # Segments are split into pieces no longer than `PIECE_LENGTH`, so the pixels
+        # around every piece fit in square windows of the same small size, and the
+        # coverage of the windows of many pieces is computed at once. The distance from a pixel
+        # to a segment is the minimum of its distances to the pieces of the segment, so
+        # splitting segments does not change their coverage.
+        dx, dy = x1 - x0, y1 - y0
+        pieces = _np.maximum(
+            _np.ceil(_np.maximum(abs(dx), abs(dy)) / __class__.PIECE_LENGTH), 1
+        ).astype(_np.intp)
+        segment = _np.repeat(_np.arange(len(pieces)), pieces)
+        piece = _np.arange(len(segment)) - _np.repeat(
+            _np.cumsum(pieces) - pieces, pieces
+        )
+        t0 = piece / pieces[segment]
+        t1 = (piece + 1) / pieces[segment]
+        dx, dy = dx[segment], dy[segment]
+        x0, x1 = x0[segment] + t0 * dx, x0[segment] + t1 * dx
+        y0, y1 = y0[segment] + t0 * dy, y0[segment] + t1 * dy
+        dx, dy = x1 - x0, y1 - y0
+        # Zero-length pieces are covered as a dot (dividing by 1 keeps t at 0)
+        length_2 = dx * dx + dy * dy
+        length_2[length_2 == 0] = 1
+
+        # Window of each piece, large enough for the longest one
+        margin = radius + 1
+        longest = max(abs(dx).max(), abs(dy).max())
+        size = _floor(longest + 2 * margin) + 2
+        window_left = _np.floor(_np.minimum(x0, x1) - margin).astype(_np.intp)
+        window_top = _np.floor(_np.minimum(y0, y1) - margin).astype(_np.intp)
+        offsets = _np.arange(size)
+
+        height, width = coverage.shape
+        flat_coverage = coverage.reshape(-1)
+        step = max(__class__.WINDOW_PIXELS // (size * size), 1)
+        for i in range(0, len(x0), step):
+            batch = slice(i, i + step)
+            columns = (window_left[batch, None] + offsets)[:, None, :]
+            rows = (window_top[batch, None] + offsets)[:, :, None]
+
+            # Distance from the center of each pixel to the piece
+            px = columns + 0.5 - x0[batch, None, None]
+            py = rows + 0.5 - y0[batch, None, None]
+            piece_dx = dx[batch, None, None]
+            piece_dy = dy[batch, None, None]
+            t = _np.clip(
+                (px * piece_dx + py * piece_dy) / length_2[batch, None, None], 0, 1
+            )
+            distance = _np.hypot(px - t * piece_dx, py - t * piece_dy)
+
+            # Pixels farther than the line radius are covered partially
+            # (anti-aliasing). Only covered pixels inside the bounding box are kept.
+            piece_coverage = _np.clip(radius + 0.5 - distance, 0, 1)
+            columns = columns - left
+            rows = rows - top
+            covered = (
+                (piece_coverage > 0)
+                & (columns >= 0)
+                & (columns < width)
+                & (rows >= 0)
+                & (rows < height)
+            )
+            indices = (rows * width + columns)[covered]
+            _np.maximum.at(flat_coverage, indices, piece_coverage[covered])
+
+    def draw_text(
+        self,
+        text: str,
+        point: _TRealPoint,
+        text_font: tuple[str, str, str],
+        text_color: str,
+        align: str,
+    ) -> None:
+        """Does nothing, text is not drawn by this backend."""
+        pass
+
+    def set_layer(self, layer: str) -> None:
+        self.__get_layer_pixels(layer)
+        self.__layer = layer
+
+    def clean_layer(self, layer: str) -> None:
+        if layer in self.__layers:
+            self.__layers[layer][...] = 0
+
+    def hide_layer(self, layer: str) -> None:
+        self.__hidden_layers.add(layer)
+
+    def show_layer(self, layer: str) -> None:
+        self.__hidden_layers.discard(layer)
+
+    def set_layer_order(self, layers: list[str]) -> None:
+        self.__layers = _reorder(self.__layers, layers)
+
+    def clean(self) -> None:
+        for pixels in self.__layers.values():
+            pixels[...] = 0
+
+    def wait(self) -> None:
+        """Saves the PNG image to `output`, if given."""
+        if self.output is not None:
+            self.save(self.output)
+
+    def to_png(self) -> bytes:
+        """Returns the image encoded as PNG."""
+        # Each scanline starts with its filter type (0, no filter)
+        scanlines = _np.zeros((self.height, 1 + 3 * self.width), dtype=_np.uint8)
+        scanlines[:, 1:] = self.pixels.reshape(self.height, -1)
+        header = _struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        return b"".join(
+            (
+                b"\x89PNG\r\n\x1a\n",
+                _png_chunk(b"IHDR", header),
+                _png_chunk(
+                    b"tEXt",
+                    b"Title\x00" + self.window_title.encode("latin-1", "replace"),
+                ),
+                _png_chunk(b"IDAT", _zlib.compress(scanlines.tobytes())),
+                _png_chunk(b"IEND", b""),
+            )
+        )
+
+    def save(self, output: _Union[str, _BinaryIO]) -> None:
+        """Writes the PNG image to the given file or buffer.
+
+        Parameters
+        ----------
+        output : str or BinaryIO
+            Path of the file, or binary buffer (e.g. a file opened in binary mode or \
+            `io.BytesIO`), to which the PNG image is written.
+        """
+        if isinstance(output, str):
+            with open(output, "wb") as file:
+                file.write(self.to_png())
+        else:
+            output.write(self.to_png())
+
+
+def _parse_color(color: str) -> "_np.ndarray":
+    hex_color = _COLOR_NAMES.get(color.lower(), color)
+    if hex_color.startswith("#") and len(hex_color) == 4:
+        hex_color = "#" + "".join(2 * c for c in hex_color[1:])
+    if not (hex_color.startswith("#") and len(hex_color) == 7):
+        raise ValueError(f"unsupported color {color!r}, expected a hex color code")
+    rgb = [int(hex_color[i : i + 2], 16) for i in (1, 3, 5)]
+    return _np.array(rgb, dtype=_np.float32) / 255
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    crc = _zlib.crc32(chunk_type + data)
+    return _struct.pack(">I", len(data)) + chunk_type + data + _struct.pack(">I", crc)
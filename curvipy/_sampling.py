@@ -0,0 +1,155 @@
+import heapq as _heapq
+
+from array import array as _array
+from operator import itemgetter as _itemgetter
+
+from typing import Callable as _Callable
+from typing import Union as _Union
+
+from ._evaluation import evaluate_function as _evaluate_function
+from ._parallel import ParallelEvaluation as _ParallelEvaluation
+
+_TNumber = _Union[int, float]
+
+
+class AdaptiveSampling:
+    """Defines how a function is adaptively sampled.
+
+    The interval values are used as a coarse grid. Then, each segment of the grid \
+    whose midpoint deviates from the straight line joining the segment ends by more \
+    than `tolerance` is split in two, and the process is repeated on the new segments. \
+    This way, straight stretches of the curve keep few samples while sharp bends are \
+    refined.
+
+    Parameters
+    ----------
+    tolerance : float or None
+        Maximum vertical distance between the curve and the plotted polyline, in \
+        pixels if `pixel_size` is given and in logical units (i.e. the curve \
+        coordinates) otherwise. If None, it defaults to `PIXEL_TOLERANCE` pixels or \
+        `LOGICAL_TOLERANCE` logical units. Defaults to None.
+    max_depth : int
+        Maximum number of times a segment of the coarse grid can be split. Defaults to 10.
+    max_samples : int
+        Maximum number of samples, including the coarse grid. Defaults to 10000.
+    pixel_size : tuple[float, float] or None
+        Logical width and height of a screen pixel, used to convert `tolerance` from \
+        pixels to logical units. It is set by `Function.for_resolution()` when the \
+        function is plotted, so a sampled function evaluated outside a `Plotter` (e.g. \
+        with `Function.points()`) keeps a tolerance in logical units. Defaults to None.
+    """
+
+    # Default tolerances, in pixels when the pixel size is known and in logical units
+    # otherwise
+    PIXEL_TOLERANCE = 0.5
+    LOGICAL_TOLERANCE = 0.01
+
+    def __init__(
+        self,
+        tolerance: float = None,
+        max_depth: int = 10,
+        max_samples: int = 10000,
+        pixel_size: tuple[float, float] = None,
+    ):
+        self.tolerance = tolerance
+        self.max_depth = max_depth
+        self.max_samples = max_samples
+        self.pixel_size = None if pixel_size is None else tuple(pixel_size)
+
+    def for_resolution(self, pixel_size: tuple[float, float]) -> "AdaptiveSampling":
+        """Returns a copy of the sampling whose `tolerance` is measured in pixels of \
+        the given size.
+
+        Parameters
+        ----------
+        pixel_size : tuple[float, float]
+            Logical width and height of a screen pixel.
+
+        Returns
+        -------
+        AdaptiveSampling
+            Sampling ready to be used at the given resolution.
+        """
+        if tuple(pixel_size) == self.pixel_size:
+            return self
+        return AdaptiveSampling(
+            self.tolerance, self.max_depth, self.max_samples, tuple(pixel_size)
+        )
+
+    def sample(
+        self,
+        function: _Callable[[_TNumber], _TNumber],
+        values: _array,
+        vectorize: bool = None,
+        parallel: _ParallelEvaluation = None,
+    ) -> tuple[_array, _array]:
+        """Evaluates `function` on the coarse grid `values` and refines it.
+
+        The segments whose midpoints deviate the most are split first, wherever they \
+        are, so when the `max_samples` budget runs out it has been spent on the \
+        sharpest bends of the whole curve. The midpoints of the new segments are \
+        evaluated together, with a single call to `function` when it is vectorized.
+
+        Parameters
+        ----------
+        function : Callable[[int or float], int or float]
+            Function to be sampled.
+        values : array.array
+            Coarse grid, e.g. `Interval.as_array()`.
+        vectorize : bool or None
+            See `Function` `vectorize` parameter. Defaults to None.
+        parallel : ParallelEvaluation or None
+            See `Function` `parallel` parameter. Defaults to None.
+
+        Returns
+        -------
+        tuple[array, array]
+            The x and y columns of the sampled points.
+        """
+        xs, ys = _evaluate_function(function, values, vectorize, parallel)
+        points = list(zip(xs, ys))
+        budget = self.max_samples - len(points)
+        tolerance = self.__logical_tolerance()
+
+        # Segments whose midpoint deviates more than the tolerance, as a heap of
+        # (-deviation, start, end, midpoint, depth) tuples, so the segment that deviates
+        # the most is popped first
+        heap = []
+        segments = [(points[i], points[i + 1], 1) for i in range(len(points) - 1)]
+        while segments and budget > 0:
+            midpoints = _array(
+                "d", ((start[0] + end[0]) / 2 for start, end, _ in segments)
+            )
+            _, midpoints_y = _evaluate_function(
+                function, midpoints, vectorize, parallel
+            )
+            for (start, end, depth), x, y in zip(segments, midpoints, midpoints_y):
+                deviation = abs(y - (start[1] + end[1]) / 2)
+                if deviation > tolerance:
+                    _heapq.heappush(heap, (-deviation, start, end, (x, y), depth))
+
+            # Split the segments that deviate the most, as many as the budget allows
+            segments = []
+            for _ in range(min(budget, len(heap))):
+                _, start, end, midpoint, depth = _heapq.heappop(heap)
+                points.append(midpoint)
+                budget -= 1
+                if depth < self.max_depth:
+                    segments += [
+                        (start, midpoint, depth + 1),
+                        (midpoint, end, depth + 1),
+                    ]
+
+        # Midpoints were appended out of order, but x values are monotonic
+        descending = len(values) > 1 and values[0] > values[-1]
+        points.sort(key=_itemgetter(0), reverse=descending)
+        return _array("d", (x for x, _ in points)), _array("d", (y for _, y in points))
+
+    def __logical_tolerance(self) -> float:
+        if self.pixel_size is None:
+            if self.tolerance is None:
+                return __class__.LOGICAL_TOLERANCE
+            return self.tolerance
+        if self.tolerance is None:
+            return __class__.PIXEL_TOLERANCE * self.pixel_size[1]
+        return self.tolerance * self.pixel_size[1]
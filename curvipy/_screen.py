@@ -1,20 +1,37 @@
-import turtle as _turtle
+from array import array as _array
 
-from math import sqrt as _sqrt
 from math import sin as _sin
 from math import cos as _cos
 from math import pi as _pi
+from math import atan2 as _atan2
 
+from typing import Iterable as _Iterable
+from typing import Optional as _Optional
 from typing import Union as _Union
 
+from ._backend import DrawingBackend as _DrawingBackend
+from ._backend import _arrow_endpoints
+from ._curve_points import CurvePoints as _CurvePoints
+from ._display_list import DisplayList as _DisplayList
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+from ._simplify import simplify_polyline as _simplify_polyline
+from ._clip import clip_polyline as _clip_polyline
+from ._clip import clip_segment as _clip_segment
+from ._clip import clip_segments as _clip_segments
+from ._clip import contains_point as _contains_point
+from ._clip import split_polyline as _split_polyline
+
 _TNumber = _Union[int, float]
 _TLogicalPoint = tuple[_TNumber, _TNumber]
 _TRealPoint = tuple[_TNumber, _TNumber]
+_TRectangle = tuple[_TNumber, _TNumber, _TNumber, _TNumber]
 
 
 class ScreenFacade:
     """Screen with a virtual system of coordinates for drawing figures such as lines, polylines, \
-    arrows and more. It encapsulates the turtle package functionalities. 
+    arrows and more. It translates logical points to real points and passes them to a \
+    drawing backend (see `DrawingBackend`), which does the actual drawing.
     
     `ScreenFacade` lets the users define a logical (or virtual) screen size by translating the given \
     logical points (a screen position with user virtual coordinates) to a real point (the actual \
@@ -22,70 +39,132 @@ class ScreenFacade:
 
     Parameters
     ----------
-    window_title : str
-        Title to display on window.
-    background_color : str
-        Background color. Can either be a name or a hex color code.
-    window_width : int or None
-        Width of the screen window (in pixels). If None, `window_width` equals to 50% of the \
-        display width.
-    window_height : int or None
-        Height of the screen window (in pixels). If None, `window_height` equals to 75% of \
-        the display height.
+    backend : DrawingBackend
+        Backend on which figures are drawn.
     logical_width : int
         Logical width of the screen. This is the width that the users of `ScreenFacade` class \
         will operate with.
-        While `window_width` is the real width of the screen, `logical_width` is a virtual \
+        While the backend width is the real width of the screen, `logical_width` is a virtual \
         representation of it.
     logical_height : int
         Logical height of the screen. This is the height that the users of `ScreenFacade` class \
         will operate with.
-        While `window_height` is the real height of the screen, `logical_height` is a virtual \
+        While the backend height is the real height of the screen, `logical_height` is a virtual \
         representation of it.
+    record_drawings : bool
+        If True, every drawing is recorded in the display list of its layer, so it can \
+        be redrawn (see `redraw()`) or replayed on another screen (see `replay()`). \
+        Defaults to True.
+
+    Attributes
+    ----------
+    layers : dict[str, DisplayList]
+        Drawings of each layer, in logical coordinates, from the bottom layer to the \
+        top one (see `set_layer()` and `set_layer_order()`).
+    layer : str
+        Layer of the next drawings.
+    hidden_layers : set[str]
+        Layers whose drawings are not shown (see `hide_layer()`).
     """
 
-    MIN_DRAWING_SPEED = 1
-    MAX_DRAWING_SPEED = 10
+    MIN_DRAWING_SPEED = _DrawingBackend.MIN_DRAWING_SPEED
+    MAX_DRAWING_SPEED = _DrawingBackend.MAX_DRAWING_SPEED
 
     def __init__(
         self,
-        window_title: str,
-        background_color: str,
-        window_width: int,
-        window_height: int,
+        backend: _DrawingBackend,
         logical_width: int,
         logical_height: int,
+        record_drawings: bool = True,
     ):
-        # Screen setup
-        self.__screen = _turtle.Screen()
-        if window_width and window_height:
-            self.__screen.setup(window_width, window_height)
-        self.__screen.clear()
-        self.__screen.title(window_title)
-        self.__screen.bgcolor(background_color)
-        self.background_color = background_color
-
+        self.backend = backend
         self.logical_width = logical_width
         self.logical_height = logical_height
-
-        # Pen setup
-        self.__pen = _turtle.Turtle(visible=False)
+        self.record_drawings = record_drawings
+        self.layers = {}
+        self.layer = self.backend.DEFAULT_LAYER
+        self.hidden_layers = set()
 
         # Performance attributes
-        self.__pen_width_cache = None
-        self.__pen_color_cache = None
+        # Number of points received and drawn by `draw_polyline`
+        self.polyline_points_in = 0
+        self.polyline_points_drawn = 0
+        # Logical to real scale. It is computed on first use and invalidated when the
+        # backend is resized, so translating points does not query the backend size.
+        self.__scale = None
+        self.backend.bind_resize(self.__invalidate_scale)
+
+    def __invalidate_scale(self) -> None:
+        self.__scale = None
+
+    def __record(self, opcode: int, points: _CurvePoints, *arguments) -> None:
+        if self.record_drawings:
+            layer_display_list = self.layers.setdefault(self.layer, _DisplayList())
+            layer_display_list.record(opcode, points, *arguments)
+
+    def __record_many(
+        self, opcode: int, x: "_np.ndarray", y: "_np.ndarray", arguments: list
+    ) -> None:
+        if self.record_drawings:
+            layer_display_list = self.layers.setdefault(self.layer, _DisplayList())
+            layer_display_list.record_many(opcode, x, y, arguments)
+
+    @property
+    def display_list(self) -> _DisplayList:
+        """Drawings of every visible layer, from the bottom layer to the top one."""
+        display_list = _DisplayList()
+        for layer, layer_display_list in self.layers.items():
+            if layer not in self.hidden_layers:
+                display_list.extend(layer_display_list)
+        return display_list
+
+    def set_layer(self, layer: str) -> None:
+        """Sets the layer of the next drawings. Layers are stacked in the order in \
+        which they are first used. Until this method is called, drawings are made on \
+        `DrawingBackend.DEFAULT_LAYER`.
 
-    def get_screen_size(self) -> tuple[int, int]:
-        """Returns the real width and height of the screen minus an offset.
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        self.layers.setdefault(layer, _DisplayList())
+        self.backend.set_layer(layer)
+        self.layer = layer
+
+    def flush(self) -> None:
+        """Shows every drawing made since the last repaint (see \
+        `DrawingBackend.flush()`)."""
+        self.backend.flush()
 
-        The offset is used to fix `turtle.Screen.window_width()` and \
-        `turtle.Screen.window_height()` precision.
+    def get_scale(self) -> tuple[float, float]:
+        """Returns the factors by which logical x and y coordinates are multiplied to \
+        get real coordinates.
+
+        The scale is cached until the window is resized.
         """
-        width_offset = 65
-        height_offset = 65
-        width = self.__screen.window_width()
-        height = self.__screen.window_height()
-        return width - width_offset, height - height_offset
+        if self.__scale is None:
+            real_width, real_height = self.get_screen_size()
+            self.__scale = (
+                real_width / self.logical_width,
+                real_height / self.logical_height,
+            )
+        return self.__scale
+
+    def get_screen_size(self) -> tuple[int, int]:
+        """Returns the real width and height of the drawing area of the backend."""
+        return self.backend.get_size()
+
+    def get_logical_rectangle(self) -> tuple[float, float, float, float]:
+        """Returns the logical rectangle `(x_min, y_min, x_max, y_max)` covered by \
+        the axes, centered at the origin."""
+        half_width, half_height = self.logical_width / 2, self.logical_height / 2
+        return -half_width, -half_height, half_width, half_height
+
+    def get_pixel_size(self) -> tuple[float, float]:
+        """Returns the logical width and height of a screen pixel."""
+        x_scale, y_scale = self.get_scale()
+        return 1 / x_scale, 1 / y_scale
 
     def get_real_point(self, logical_point: _TLogicalPoint) -> _TRealPoint:
         """Translates the given logical point to a real point.
@@ -100,39 +179,33 @@ class ScreenFacade:
         tuple[int or float, int or float]
             Translated real position.
         """
-        real_width, real_height = self.get_screen_size()
-        return (
-            logical_point[0] * (real_width / self.logical_width),
-            logical_point[1] * (real_height / self.logical_height),
-        )
+        x_scale, y_scale = self.get_scale()
+        return logical_point[0] * x_scale, logical_point[1] * y_scale
 
-    def goto_drawing(self, point: _TRealPoint, drawing_speed: int) -> None:
-        """Moves pen to the given real point leaving a trace.
+    def get_real_points(self, logical_points: _CurvePoints) -> _CurvePoints:
+        """Translates the given logical points to real points in a single pass over \
+        their coordinates buffers.
 
         Parameters
         ----------
-        point : tuple[int or float, int or float]
-            Point (real position) to which the pen will go leaving a trace.
-        drawing_speed : int
-            Speed at which the pen will move. Integer from 1 to 10.
-        """
-        self.__pen.down()
-        self.__pen.speed(drawing_speed)
-        self.__pen.goto(point)
-
-    def goto_without_drawing(self, point: _TRealPoint, drawing_speed: int) -> None:
-        """Moves pen to the given real point without leaving a trace.
+        logical_points : CurvePoints
+            Virtual positions to be translated.
 
-        Parameters
-        ----------
-        point : tuple[int or float, int or float]
-            Point (real position) to which the pen will go.
-        drawing_speed : int
-            Speed at which the pen will move. Integer from 1 to 10.
+        Returns
+        -------
+        CurvePoints
+            Translated real positions.
         """
-        self.__pen.up()
-        self.__pen.speed(drawing_speed)
-        self.__pen.goto(point)
+        x_scale, y_scale = self.get_scale()
+        if _np is not None:
+            return _CurvePoints(
+                _as_numpy(logical_points.x) * x_scale,
+                _as_numpy(logical_points.y) * y_scale,
+            )
+        return _CurvePoints(
+            _array("d", [x * x_scale for x in logical_points.x]),
+            _array("d", [y * y_scale for y in logical_points.y]),
+        )
 
     def draw_line(
         self,
@@ -141,6 +214,7 @@ class ScreenFacade:
         line_width: int,
         line_color: str,
         drawing_speed: int,
+        clip: bool = False,
     ) -> None:
         """Draws a line from start position to end position.
 
@@ -158,22 +232,32 @@ class ScreenFacade:
             Line color.
         drawing_speed : int
             Drawing speed. Integer from 1 to 10.
+        clip : bool
+            If True, the line is clipped to the logical rectangle of the screen (see \
+            `get_logical_rectangle()`). Defaults to False.
         """
-        # Pen setup
-        if line_width != self.__pen_width_cache:
-            self.__pen.width(line_width)
-            self.__pen_width_cache = line_width
-
-        if line_color != self.__pen_color_cache:
-            self.__pen.color(line_color)
-            self.__pen_color_cache = line_color
-
-        # Go to first line point without drawing
-        rstart_point = self.get_real_point(start_point)
-        self.goto_without_drawing(rstart_point, __class__.MAX_DRAWING_SPEED)
-        # Draw line
-        rend_point = self.get_real_point(end_point)
-        self.goto_drawing(rend_point, drawing_speed)
+        if clip:
+            visible_line = _clip_segment(
+                start_point, end_point, self.get_logical_rectangle()
+            )
+            if visible_line is None:
+                return
+            start_point, end_point = visible_line
+
+        self.__record(
+            _DisplayList.LINE,
+            (start_point, end_point),
+            line_width,
+            line_color,
+            drawing_speed,
+        )
+        self.backend.draw_line(
+            self.get_real_point(start_point),
+            self.get_real_point(end_point),
+            line_width,
+            line_color,
+            drawing_speed,
+        )
 
     def draw_polyline(
         self,
@@ -181,41 +265,345 @@ class ScreenFacade:
         polyline_width: int,
         polyline_color: str,
         drawing_speed: int,
+        simplify_tolerance: float = 0,
+        clip: bool = False,
     ) -> None:
-        """Draws a polyline by joining the given points.
+        """Draws a polyline by joining the given points. Points with infinite or NaN \
+        coordinates are not drawn: the polyline is split at them.
 
         Parameters
         ----------
-        points : list[tuple[int or float, int or float]]
-            List of the logical position of the polyline points.
+        points : CurvePoints or list[tuple[int or float, int or float]]
+            Logical position of the polyline points.
         polyline_width : int
             Polyline width.
         polyline_color : str
             Polyline color.
         drawing_speed : int
             Drawing speed. Integer from 1 to 10.
+        simplify_tolerance : float
+            If greater than 0, points closer than `simplify_tolerance` pixels to the \
+            polyline that joins the remaining points are not drawn (see \
+            `polyline_points_in` and `polyline_points_drawn`). Defaults to 0.
+        clip : bool
+            If True, the polyline is clipped to the logical rectangle of the screen (see \
+            `get_logical_rectangle()`) and only its visible pieces are drawn. Defaults \
+            to False.
+        """
+        points = _CurvePoints.from_points(points)
+        self.polyline_points_in += len(points)
+        self.__draw_logical_polyline(
+            points,
+            polyline_width,
+            polyline_color,
+            drawing_speed,
+            simplify_tolerance,
+            clip,
+        )
+
+    def draw_polyline_stream(
+        self,
+        chunks: _Iterable[_CurvePoints],
+        polyline_width: int,
+        polyline_color: str,
+        drawing_speed: int,
+        simplify_tolerance: float = 0,
+        clip: bool = False,
+    ) -> None:
+        """Draws a polyline whose points arrive in consecutive chunks (e.g. from \
+        `Curve.iter_points()`). Each chunk is drawn as soon as it is received and then \
+        discarded, so only one chunk is kept in memory. Streamed polylines are not \
+        recorded in `layers` (see `record_drawings`), so they are not drawn again by \
+        `redraw()`.
+
+        Parameters
+        ----------
+        chunks : Iterable[CurvePoints or list[tuple[int or float, int or float]]]
+            Chunks of the logical position of the polyline points.
+        polyline_width : int
+            Polyline width.
+        polyline_color : str
+            Polyline color.
+        drawing_speed : int
+            Drawing speed. Integer from 1 to 10.
+        simplify_tolerance : float
+            See `draw_polyline()`. Defaults to 0.
+        clip : bool
+            See `draw_polyline()`. Defaults to False.
+        """
+        last_point = None
+        for points in chunks:
+            points = _CurvePoints.from_points(points)
+            if not len(points):
+                continue
+            self.polyline_points_in += len(points)
+
+            # Join the chunk with the last point of the previous one
+            chunk = points if last_point is None else _prepend(last_point, points)
+            self.__draw_logical_polyline(
+                chunk,
+                polyline_width,
+                polyline_color,
+                drawing_speed,
+                simplify_tolerance,
+                clip,
+                record=False,
+            )
+            last_point = points[-1]
+
+    def __draw_logical_polyline(
+        self,
+        points: _CurvePoints,
+        polyline_width: int,
+        polyline_color: str,
+        drawing_speed: int,
+        simplify_tolerance: float,
+        clip: bool,
+        record: bool = True,
+    ) -> None:
+        # Points with non-finite coordinates cannot be drawn, so the polyline is split
+        # at them (clipping drops their segments too)
+        if clip:
+            runs = _clip_polyline(points, self.get_logical_rectangle())
+        else:
+            runs = _split_polyline(points)
+
+        for run in runs:
+            rpoints = self.get_real_points(run)
+            simplified_rpoints = _simplify_polyline(rpoints, simplify_tolerance)
+            if len(simplified_rpoints) < 2:
+                continue
+            self.polyline_points_drawn += len(simplified_rpoints)
+
+            if record:
+                if simplified_rpoints is not rpoints:
+                    run = self.__get_logical_points(simplified_rpoints)
+                self.__record(
+                    _DisplayList.POLYLINE,
+                    run,
+                    polyline_width,
+                    polyline_color,
+                    drawing_speed,
+                )
+            self.backend.draw_polyline(
+                simplified_rpoints, polyline_width, polyline_color, drawing_speed
+            )
+
+    def __get_logical_points(self, real_points: _CurvePoints) -> _CurvePoints:
+        x_scale, y_scale = self.get_scale()
+        if _np is not None:
+            return _CurvePoints(
+                _as_numpy(real_points.x) / x_scale, _as_numpy(real_points.y) / y_scale
+            )
+        return _CurvePoints(
+            _array("d", [x / x_scale for x in real_points.x]),
+            _array("d", [y / y_scale for y in real_points.y]),
+        )
+
+    def draw_vectors(
+        self,
+        tails: _CurvePoints,
+        heads: _CurvePoints,
+        arrow_size: int,
+        vectors_width: int,
+        vectors_color: str,
+        drawing_speed: int,
+        clip: bool = False,
+    ) -> None:
+        """Draws many vectors, i.e. a line from each tail to its head with an arrow \
+        `>` at the head, in a single pass.
+
+        Arrow angles are computed for all vectors at once. At `MAX_DRAWING_SPEED`, each \
+        vector (line and arrow) is drawn as a single polyline and all of them are passed \
+        to the backend at once (see `DrawingBackend.draw_polylines()`). When NumPy is \
+        installed, the lines (clipped or not), the polylines and the display list \
+        records are built as columns too, without a Python loop over the vectors.
+
+        Parameters
+        ----------
+        tails : CurvePoints or list[tuple[int or float, int or float]]
+            Logical position at which each vector starts.
+        heads : CurvePoints or list[tuple[int or float, int or float]]
+            Logical position at which each vector ends.
+        arrow_size : int
+            Size of the arrows.
+        vectors_width : int
+            Width of the vectors.
+        vectors_color : str
+            Color of the vectors.
+        drawing_speed : int
+            Drawing speed. Integer from 1 to 10.
+        clip : bool
+            If True, vectors are clipped to the logical rectangle of the screen (see \
+            `get_logical_rectangle()`), and arrows are only drawn if the vector head is \
+            inside of it. Defaults to False.
         """
-        # Pen setup
-        if polyline_width != self.__pen_width_cache:
-            self.__pen.width(polyline_width)
-            self.__pen_width_cache = polyline_width
-
-        if polyline_color != self.__pen_color_cache:
-            self.__pen.color(polyline_color)
-            self.__pen_color_cache = polyline_color
-
-        # Variables
-        rpoints = [self.get_real_point(point) for point in points]
-
-        # Go to first polyline point without drawing
-        self.__pen.speed(__class__.MAX_DRAWING_SPEED)
-        self.__pen.up()
-        self.__pen.goto(rpoints[0])
-        # Draw polyline
-        self.__pen.speed(drawing_speed)
-        self.__pen.down()
-        for rpoint in rpoints[1:]:
-            self.__pen.goto(rpoint)
+        tails, heads = _CurvePoints.from_points(tails), _CurvePoints.from_points(heads)
+        rectangle = self.get_logical_rectangle()
+
+        # Arrows (see `draw_arrow()`), computed for all vectors at once
+        rtails, rheads = self.get_real_points(tails), self.get_real_points(heads)
+        if _np is not None:
+            rheads_x, rheads_y = _as_numpy(rheads.x), _as_numpy(rheads.y)
+            angles = _np.arctan2(
+                rheads_y - _as_numpy(rtails.y), rheads_x - _as_numpy(rtails.x)
+            )
+            left_arrows = _CurvePoints(
+                rheads_x + arrow_size * _np.cos(angles + _pi * 5 / 4),
+                rheads_y + arrow_size * _np.sin(angles + _pi * 5 / 4),
+            )
+            right_arrows = _CurvePoints(
+                rheads_x + arrow_size * _np.cos(angles - _pi * 5 / 4),
+                rheads_y + arrow_size * _np.sin(angles - _pi * 5 / 4),
+            )
+        else:
+            angles = [
+                _atan2(hy - ty, hx - tx) for (tx, ty), (hx, hy) in zip(rtails, rheads)
+            ]
+            left_arrows = _CurvePoints.from_points(
+                (
+                    hx + arrow_size * _cos(a + _pi * 5 / 4),
+                    hy + arrow_size * _sin(a + _pi * 5 / 4),
+                )
+                for (hx, hy), a in zip(rheads, angles)
+            )
+            right_arrows = _CurvePoints.from_points(
+                (
+                    hx + arrow_size * _cos(a - _pi * 5 / 4),
+                    hy + arrow_size * _sin(a - _pi * 5 / 4),
+                )
+                for (hx, hy), a in zip(rheads, angles)
+            )
+
+        animated = drawing_speed < __class__.MAX_DRAWING_SPEED
+        if not animated and _np is not None:
+            self.__draw_vectors_numpy(
+                tails,
+                heads,
+                (left_arrows, rheads, right_arrows),
+                angles,
+                arrow_size,
+                vectors_width,
+                vectors_color,
+                drawing_speed,
+                rectangle if clip else None,
+            )
+            return
+
+        polylines = []
+        for i in range(len(tails)):
+            tail, head = tails[i], heads[i]
+            if tail == head:
+                continue
+
+            line, show_arrow = (tail, head), True
+            if clip:
+                line = _clip_segment(tail, head, rectangle)
+                if line is None:
+                    continue
+                show_arrow = _contains_point(head, rectangle)
+
+            if animated:
+                self.draw_line(*line, vectors_width, vectors_color, drawing_speed)
+                if show_arrow:
+                    self.draw_arrow(
+                        head,
+                        arrow_size,
+                        angles[i],
+                        vectors_width,
+                        vectors_color,
+                        __class__.MAX_DRAWING_SPEED,
+                    )
+                continue
+
+            self.__record(
+                _DisplayList.LINE, line, vectors_width, vectors_color, drawing_speed
+            )
+            rpoints = [self.get_real_point(point) for point in line]
+            if show_arrow:
+                self.__record(
+                    _DisplayList.ARROW,
+                    (head,),
+                    arrow_size,
+                    float(angles[i]),
+                    vectors_width,
+                    vectors_color,
+                    drawing_speed,
+                )
+                rpoints += [left_arrows[i], rheads[i], right_arrows[i]]
+            polylines.append(_CurvePoints.from_points(rpoints))
+
+        if polylines:
+            self.backend.draw_polylines(polylines, vectors_width, vectors_color)
+
+    def __draw_vectors_numpy(
+        self,
+        tails: _CurvePoints,
+        heads: _CurvePoints,
+        arrows: tuple[_CurvePoints, _CurvePoints, _CurvePoints],
+        angles: "_np.ndarray",
+        arrow_size: int,
+        vectors_width: int,
+        vectors_color: str,
+        drawing_speed: int,
+        rectangle: _Optional[_TRectangle],
+    ) -> None:
+        # Same as the loop of `draw_vectors()`, with every vector line (clipped or
+        # not), arrow and record computed as columns
+        tx, ty = _as_numpy(tails.x), _as_numpy(tails.y)
+        hx, hy = _as_numpy(heads.x), _as_numpy(heads.y)
+        if rectangle is None:
+            x0, y0, x1, y1 = tx, ty, hx, hy
+            shown = _np.arange(len(tx))
+            show_arrows = _np.ones(len(tx), dtype=bool)
+        else:
+            x0, y0, x1, y1, visible = _clip_segments(tx, ty, hx, hy, rectangle)
+            shown = _np.flatnonzero(visible)
+            x_min, y_min, x_max, y_max = rectangle
+            show_arrows = (
+                (x_min <= hx) & (hx <= x_max) & (y_min <= hy) & (hy <= y_max)
+            )[shown]
+
+        # Vectors whose tail is their head are not drawn
+        drawn = (tx[shown] != hx[shown]) | (ty[shown] != hy[shown])
+        x0, y0, x1, y1 = x0[drawn], y0[drawn], x1[drawn], y1[drawn]
+        shown, show_arrows = shown[drawn], show_arrows[drawn]
+        if not len(shown):
+            return
+
+        # Each vector is a polyline: its line, followed by its arrow (if shown)
+        rstarts = self.get_real_points(_CurvePoints(x0, y0))
+        rends = self.get_real_points(_CurvePoints(x1, y1))
+        lines_x = _np.column_stack((_as_numpy(rstarts.x), _as_numpy(rends.x)))
+        lines_y = _np.column_stack((_as_numpy(rstarts.y), _as_numpy(rends.y)))
+        with_arrows = shown[show_arrows]
+        arrows_x = _np.column_stack(
+            [lines_x[show_arrows]] + [_as_numpy(a.x)[with_arrows] for a in arrows]
+        )
+        arrows_y = _np.column_stack(
+            [lines_y[show_arrows]] + [_as_numpy(a.y)[with_arrows] for a in arrows]
+        )
+        polylines = [
+            *map(_CurvePoints, lines_x[~show_arrows], lines_y[~show_arrows]),
+            *map(_CurvePoints, arrows_x, arrows_y),
+        ]
+        self.backend.draw_polylines(polylines, vectors_width, vectors_color)
+
+        self.__record_many(
+            _DisplayList.LINE,
+            _np.column_stack((x0, x1)),
+            _np.column_stack((y0, y1)),
+            [(vectors_width, vectors_color, drawing_speed)] * len(shown),
+        )
+        self.__record_many(
+            _DisplayList.ARROW,
+            hx[with_arrows, None],
+            hy[with_arrows, None],
+            [
+                (arrow_size, angle, vectors_width, vectors_color, drawing_speed)
+                for angle in angles[with_arrows].tolist()
+            ],
+        )
 
     def draw_arrow(
         self,
@@ -243,39 +631,24 @@ class ScreenFacade:
         drawing_speed : int
             Drawing speed. Integer from 1 to 10.
         """
-        # Pen setup
-        self.__pen.width(arrow_width)
-        self.__pen.color(arrow_color)
-
-        # Variables setup
-        rpoint = self.get_real_point(point)
-
-        # Draw vector head
-        left_arrow = (
-            arrow_size * _cos(arrow_angle + _pi * 5 / 4),
-            arrow_size * _sin(arrow_angle + _pi * 5 / 4),
-        )
-        left_arrow_endpoint = (
-            rpoint[0] + left_arrow[0],
-            rpoint[1] + left_arrow[1],
-        )
-
-        self.goto_without_drawing(rpoint, __class__.MAX_DRAWING_SPEED)
-        self.goto_drawing(left_arrow_endpoint, drawing_speed)
-
-        right_arrow = (
-            arrow_size * _cos(arrow_angle - _pi * 5 / 4),
-            arrow_size * _sin(arrow_angle - _pi * 5 / 4),
+        self.__record(
+            _DisplayList.ARROW,
+            (point,),
+            arrow_size,
+            arrow_angle,
+            arrow_width,
+            arrow_color,
+            drawing_speed,
         )
-        right_arrow_endpoint = (
-            rpoint[0] + right_arrow[0],
-            rpoint[1] + right_arrow[1],
+        self.backend.draw_arrow(
+            self.get_real_point(point),
+            arrow_size,
+            arrow_angle,
+            arrow_width,
+            arrow_color,
+            drawing_speed,
         )
 
-        # Draw arrow left size
-        self.goto_without_drawing(rpoint, __class__.MAX_DRAWING_SPEED)
-        self.goto_drawing(right_arrow_endpoint, drawing_speed)
-
     def draw_text(
         self,
         text: str,
@@ -299,23 +672,180 @@ class ScreenFacade:
         align : str
             Text alignment.
         """
-        # Pen setup
-        if text_color != self.__pen_color_cache:
-            self.__pen.color(text_color)
-            self.__pen_color_cache = text_color
-
-        # Draw text
-        rpoint = self.get_real_point(point)
-        self.__pen.speed(__class__.MAX_DRAWING_SPEED)
-        self.__pen.up()
-        self.__pen.goto(rpoint)
-        self.__pen.write(text, move=False, align=align, font=text_font)
+        self.__record(_DisplayList.TEXT, (point,), text, text_font, text_color, align)
+        self.backend.draw_text(
+            text, self.get_real_point(point), text_font, text_color, align
+        )
+
+    def replay(self, display_list: _DisplayList) -> None:
+        """Draws the commands of the given display list (e.g. the `display_list` of \
+        another screen) at `MAX_DRAWING_SPEED`, translating their logical points to \
+        the current screen size. Lines, polylines and arrows are passed to the backend \
+        in batches of polylines with the same style (see \
+        `DrawingBackend.draw_polylines()`).
+
+        Parameters
+        ----------
+        display_list : DisplayList
+            Drawings to be replayed.
+        """
+        if self.record_drawings:
+            layer_display_list = self.layers.setdefault(self.layer, _DisplayList())
+            layer_display_list.extend(display_list)
+        self.__replay(display_list)
+
+    def __replay(self, display_list: _DisplayList) -> None:
+        batch, batch_style = [], None
+        for opcode, points, arguments in display_list:
+            if opcode == _DisplayList.TEXT:
+                text, text_font, text_color, align = arguments
+                self.__draw_polylines_batch(batch, batch_style)
+                batch = []
+                self.backend.draw_text(
+                    text, self.get_real_point(points[0]), text_font, text_color, align
+                )
+                continue
+
+            if opcode == _DisplayList.ARROW:
+                arrow_size, arrow_angle, width, color, _ = arguments
+                rpoint = self.get_real_point(points[0])
+                left_arrow_endpoint, right_arrow_endpoint = _arrow_endpoints(
+                    rpoint, arrow_size, arrow_angle
+                )
+                rpoints = _CurvePoints.from_points(
+                    (left_arrow_endpoint, rpoint, right_arrow_endpoint)
+                )
+            else:
+                width, color, _ = arguments
+                rpoints = self.get_real_points(points)
+
+            if (width, color) != batch_style:
+                self.__draw_polylines_batch(batch, batch_style)
+                batch, batch_style = [], (width, color)
+            batch.append(rpoints)
+
+        self.__draw_polylines_batch(batch, batch_style)
+
+    def __draw_polylines_batch(
+        self, polylines: list[_CurvePoints], style: tuple[int, str]
+    ) -> None:
+        if polylines:
+            self.backend.draw_polylines(polylines, *style)
+
+    def redraw(self) -> None:
+        """Removes all drawings from screen and draws them again from `layers`, at \
+        the current screen size (e.g. after the window has been resized)."""
+        self.backend.clean()
+        for layer, display_list in self.layers.items():
+            # Backends without layers cannot hide drawings, so hidden layers are not
+            # drawn at all
+            if layer in self.hidden_layers and not self.backend.SUPPORTS_LAYERS:
+                continue
+            self.backend.set_layer(layer)
+            self.__replay(display_list)
+        self.backend.set_layer(self.layer)
+
+    def clean_layer(self, layer: str) -> None:
+        """Removes the drawings of the given layer. If the backend does not support \
+        layers (see `DrawingBackend.SUPPORTS_LAYERS`), every drawing is removed and \
+        the other layers are redrawn.
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        if layer not in self.layers:
+            return
+        self.layers[layer] = _DisplayList()
+        if self.backend.SUPPORTS_LAYERS:
+            self.backend.clean_layer(layer)
+        else:
+            self.redraw()
+
+    def hide_layer(self, layer: str) -> None:
+        """Hides the drawings of the given layer, including the ones made after this \
+        method is called, until `show_layer()` is called. If the backend does not \
+        support layers, every drawing is removed and the visible layers are redrawn \
+        (drawings made on a hidden layer are then shown until the next redraw).
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        if layer in self.hidden_layers:
+            return
+        self.hidden_layers.add(layer)
+        if self.backend.SUPPORTS_LAYERS:
+            self.backend.hide_layer(layer)
+        elif layer in self.layers:
+            self.redraw()
+
+    def show_layer(self, layer: str) -> None:
+        """Shows the drawings of the given layer (see `hide_layer()`).
+
+        Parameters
+        ----------
+        layer : str
+            Layer name.
+        """
+        if layer not in self.hidden_layers:
+            return
+        self.hidden_layers.remove(layer)
+        if self.backend.SUPPORTS_LAYERS:
+            self.backend.show_layer(layer)
+        elif layer in self.layers:
+            self.redraw()
+
+    def set_layer_order(self, layers: list[str]) -> None:
+        """Stacks the given layers in the given order, from the bottom to the top. \
+        The given layers swap places among themselves, so the other layers keep their \
+        place (e.g. `set_layer_order(["b", "a"])` swaps layers "a" and "b"). If the \
+        backend does not support layers, every drawing is removed and the visible \
+        layers are redrawn.
+
+        Parameters
+        ----------
+        layers : list[str]
+            Layer names, from the bottom layer to the top one.
+        """
+        unknown_layers = [layer for layer in layers if layer not in self.layers]
+        if unknown_layers:
+            raise ValueError(f"unknown layers {unknown_layers}")
+        if len(set(layers)) != len(layers):
+            raise ValueError("layers must not be repeated")
+
+        order = list(self.layers)
+        positions = sorted(order.index(layer) for layer in layers)
+        for position, layer in zip(positions, layers):
+            order[position] = layer
+        if order == list(self.layers):
+            return
+
+        self.layers = {layer: self.layers[layer] for layer in order}
+        if self.backend.SUPPORTS_LAYERS:
+            self.backend.set_layer_order(order)
+        else:
+            self.redraw()
 
     def clean(self) -> None:
         """Removes all drawings from screen."""
-        self.__screen.clear()
-        self.__screen.bgcolor(self.background_color)
+        self.backend.clean()
+        for layer in self.layers:
+            self.layers[layer] = _DisplayList()
 
-    def exit_on_click(self):
-        """Exits screen when clicked."""
-        self.__screen.exitonclick()
+    def wait(self) -> None:
+        """Called once every drawing has been made (see `DrawingBackend.wait()`)."""
+        self.backend.wait()
+
+
+def _prepend(point: _TLogicalPoint, points: _CurvePoints) -> _CurvePoints:
+    if _np is not None:
+        return _CurvePoints(
+            _np.concatenate(([point[0]], _as_numpy(points.x))),
+            _np.concatenate(([point[1]], _as_numpy(points.y))),
+        )
+    return _CurvePoints(
+        _array("d", [point[0]]) + points.x, _array("d", [point[1]]) + points.y
+    )
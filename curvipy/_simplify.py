@@ -0,0 +1,95 @@
+from array import array as _array
+from math import hypot as _hypot
+
+from ._curve_points import CurvePoints as _CurvePoints
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+
+
+def simplify_polyline(points: _CurvePoints, tolerance: float) -> _CurvePoints:
+    """Simplifies a polyline with the Ramer–Douglas–Peucker algorithm.
+
+    Points whose distance to the simplified polyline (i.e. to its segments, not to \
+    the lines through them) is at most `tolerance` are dropped. The first and last points are always kept. The algorithm runs in \
+    `O(n log n)` for typical curves (`O(n^2)` in the worst case), and distances to \
+    each segment are computed with NumPy when it is installed.
+
+    Parameters
+    ----------
+    points : CurvePoints
+        Polyline points.
+    tolerance : float
+        Maximum distance between a dropped point and the simplified polyline, in the \
+        same units as the points (e.g. pixels for real points).
+
+    Returns
+    -------
+    CurvePoints
+        Simplified polyline points.
+    """
+    if len(points) < 3 or tolerance <= 0:
+        return points
+    if _np is not None:
+        return _simplify_numpy(points, tolerance)
+    return _simplify_python(points, tolerance)
+
+
+def _simplify_numpy(points: _CurvePoints, tolerance: float) -> _CurvePoints:
+    x, y = _as_numpy(points.x), _as_numpy(points.y)
+    keep = _np.zeros(len(x), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, len(x) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        dx, dy = x[last] - x[first], y[last] - y[first]
+        px, py = x[first + 1 : last] - x[first], y[first + 1 : last] - y[first]
+        # Distance to the segment (not to the line through it), so points that fold
+        # back beyond its ends are kept
+        length_2 = dx * dx + dy * dy
+        if length_2:
+            t = _np.clip((px * dx + py * dy) / length_2, 0, 1)
+            distances = _np.hypot(px - t * dx, py - t * dy)
+        else:
+            distances = _np.hypot(px, py)
+        farthest = int(_np.argmax(distances))
+        if distances[farthest] > tolerance:
+            middle = first + 1 + farthest
+            keep[middle] = True
+            stack.append((first, middle))
+            stack.append((middle, last))
+
+    return _CurvePoints(x[keep], y[keep])
+
+
+def _simplify_python(points: _CurvePoints, tolerance: float) -> _CurvePoints:
+    x, y = points.x, points.y
+    keep = [False] * len(x)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, len(x) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        x0, y0 = x[first], y[first]
+        dx, dy = x[last] - x0, y[last] - y0
+        length_2 = dx * dx + dy * dy
+        farthest, max_distance = first, -1.0
+        for i in range(first + 1, last):
+            px, py = x[i] - x0, y[i] - y0
+            t = min(max((px * dx + py * dy) / length_2, 0), 1) if length_2 else 0
+            distance = _hypot(px - t * dx, py - t * dy)
+            if distance > max_distance:
+                farthest, max_distance = i, distance
+        if max_distance > tolerance:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+
+    return _CurvePoints(
+        _array("d", (value for value, kept in zip(x, keep) if kept)),
+        _array("d", (value for value, kept in zip(y, keep) if kept)),
+    )
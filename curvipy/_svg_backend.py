@@ -0,0 +1,182 @@
+from typing import TextIO as _TextIO
+from typing import Union as _Union
+
+from xml.sax.saxutils import escape as _escape
+from xml.sax.saxutils import quoteattr as _quoteattr
+
+from ._backend import DrawingBackend as _DrawingBackend
+from ._backend import _reorder
+from ._curve_points import CurvePoints as _CurvePoints
+
+_TNumber = _Union[int, float]
+_TRealPoint = tuple[_TNumber, _TNumber]
+
+
+class SVGBackend(_DrawingBackend):
+    """Drawing backend that renders to an SVG document. It needs no display, so it \
+    can be used on headless machines, and since drawings are not animated, plots are \
+    rendered in milliseconds.
+
+    Each layer is a group (`<g>` element) of the document. Hidden layers are kept in \
+    the document, but not displayed.
+
+    The document is kept in memory: `to_svg()` returns it and `save()` writes it to a \
+    file or buffer. If `output` is given, the document is saved to it when \
+    `Plotter.wait()` is called.
+
+    Parameters
+    ----------
+    window_title : str
+        Title of the SVG document.
+    background_color : str
+        Background color. Can either be a name or a hex color code.
+    width : int or None
+        Width of the SVG document (in pixels). If None, `width` equals to \
+        `DEFAULT_WIDTH`.
+    height : int or None
+        Height of the SVG document (in pixels). If None, `height` equals to \
+        `DEFAULT_HEIGHT`.
+    output : str or TextIO or None
+        Path of the file, or text buffer, to which the SVG document is saved by \
+        `Plotter.wait()`. Defaults to None.
+    """
+
+    SUPPORTS_LAYERS = True
+
+    DEFAULT_WIDTH = 800
+    DEFAULT_HEIGHT = 600
+
+    # Size of the margin between the drawing area and the document borders, the same
+    # as the one of `TurtleBackend`, so both backends produce the same layout
+    MARGIN = 65
+
+    def __init__(
+        self,
+        window_title: str,
+        background_color: str,
+        width: int = None,
+        height: int = None,
+        output: _Union[str, _TextIO] = None,
+    ):
+        self.window_title = window_title
+        self.background_color = background_color
+        self.width = width or __class__.DEFAULT_WIDTH
+        self.height = height or __class__.DEFAULT_HEIGHT
+        self.output = output
+        # Elements of each layer, from the bottom layer to the top one
+        self.__layers = {}
+        self.__layer = __class__.DEFAULT_LAYER
+        self.__hidden_layers = set()
+
+    @property
+    def __elements(self) -> list[str]:
+        # Elements of the current layer. Layers are created on first use.
+        return self.__layers.setdefault(self.__layer, [])
+
+    def __to_svg_point(self, point: _TRealPoint) -> str:
+        # Real points are centered and their y-axis points up, whereas SVG points
+        # start at the top left corner and their y-axis points down
+        return "%.2f,%.2f" % (self.width / 2 + point[0], self.height / 2 - point[1])
+
+    def get_size(self) -> tuple[int, int]:
+        return self.width - __class__.MARGIN, self.height - __class__.MARGIN
+
+    def draw_polyline(
+        self,
+        points: _CurvePoints,
+        polyline_width: int,
+        polyline_color: str,
+        drawing_speed: int,
+    ) -> None:
+        svg_points = " ".join(self.__to_svg_point(point) for point in points)
+        self.__elements.append(
+            f'<polyline points="{svg_points}" fill="none" '
+            f"stroke={_quoteattr(polyline_color)} stroke-width="
+            f'"{polyline_width}" stroke-linecap="round" stroke-linejoin="round"/>'
+        )
+
+    def draw_text(
+        self,
+        text: str,
+        point: _TRealPoint,
+        text_font: tuple[str, str, str],
+        text_color: str,
+        align: str,
+    ) -> None:
+        font_name, font_size, font_type = text_font
+        x, y = self.__to_svg_point(point).split(",")
+        anchor = {"left": "start", "center": "middle", "right": "end"}[align]
+        weight = "bold" if "bold" in font_type else "normal"
+        style = "italic" if "italic" in font_type else "normal"
+        self.__elements.append(
+            f'<text x="{x}" y="{y}" font-family={_quoteattr(font_name)} '
+            f'font-size="{font_size}pt" font-weight="{weight}" font-style="{style}" '
+            f'fill={_quoteattr(text_color)} text-anchor="{anchor}">'
+            f"{_escape(text)}</text>"
+        )
+
+    def set_layer(self, layer: str) -> None:
+        self.__layers.setdefault(layer, [])
+        self.__layer = layer
+
+    def clean_layer(self, layer: str) -> None:
+        if layer in self.__layers:
+            self.__layers[layer].clear()
+
+    def hide_layer(self, layer: str) -> None:
+        self.__hidden_layers.add(layer)
+
+    def show_layer(self, layer: str) -> None:
+        self.__hidden_layers.discard(layer)
+
+    def set_layer_order(self, layers: list[str]) -> None:
+        self.__layers = _reorder(self.__layers, layers)
+
+    def clean(self) -> None:
+        for elements in self.__layers.values():
+            elements.clear()
+
+    def wait(self) -> None:
+        """Saves the SVG document to `output`, if given."""
+        if self.output is not None:
+            self.save(self.output)
+
+    def to_svg(self) -> str:
+        """Returns the SVG document with every drawing made so far."""
+        return "\n".join(
+            (
+                f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" '
+                f'height="{self.height}" viewBox="0 0 {self.width} {self.height}">',
+                f"<title>{_escape(self.window_title)}</title>",
+                f'<rect width="100%" height="100%" '
+                f"fill={_quoteattr(self.background_color)}/>",
+                *(
+                    element
+                    for layer, elements in self.__layers.items()
+                    for element in (
+                        f"<g id={_quoteattr(layer)}"
+                        + (
+                            ' display="none">' if layer in self.__hidden_layers else ">"
+                        ),
+                        *elements,
+                        "</g>",
+                    )
+                ),
+                "</svg>\n",
+            )
+        )
+
+    def save(self, output: _Union[str, _TextIO]) -> None:
+        """Writes the SVG document to the given file or buffer.
+
+        Parameters
+        ----------
+        output : str or TextIO
+            Path of the file, or text buffer (e.g. an open file or `io.StringIO`), to \
+            which the SVG document is written.
+        """
+        if isinstance(output, str):
+            with open(output, "w", encoding="utf-8") as file:
+                file.write(self.to_svg())
+        else:
+            output.write(self.to_svg())
@@ -0,0 +1,358 @@
+import turtle as _turtle
+
+from typing import Callable as _Callable
+from typing import Iterable as _Iterable
+from typing import Union as _Union
+
+from ._backend import DrawingBackend as _DrawingBackend
+from ._backend import _arrow_endpoints
+from ._backend import _reorder
+from ._curve_points import CurvePoints as _CurvePoints
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+from ._pen import PenState as _PenState
+
+_TNumber = _Union[int, float]
+_TRealPoint = tuple[_TNumber, _TNumber]
+
+
+class TurtleBackend(_DrawingBackend):
+    """Drawing backend that draws on a window with the turtle package. This is the \
+    default backend of `Plotter`.
+
+    Each layer has its own pen, and the canvas items drawn without the pen are tagged \
+    with the layer name, so the drawings of a layer can be removed on their own. Layers \
+    are hidden and stacked by tagging the items of their pen too, and then \
+    configuring and raising the items of each tag.
+
+    Parameters
+    ----------
+    window_title : str
+        Title to display on window.
+    background_color : str
+        Background color. Can either be a name or a hex color code.
+    window_width : int or None
+        Width of the screen window (in pixels). If None, `window_width` equals to 50% of the \
+        display width.
+    window_height : int or None
+        Height of the screen window (in pixels). If None, `window_height` equals to 75% of \
+        the display height.
+    instant_render : bool
+        If True, turtle animation is turned off and drawings are only shown on screen \
+        when `flush()` is called (or every `frame_interval` drawing operations). \
+        Defaults to False.
+    frame_interval : int
+        When `instant_render` is True, number of drawing operations between screen \
+        repaints. If 0, the screen is only repainted by `flush()`. Defaults to 0.
+    """
+
+    SUPPORTS_LAYERS = True
+    SUPPORTS_TIMERS = True
+
+    def __init__(
+        self,
+        window_title: str,
+        background_color: str,
+        window_width: int,
+        window_height: int,
+        instant_render: bool = False,
+        frame_interval: int = 0,
+    ):
+        # Screen setup
+        self.__screen = _turtle.Screen()
+        if window_width and window_height:
+            self.__screen.setup(window_width, window_height)
+        self.__screen.clear()
+        self.__screen.title(window_title)
+        self.__screen.bgcolor(background_color)
+        self.background_color = background_color
+
+        # Render mode setup
+        self.instant_render = instant_render
+        self.frame_interval = frame_interval
+        self.__setup_render_mode()
+
+        # Layers setup. Each layer has its own pen. Layers are sorted from the bottom
+        # layer to the top one.
+        self.__layers = {}
+        self.__layer = __class__.DEFAULT_LAYER
+        self.__hidden_layers = set()
+        # Whether canvas items must be restacked (see `__restack()`)
+        self.__restack_pending = False
+
+    def __setup_render_mode(self) -> None:
+        if self.instant_render:
+            self.__screen.tracer(self.frame_interval, 0)
+
+    def __get_layer_pen(self, layer: str) -> _PenState:
+        # Layers are created on first use
+        if layer not in self.__layers:
+            self.__layers[layer] = _PenState(_turtle.Turtle(visible=False))
+        return self.__layers[layer]
+
+    @property
+    def __pen(self) -> _PenState:
+        return self.__get_layer_pen(self.__layer)
+
+    @property
+    def pen_state(self) -> _PenState:
+        """Pen of the current layer, used for animated drawings and text. Its `issued` \
+        and `suppressed` attributes count the pen state changes forwarded to turtle \
+        and dropped."""
+        return self.__pen
+
+    def set_layer(self, layer: str) -> None:
+        self.__get_layer_pen(layer)
+        # Drawings of the previous layer are restacked once it is done with
+        self.__restack()
+        self.__layer = layer
+        self.__restack_pending = self.__is_layer_misplaced()
+
+    def clean_layer(self, layer: str) -> None:
+        if layer not in self.__layers:
+            return
+        self.__layers[layer].clear()
+        self.__screen.getcanvas().delete(_layer_tag(layer))
+        self.__update()
+
+    def hide_layer(self, layer: str) -> None:
+        self.__hidden_layers.add(layer)
+        self.__restack_pending = True
+        self.__update()
+
+    def show_layer(self, layer: str) -> None:
+        self.__hidden_layers.discard(layer)
+        self.__restack_pending = True
+        self.__update()
+
+    def set_layer_order(self, layers: list[str]) -> None:
+        self.__layers = _reorder(self.__layers, layers)
+        self.__restack_pending = True
+        self.__update()
+
+    def __is_layer_misplaced(self) -> bool:
+        # New canvas items are drawn on top of the others and are not hidden, so the
+        # drawings of the current layer must be restacked unless it is the top visible
+        # layer. Layers are created on top of the others on first use.
+        if self.__layer in self.__hidden_layers:
+            return True
+        return self.__layer in self.__layers and self.__layer != next(
+            reversed(self.__layers)
+        )
+
+    def __restack(self) -> None:
+        # Tags the items drawn by the pen of each layer, raises the items of each layer
+        # from the bottom layer to the top one and hides the items of hidden layers
+        if not self.__restack_pending:
+            return
+        canvas = self.__screen.getcanvas()
+        for layer, pen in self.__layers.items():
+            tag = _layer_tag(layer)
+            for item in pen.items:
+                canvas.addtag_withtag(tag, item)
+            canvas.tag_raise(tag)
+            state = "hidden" if layer in self.__hidden_layers else "normal"
+            canvas.itemconfigure(tag, state=state)
+        self.__restack_pending = self.__is_layer_misplaced()
+
+    def get_size(self) -> tuple[int, int]:
+        """Returns the real width and height of the screen minus an offset.
+
+        The offset is used to fix `turtle.Screen.window_width()` and \
+        `turtle.Screen.window_height()` precision.
+        """
+        width_offset = 65
+        height_offset = 65
+        width = self.__screen.window_width()
+        height = self.__screen.window_height()
+        return width - width_offset, height - height_offset
+
+    def bind_resize(self, callback: _Callable[[], None]) -> None:
+        self.__screen.getcanvas().bind("<Configure>", lambda event: callback(), add="+")
+
+    def goto_drawing(self, point: _TRealPoint, drawing_speed: int) -> None:
+        """Moves pen to the given real point leaving a trace.
+
+        Parameters
+        ----------
+        point : tuple[int or float, int or float]
+            Point (real position) to which the pen will go leaving a trace.
+        drawing_speed : int
+            Speed at which the pen will move. Integer from 1 to 10.
+        """
+        self.__pen.down()
+        self.__pen.speed(drawing_speed)
+        self.__pen.goto(point)
+
+    def goto_without_drawing(self, point: _TRealPoint, drawing_speed: int) -> None:
+        """Moves pen to the given real point without leaving a trace.
+
+        Parameters
+        ----------
+        point : tuple[int or float, int or float]
+            Point (real position) to which the pen will go.
+        drawing_speed : int
+            Speed at which the pen will move. Integer from 1 to 10.
+        """
+        self.__pen.up()
+        self.__pen.speed(drawing_speed)
+        self.__pen.goto(point)
+
+    def draw_line(
+        self,
+        start_point: _TRealPoint,
+        end_point: _TRealPoint,
+        line_width: int,
+        line_color: str,
+        drawing_speed: int,
+    ) -> None:
+        # Pen setup
+        self.__pen.width(line_width)
+        self.__pen.color(line_color)
+
+        # Go to first line point without drawing
+        self.goto_without_drawing(start_point, __class__.MAX_DRAWING_SPEED)
+        # Draw line
+        self.goto_drawing(end_point, drawing_speed)
+
+    def draw_polyline(
+        self,
+        points: _CurvePoints,
+        polyline_width: int,
+        polyline_color: str,
+        drawing_speed: int,
+    ) -> None:
+        """Draws a polyline by joining the given points. At `MAX_DRAWING_SPEED` the \
+        polyline is not animated: it is drawn at once as a single canvas line."""
+        if drawing_speed >= __class__.MAX_DRAWING_SPEED:
+            self.__draw_canvas_line(points, polyline_width, polyline_color)
+            self.__update()
+            return
+
+        # Pen setup
+        self.__pen.width(polyline_width)
+        self.__pen.color(polyline_color)
+
+        # Go to first polyline point without drawing
+        self.__pen.speed(__class__.MAX_DRAWING_SPEED)
+        self.__pen.up()
+        self.__pen.goto(points[0])
+        # Draw polyline
+        self.__pen.speed(drawing_speed)
+        self.__pen.down()
+        for point in points[1:]:
+            self.__pen.goto(point)
+
+    def draw_polylines(
+        self,
+        polylines: _Iterable[_CurvePoints],
+        polylines_width: int,
+        polylines_color: str,
+    ) -> None:
+        """Draws many polylines as canvas lines, updating the screen only once."""
+        for points in polylines:
+            self.__draw_canvas_line(points, polylines_width, polylines_color)
+        self.__update()
+
+    def __draw_canvas_line(
+        self, points: _CurvePoints, line_width: int, line_color: str
+    ) -> None:
+        # Skips turtle (and its animation, undo buffer and per segment canvas items) by
+        # creating a single line item on the underlying Tk canvas. Canvas coordinates are
+        # turtle coordinates scaled by the screen world scale, with the y-axis flipped.
+        x_scale, y_scale = self.__screen.xscale, -self.__screen.yscale
+        if _np is not None:
+            coordinates = _np.empty(2 * len(points))
+            coordinates[0::2] = _as_numpy(points.x) * x_scale
+            coordinates[1::2] = _as_numpy(points.y) * y_scale
+            coordinates = coordinates.tolist()
+        else:
+            coordinates = [c for x, y in points for c in (x * x_scale, y * y_scale)]
+
+        self.__screen.getcanvas().create_line(
+            coordinates,
+            fill=line_color,
+            width=line_width,
+            capstyle="round",
+            joinstyle="round",
+            tags=(_layer_tag(self.__layer),),
+        )
+
+    def __update(self) -> None:
+        if not self.instant_render:
+            self.__restack()
+            self.__screen.update()
+
+    def draw_arrow(
+        self,
+        point: _TRealPoint,
+        arrow_size: int,
+        arrow_angle: _TNumber,
+        arrow_width: int,
+        arrow_color: str,
+        drawing_speed: int,
+    ) -> None:
+        # Pen setup
+        self.__pen.width(arrow_width)
+        self.__pen.color(arrow_color)
+
+        # Draw arrow sides
+        left_arrow_endpoint, right_arrow_endpoint = _arrow_endpoints(
+            point, arrow_size, arrow_angle
+        )
+        self.goto_without_drawing(point, __class__.MAX_DRAWING_SPEED)
+        self.goto_drawing(left_arrow_endpoint, drawing_speed)
+        self.goto_without_drawing(point, __class__.MAX_DRAWING_SPEED)
+        self.goto_drawing(right_arrow_endpoint, drawing_speed)
+
+    def draw_text(
+        self,
+        text: str,
+        point: _TRealPoint,
+        text_font: tuple[str, str, str],
+        text_color: str,
+        align: str,
+    ) -> None:
+        # Pen setup
+        self.__pen.color(text_color)
+
+        # Draw text
+        self.__pen.speed(__class__.MAX_DRAWING_SPEED)
+        self.__pen.up()
+        self.__pen.goto(point)
+        self.__pen.write(text, move=False, align=align, font=text_font)
+
+    def clean(self) -> None:
+        self.__screen.clear()
+        self.__screen.bgcolor(self.background_color)
+
+        # `turtle.Screen.clear()` resets the tracer and unregisters the pen, so that
+        # screen updates would no longer draw the pen lines
+        self.__setup_render_mode()
+        for pen in self.__layers.values():
+            pen.reset(_turtle.Turtle(visible=False))
+
+    def ontimer(self, callback: _Callable[[], None], delay: int) -> None:
+        """Calls the given function after the given delay (see \
+        `turtle.Screen.ontimer()`). The function is called by the Tk event loop, e.g. \
+        while `wait()` waits."""
+        self.__screen.ontimer(callback, delay)
+
+    def process_events(self) -> None:
+        """Processes the pending Tk events, e.g. window repaints and resizes."""
+        self.__screen.getcanvas().update()
+
+    def flush(self) -> None:
+        """Repaints the screen, showing every drawing made since the last repaint. \
+        Only needed when `instant_render` is True."""
+        self.__restack()
+        self.__screen.update()
+
+    def wait(self) -> None:
+        """Exits screen when clicked."""
+        self.__screen.exitonclick()
+
+
+def _layer_tag(layer: str) -> str:
+    # Tag of the canvas items drawn on the given layer
+    return f"curvipy-layer-{layer}"
@@ -1,7 +1,17 @@
 import math as _math
 
+from array import array as _array
+
+from typing import Callable as _Callable
+from typing import Iterable as _Iterable
+from typing import Iterator as _Iterator
+from typing import Sequence as _Sequence
 from typing import Union as _Union
 
+from ._curve_points import CurvePoints as _CurvePoints
+from ._compat import np as _np
+from ._compat import as_numpy as _as_numpy
+
 _TNumber = _Union[int, float]
 _TPoint = tuple[_TNumber, _TNumber]
 _TVector = tuple[_TNumber, _TNumber]
@@ -13,6 +23,9 @@ class Vector:
         .. math::
             \\vec{v} = (v_1, v_2)
 
+    Components are computed when the head or the tail is set, while the norm and the \
+    angle are computed the first time they are accessed and then cached.
+
     Attributes
     ----------
     head : tuple[int or float, int or float]
@@ -21,23 +34,68 @@ class Vector:
         Two-dimensional point at which the vector starts.
     """
 
+    __slots__ = ("__head", "__tail", "__components", "__norm", "__angle")
+
     def __init__(
         self,
         head: _TPoint,
         tail: _TPoint = (0, 0),
     ):
-        self.head = head
-        self.tail = tail
+        self.__head = head
+        self.__tail = tail
+        self.__update()
+
+    @classmethod
+    def _from_components(
+        cls, x: _TNumber, y: _TNumber, tail: _TPoint = (0, 0)
+    ) -> "Vector":
+        # Builds a vector from already computed components, without the head-tail
+        # subtraction done by `__init__`.
+        vector = cls.__new__(cls)
+        vector.__head = (tail[0] + x, tail[1] + y)
+        vector.__tail = tail
+        vector.__components = (x, y)
+        vector.__norm = vector.__angle = None
+        return vector
+
+    def __update(self) -> None:
+        self.__components = (
+            self.__head[0] - self.__tail[0],
+            self.__head[1] - self.__tail[1],
+        )
+        self.__norm = self.__angle = None
+
+    @property
+    def head(self) -> _TPoint:
+        """Two-dimensional point at which the vector is pointing."""
+        return self.__head
+
+    @head.setter
+    def head(self, head: _TPoint) -> None:
+        self.__head = head
+        self.__update()
+
+    @property
+    def tail(self) -> _TPoint:
+        """Two-dimensional point at which the vector starts."""
+        return self.__tail
+
+    @tail.setter
+    def tail(self, tail: _TPoint) -> None:
+        self.__tail = tail
+        self.__update()
 
     @property
     def components(self) -> _TVector:
         """Vector head point when tail is moved to the origin."""
-        return (self.head[0] - self.tail[0], self.head[1] - self.tail[1])
+        return self.__components
 
     @property
     def norm(self) -> float:
         """Norm of the vector."""
-        return _math.sqrt(self.components[0] ** 2 + self.components[1] ** 2)
+        if self.__norm is None:
+            self.__norm = _math.hypot(*self.__components)
+        return self.__norm
 
     @property
     def angle(self) -> float:
@@ -48,8 +106,9 @@ class Vector:
         is negative it indicates a clockwise rotation from the x-axis, this \
         means that the vector is on the third or fourth quadrant.
         """
-        angle = _math.acos(self.components[0] / self.norm)
-        return angle if self.components[1] >= 0 else -angle
+        if self.__angle is None:
+            self.__angle = _math.atan2(self.__components[1], self.__components[0])
+        return self.__angle
 
     def place(self, point: _TPoint) -> None:
         """Moves the vector to the given point, that is, the vector tail \
@@ -71,11 +130,9 @@ class Vector:
             v.head
             >>> (1, 5)
         """
-        self.head = (
-            point[0] + self.components[0],
-            point[1] + self.components[1],
-        )
-        self.tail = point
+        x, y = self.__components
+        self.__head = (point[0] + x, point[1] + y)
+        self.__tail = point
 
     def __getitem__(self, i: int) -> _TNumber:
         """Returns the component at index `i`.
@@ -92,10 +149,10 @@ class Vector:
             v[1]
             >>> 4
         """
-        return self.components[i]
+        return self.__components[i]
 
     def __len__(self) -> int:
-        return len(self.components)
+        return 2
 
     def __mul__(self, scalar: _TNumber) -> "Vector":
         """Defines vector scaling. The scaled vector preserves the \
@@ -114,15 +171,8 @@ class Vector:
             w.components
             >>> (6, 6)
         """
-        scaled_vector_components = (
-            self.components[0] * scalar,
-            self.components[1] * scalar,
-        )
-        scaled_vector_head = (
-            self.tail[0] + scaled_vector_components[0],
-            self.tail[1] + scaled_vector_components[1],
-        )
-        return Vector(head=scaled_vector_head, tail=self.tail)
+        x, y = self.__components
+        return Vector._from_components(x * scalar, y * scalar, self.__tail)
 
     def __add__(self, vector: "Vector") -> "Vector":
         """Defines vector addition. Result vector is placed at the origin, \
@@ -139,11 +189,9 @@ class Vector:
             >>> (0, 0)
             n.head
             >>> (2, 1)"""
-        head = (
-            self.components[0] + vector.components[0],
-            self.components[1] + vector.components[1],
-        )
-        return Vector(head)
+        x, y = self.__components
+        other_x, other_y = vector.components
+        return Vector._from_components(x + other_x, y + other_y)
 
     def __sub__(self, vector: "Vector") -> "Vector":
         """Defines vector subtraction. Result vector is placed at the origin, \
@@ -161,7 +209,9 @@ class Vector:
             n.head
             >>> (4, 5)
         """
-        return self + vector * -1
+        x, y = self.__components
+        other_x, other_y = vector.components
+        return Vector._from_components(x - other_x, y - other_y)
 
     def __eq__(self, vector: "Vector") -> bool:
         """Defines equality between two vectors. It compares the components \
@@ -176,4 +226,130 @@ class Vector:
             v == w
             >>> True
         """
-        return self.components == vector.components
+        return self.__components == vector.components
+
+
+class VectorArray:
+    """Array of two-dimensional vectors.
+
+    Heads and tails are stored in contiguous columns of floats (see `CurvePoints`), so \
+    operations such as addition, scaling, norm and angle are computed for all vectors \
+    at once (with NumPy when it is installed). Use `Plotter.plot_vectors()` to plot all \
+    vectors in a single pass.
+
+    Parameters
+    ----------
+    heads : CurvePoints or Sequence[tuple[int or float, int or float]]
+        Two-dimensional points at which the vectors are pointing.
+    tails : CurvePoints or Sequence[tuple[int or float, int or float]] or None
+        Two-dimensional points at which the vectors start. Must have the same length as \
+        `heads`. If None, all vectors start at the origin. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        heads: _Sequence[_TPoint],
+        tails: _Sequence[_TPoint] = None,
+    ):
+        self.heads = _CurvePoints.from_points(heads)
+        if tails is None:
+            zeros = bytes(8 * len(self.heads))
+            tails = _CurvePoints(_array("d", zeros), _array("d", zeros))
+        self.tails = _CurvePoints.from_points(tails)
+        if len(self.heads) != len(self.tails):
+            raise ValueError("heads and tails must have the same length")
+
+    @classmethod
+    def from_vectors(cls, vectors: _Iterable[Vector]) -> "VectorArray":
+        """Builds a `VectorArray` from an iterable of vectors.
+
+        Parameters
+        ----------
+        vectors : Iterable[Vector]
+            Vectors to be stored.
+        """
+        vectors = list(vectors)
+        return cls(
+            [vector.head for vector in vectors], [vector.tail for vector in vectors]
+        )
+
+    @property
+    def components(self) -> _CurvePoints:
+        """Vectors heads when tails are moved to the origin."""
+        return _CurvePoints(
+            _map_columns(_subtract, self.heads.x, self.tails.x),
+            _map_columns(_subtract, self.heads.y, self.tails.y),
+        )
+
+    @property
+    def norm(self) -> _Sequence[float]:
+        """Norm of each vector."""
+        components = self.components
+        if _np is not None:
+            return _np.hypot(_as_numpy(components.x), _as_numpy(components.y))
+        return _array("d", map(_math.hypot, components.x, components.y))
+
+    @property
+    def angle(self) -> _Sequence[float]:
+        """Angle between each vector and the x-axis in radians (see `Vector.angle`)."""
+        components = self.components
+        if _np is not None:
+            return _np.arctan2(_as_numpy(components.y), _as_numpy(components.x))
+        return _array("d", map(_math.atan2, components.y, components.x))
+
+    def __len__(self) -> int:
+        return len(self.heads)
+
+    def __getitem__(self, i: int) -> Vector:
+        """Returns the vector at index `i`."""
+        return Vector(self.heads[i], self.tails[i])
+
+    def __iter__(self) -> _Iterator[Vector]:
+        return (Vector(head, tail) for head, tail in zip(self.heads, self.tails))
+
+    def __mul__(self, scalar: _TNumber) -> "VectorArray":
+        """Defines vectors scaling. The scaled vectors preserve their tails."""
+        components = self.components
+        heads = _CurvePoints(
+            _map_columns(lambda t, c: t + c * scalar, self.tails.x, components.x),
+            _map_columns(lambda t, c: t + c * scalar, self.tails.y, components.y),
+        )
+        return VectorArray(heads, self.tails)
+
+    def __add__(self, vectors: "VectorArray") -> "VectorArray":
+        """Defines element-wise vectors addition. Result vectors are placed at the \
+        origin."""
+        components, other_components = self.components, vectors.components
+        return VectorArray(
+            _CurvePoints(
+                _map_columns(_add, components.x, other_components.x),
+                _map_columns(_add, components.y, other_components.y),
+            )
+        )
+
+    def __sub__(self, vectors: "VectorArray") -> "VectorArray":
+        """Defines element-wise vectors subtraction. Result vectors are placed at the \
+        origin."""
+        components, other_components = self.components, vectors.components
+        return VectorArray(
+            _CurvePoints(
+                _map_columns(_subtract, components.x, other_components.x),
+                _map_columns(_subtract, components.y, other_components.y),
+            )
+        )
+
+
+def _add(a, b):
+    return a + b
+
+
+def _subtract(a, b):
+    return a - b
+
+
+def _map_columns(operation: _Callable, *columns: _Sequence[float]) -> _Sequence[float]:
+    # `operation` only uses arithmetic operators, so it works both on NumPy arrays
+    # (computing the whole columns at once) and on floats.
+    if _np is not None:
+        return operation(*map(_as_numpy, columns))
+    return _array("d", map(operation, *columns))
@@ -0,0 +1,97 @@
+import curvipy
+import pytest
+
+
+class ScaledIdentity:
+    """Callable object that defines `__eq__`, so it is not hashable."""
+
+    def __init__(self, factor):
+        self.factor = factor
+
+    def __call__(self, x):
+        return self.factor * x
+
+    def __eq__(self, other):
+        return isinstance(other, ScaledIdentity) and self.factor == other.factor
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    curvipy.Curve.points_cache.invalidate()
+    yield
+    curvipy.Curve.points_cache.invalidate()
+
+
+def svg_plotter():
+    return curvipy.Plotter(curvipy.ScreenConfiguration(backend="svg"))
+
+
+def last_polyline_y(plotter):
+    opcode, points, _ = plotter.display_list[-1]
+    assert opcode == curvipy.DisplayList.POLYLINE
+    return list(points.y)
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_unhashable_callable_is_plotted(cache):
+    plotter = svg_plotter()
+    curve = curvipy.Function(
+        ScaledIdentity(2), curvipy.Interval(-1, 2, 3), vectorize=False, cache=cache
+    )
+
+    plotter.plot_curve(curve)
+
+    assert last_polyline_y(plotter) == [-2, 0, 2]
+    assert len(curvipy.Curve.points_cache) == 0
+
+
+def test_curves_are_not_cached_by_default():
+    plotter = svg_plotter()
+    params = {"a": 1.0}
+    curve = curvipy.Function(
+        lambda x: params["a"] * x, curvipy.Interval(-1, 2, 3), vectorize=False
+    )
+
+    plotter.plot_curve(curve)
+    params["a"] = 3.0
+    plotter.clean()
+    plotter.plot_curve(curve)
+
+    assert last_polyline_y(plotter) == [-3, 0, 3]
+    assert len(curvipy.Curve.points_cache) == 0
+
+
+def test_cached_curve_is_evaluated_again_after_invalidate():
+    plotter = svg_plotter()
+    params = {"a": 1.0}
+    curve = curvipy.Function(
+        lambda x: params["a"] * x,
+        curvipy.Interval(-1, 2, 3),
+        vectorize=False,
+        cache=True,
+    )
+
+    plotter.plot_curve(curve)
+    params["a"] = 3.0
+    plotter.clean()
+    plotter.plot_curve(curve)
+    # Without invalidating the cache, the stale points are plotted
+    assert last_polyline_y(plotter) == [-1, 0, 1]
+    assert curvipy.Curve.points_cache.hits == 1
+
+    curvipy.Curve.points_cache.invalidate(curve)
+    plotter.clean()
+    plotter.plot_curve(curve)
+    assert last_polyline_y(plotter) == [-3, 0, 3]
+
+
+def test_animated_curve_is_evaluated_once():
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    curve = curvipy.Function(square, curvipy.Interval(-2, 2, 20), vectorize=False)
+    svg_plotter().plot_animated_curve(curve, samples_per_vector=5)
+    assert len(calls) == 20
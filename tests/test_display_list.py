@@ -0,0 +1,32 @@
+import curvipy
+
+
+def svg_plotter(stream_chunk_size=None):
+    return curvipy.Plotter(
+        curvipy.ScreenConfiguration(backend="svg"),
+        plotting_config=curvipy.PlottingConfiguration(
+            stream_chunk_size=stream_chunk_size
+        ),
+    )
+
+
+def test_plotted_curves_are_recorded():
+    plotter = svg_plotter()
+    plotter.plot_curve(curvipy.Function(lambda x: x, curvipy.Interval(-5, 5, 100)))
+
+    opcode, points, _ = plotter.display_list[-1]
+    assert opcode == curvipy.DisplayList.POLYLINE
+    assert len(points) == 100
+
+
+def test_streamed_curves_are_not_recorded():
+    plotter = svg_plotter(stream_chunk_size=10_000)
+    plotter.flush()  # Draws the axes
+    axes_display_list = plotter.display_list
+
+    curve = curvipy.Function(lambda x: x, curvipy.Interval(-5, 5, 200_000))
+    plotter.plot_curve(curve)
+
+    assert plotter.display_list == axes_display_list
+    assert plotter.simplification_stats[0] == 200_000
+    assert len(curvipy.Curve.points_cache) == 0
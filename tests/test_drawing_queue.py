@@ -0,0 +1,69 @@
+import curvipy
+
+
+class TimerBackend(curvipy.SVGBackend):
+    """SVG backend whose timers are run by `run_timers()`."""
+
+    SUPPORTS_TIMERS = True
+
+    def __init__(self):
+        super().__init__("test", "white")
+        self.timers = []
+
+    def ontimer(self, callback, delay):
+        self.timers.append(callback)
+
+    def run_timers(self, count):
+        for _ in range(count):
+            self.timers.pop(0)()
+
+
+class FailingCurve(curvipy.Function):
+    def __init__(self):
+        super().__init__(lambda x: x, curvipy.Interval(-1, 1, 10))
+
+    def points(self):
+        raise ValueError("cannot evaluate curve")
+
+
+def test_failing_command_does_not_stop_draining():
+    backend = TimerBackend()
+    plotter = curvipy.Plotter(curvipy.ScreenConfiguration(backend=backend))
+    errors = []
+    drawing_queue = plotter.start_queue(on_error=errors.append)
+
+    drawing_queue.put_points([(0, 0), (1, 1)])
+    drawing_queue.put_curve(FailingCurve())
+    drawing_queue.put_vector(curvipy.Vector((1, 2)))
+    drawing_queue.put_points([(0, 0), (-1, 1)])
+    backend.run_timers(1)
+
+    assert [str(error) for error in errors] == ["cannot evaluate curve"]
+    assert drawing_queue.plotted == 3
+    assert drawing_queue.failed == 1
+    assert len(drawing_queue) == 0
+    assert drawing_queue.submitted == drawing_queue.plotted + drawing_queue.failed
+
+    # Drains are still scheduled after the failure
+    assert len(backend.timers) == 1
+    drawing_queue.put_points([(0, 0), (1, -1)])
+    backend.run_timers(1)
+    assert drawing_queue.plotted == 4
+
+
+def test_raising_error_handler_does_not_stop_draining():
+    backend = TimerBackend()
+    plotter = curvipy.Plotter(curvipy.ScreenConfiguration(backend=backend))
+
+    def raise_error(error):
+        raise error
+
+    drawing_queue = plotter.start_queue(on_error=raise_error)
+    drawing_queue.put_curve(FailingCurve())
+    try:
+        backend.run_timers(1)
+    except ValueError:
+        pass
+
+    assert drawing_queue.failed == 1
+    assert len(backend.timers) == 1
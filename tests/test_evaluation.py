@@ -0,0 +1,24 @@
+import random
+
+import curvipy
+import numpy as np
+import pytest
+
+
+def test_functions_ignoring_their_argument_fall_back_to_scalar_loop():
+    interval = curvipy.Interval(0, 1, 10)
+    points = curvipy.Function(lambda x: random.random(), interval).points()
+    assert len(set(points.y)) == 10
+
+
+def test_reductions_fall_back_to_scalar_loop():
+    interval = curvipy.Interval(0, 4, 4)
+    points = curvipy.Function(lambda x: np.max(x) * 2, interval).points()
+    assert list(points.y) == [0, 2, 4, 6]
+
+
+@pytest.mark.parametrize("vectorize", [None, True])
+def test_constants(vectorize):
+    interval = curvipy.Interval(0, 1, 3)
+    points = curvipy.Function(lambda x: 3, interval, vectorize=vectorize).points()
+    assert list(points.y) == [3, 3, 3]
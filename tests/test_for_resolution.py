@@ -0,0 +1,18 @@
+import math
+
+import curvipy
+
+
+def test_parametric_function_ignores_non_finite_probe_samples():
+    # The probe samples t = 0, where 1 / t is not finite
+    curve = curvipy.ParametricFunction(
+        lambda t: (t, 1 / t if t else math.inf), curvipy.Interval(-1, 1, "auto")
+    )
+    samples = len(curve.for_resolution((0.01, 0.01)).interval)
+    assert 2 <= samples <= curvipy.ParametricFunction.MAX_AUTO_SAMPLES
+
+
+def test_function_auto_samples_are_limited():
+    curve = curvipy.Function(lambda x: x, curvipy.Interval(-1e9, 1e9, "auto"))
+    samples = len(curve.for_resolution((0.01, 0.01)).interval)
+    assert samples == curvipy.Function.MAX_AUTO_SAMPLES
@@ -0,0 +1,20 @@
+from array import array
+
+import curvipy
+import pytest
+
+
+@pytest.mark.parametrize(
+    "interval",
+    [
+        curvipy.Interval(-3.7, 11.2, 1001),
+        curvipy.Interval(0, 1, 0),
+        curvipy.Interval(5, -2, 77)[3:50:4],
+        curvipy.Interval(0, 10, 10)[::-1],
+    ],
+)
+def test_as_array_matches_interval_values(interval):
+    values = interval.as_array()
+
+    assert isinstance(values, array)
+    assert values == array("d", iter(interval))
@@ -0,0 +1,24 @@
+import re
+
+import curvipy
+import pytest
+
+
+@pytest.mark.parametrize("clip", [False, True])
+def test_svg_polylines_are_split_at_non_finite_points(clip):
+    backend = curvipy.SVGBackend("test", "white")
+    plotter = curvipy.Plotter(
+        curvipy.ScreenConfiguration(backend=backend),
+        plotting_config=curvipy.PlottingConfiguration(clip=clip),
+        axes_config=curvipy.AxesConfiguration(show_axes=False),
+    )
+
+    # The interval contains 0, where 1 / x is infinite
+    plotter.plot_curve(curvipy.Function(lambda x: 1 / x, curvipy.Interval(-5, 6, 11)))
+
+    svg = backend.to_svg()
+    polylines = re.findall(r'<polyline points="([^"]*)"', svg)
+    assert len(polylines) == 2
+    for points in polylines:
+        for coordinate in re.split("[ ,]", points):
+            assert re.fullmatch(r"-?\d+\.\d+", coordinate)
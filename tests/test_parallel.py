@@ -0,0 +1,49 @@
+import operator
+
+import curvipy
+import curvipy._parallel
+
+
+class UnloadableInWorkers:
+    """Picklable callable whose unpickling fails, like a function defined in \
+    `__main__` when processes are started with "spawn"."""
+
+    def __call__(self, x):
+        return 2 * x
+
+    def __reduce__(self):
+        return operator.truediv, (1, 0)
+
+
+def test_broken_process_pool_falls_back_to_threads():
+    with curvipy.ParallelEvaluation(workers=2, chunk_size=4) as parallel:
+        function = UnloadableInWorkers()
+
+        assert parallel.map(function, list(range(10))) == [2 * x for x in range(10)]
+        # Threads are used from then on
+        assert parallel.map(function, [5]) == [10]
+
+
+def test_pools_are_reused(monkeypatch):
+    created_pools = []
+
+    class CountingThreadPoolExecutor(curvipy._parallel._ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created_pools.append(self)
+
+    monkeypatch.setattr(
+        curvipy._parallel, "_ThreadPoolExecutor", CountingThreadPoolExecutor
+    )
+    with curvipy.ParallelEvaluation("thread", workers=2, chunk_size=3) as parallel:
+        for _ in range(5):
+            assert parallel.map(abs, [-1, -2, 3, -4]) == [1, 2, 3, 4]
+    assert len(created_pools) == 1
+
+
+def test_closed_evaluation_can_be_used_again():
+    parallel = curvipy.ParallelEvaluation("thread", workers=2)
+    assert parallel.map(abs, [-1]) == [1]
+    parallel.close()
+    assert parallel.map(abs, [-2]) == [2]
+    parallel.close()
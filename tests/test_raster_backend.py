@@ -0,0 +1,52 @@
+import curvipy
+import numpy as np
+
+
+def reference_coverage(width, height, segments, radius):
+    # Coverage computed pixel by pixel, from the distance to the nearest segment
+    px, py = np.meshgrid(np.arange(width) + 0.5, np.arange(height) + 0.5)
+    distance = np.full((height, width), np.inf)
+    for (x0, y0), (x1, y1) in segments:
+        dx, dy = x1 - x0, y1 - y0
+        length_2 = dx * dx + dy * dy
+        t = np.clip(((px - x0) * dx + (py - y0) * dy) / (length_2 or 1), 0, 1)
+        distance = np.minimum(distance, np.hypot(px - x0 - t * dx, py - y0 - t * dy))
+    return np.clip(radius + 0.5 - distance, 0, 1)
+
+
+def test_batched_coverage_matches_reference():
+    backend = curvipy.RasterBackend("test", "black", 80, 60)
+    # Long segments, a zero-length segment and a segment out of the image
+    points = [(-30, -20), (25, 10), (25, 10), (-5, 28), (60, 40)]
+    backend.draw_polyline(curvipy.CurvePoints.from_points(points), 3, "white", 10)
+
+    pixels = [(40 + x, 30 - y) for x, y in points]
+    coverage = reference_coverage(80, 60, zip(pixels, pixels[1:]), 1.5)
+    expected = np.rint(coverage * 255).astype(np.uint8)
+    assert np.abs(backend.pixels[..., 0].astype(int) - expected).max() <= 1
+
+
+def test_draw_polylines_matches_draw_polyline():
+    polylines = [
+        curvipy.CurvePoints.from_points([(-30, -20 + 8 * i), (25, -18 + 8 * i)])
+        for i in range(5)
+    ]
+    one_by_one = curvipy.RasterBackend("test", "white", 80, 60)
+    for points in polylines:
+        one_by_one.draw_polyline(points, 2, "red", 10)
+    batched = curvipy.RasterBackend("test", "white", 80, 60)
+    batched.draw_polylines(polylines, 2, "red")
+
+    assert np.array_equal(one_by_one.pixels, batched.pixels)
+
+
+def test_far_off_segments_are_clipped_to_the_image():
+    backend = curvipy.RasterBackend("test", "black", 80, 60)
+    # Split into 4 pixels long pieces, this segment would have 2.5e8 of them
+    points = [(-10, 5), (1e9, 5)]
+    backend.draw_polyline(curvipy.CurvePoints.from_points(points), 3, "white", 10)
+
+    pixels = [(40 + x, 30 - y) for x, y in points]
+    coverage = reference_coverage(80, 60, [pixels], 1.5)
+    expected = np.rint(coverage * 255).astype(np.uint8)
+    assert np.abs(backend.pixels[..., 0].astype(int) - expected).max() <= 1
@@ -0,0 +1,45 @@
+import math
+
+import curvipy
+
+
+def chirp(x):
+    return math.sin(5 * x * x)
+
+
+def test_budget_is_spent_where_the_curve_deviates_the_most():
+    # Symmetric grid from -4 to 4 (the interval end is excluded)
+    grid = curvipy.Interval(-4, 4.16, 51).as_array()
+    sampling = curvipy.AdaptiveSampling(tolerance=0.001, max_samples=200)
+    xs, _ = sampling.sample(chirp, grid, vectorize=False)
+
+    assert len(xs) == 200
+    assert list(xs) == sorted(xs)
+    left = sum(x < 0 for x in xs)
+    right = sum(x > 0 for x in xs)
+    assert abs(left - right) <= 5
+
+
+def test_tolerance_is_measured_in_pixels():
+    sampling = curvipy.AdaptiveSampling(tolerance=0.5)
+    function = curvipy.Function(chirp, curvipy.Interval(-4, 4, 50), sampling=sampling)
+
+    coarse = function.for_resolution((0.1, 0.1))
+    fine = function.for_resolution((0.01, 0.01))
+    assert coarse.sampling.pixel_size == (0.1, 0.1)
+    assert len(coarse.points()) < len(fine.points())
+    assert coarse.for_resolution((0.1, 0.1)) is coarse
+
+
+def test_default_tolerance_outside_a_plotter_is_in_logical_units():
+    # Without a pixel size, the default tolerance is `LOGICAL_TOLERANCE` (0.01), not
+    # `PIXEL_TOLERANCE` (0.5) logical units
+    interval = curvipy.Interval(-4, 4, 50)
+    default = curvipy.Function(chirp, interval, sampling=curvipy.AdaptiveSampling())
+    logical = curvipy.AdaptiveSampling(curvipy.AdaptiveSampling.LOGICAL_TOLERANCE)
+    explicit = curvipy.Function(chirp, interval, sampling=logical)
+    assert list(default.points()) == list(explicit.points())
+
+    pixels = default.for_resolution((0.1, 0.1))
+    assert pixels.sampling.tolerance is None
+    assert len(pixels.points()) < len(default.points())
@@ -0,0 +1,21 @@
+import curvipy
+import pytest
+
+from curvipy._simplify import _simplify_numpy
+from curvipy._simplify import _simplify_python
+
+
+@pytest.mark.parametrize("simplify", [_simplify_numpy, _simplify_python])
+def test_points_folding_back_along_the_chord_are_kept(simplify):
+    points = curvipy.CurvePoints.from_points([(0, 0), (100, 0), (50, 0)])
+    assert [tuple(map(float, point)) for point in simplify(points, 0.5)] == [
+        (0, 0),
+        (100, 0),
+        (50, 0),
+    ]
+
+
+@pytest.mark.parametrize("simplify", [_simplify_numpy, _simplify_python])
+def test_collinear_points_within_the_segment_are_dropped(simplify):
+    points = curvipy.CurvePoints.from_points([(0, 0), (30, 0.1), (60, 0), (100, 0)])
+    assert len(simplify(points, 0.5)) == 2
@@ -0,0 +1,38 @@
+import math
+import re
+
+import curvipy
+import curvipy._screen
+import pytest
+
+
+def plot_vectors(clip):
+    backend = curvipy.SVGBackend("test", "white")
+    plotter = curvipy.Plotter(
+        curvipy.ScreenConfiguration(backend=backend),
+        plotting_config=curvipy.PlottingConfiguration(clip=clip),
+        axes_config=curvipy.AxesConfiguration(show_axes=False),
+    )
+    vectors = [
+        curvipy.Vector((i * 0.9, 3 * math.sin(i)), (i * 0.5, -i * 0.3))
+        for i in range(-40, 40)
+    ]
+    plotter.plot_vectors(vectors + [curvipy.Vector((1, 1), (1, 1))])
+
+    polylines = sorted(re.findall(r'<polyline points="([^"]*)"', backend.to_svg()))
+    commands = sorted(
+        (
+            opcode,
+            tuple(tuple(round(float(c), 9) for c in point) for point in points),
+            tuple(round(a, 9) if isinstance(a, float) else a for a in arguments),
+        )
+        for opcode, points, arguments in plotter.display_list
+    )
+    return polylines, commands
+
+
+@pytest.mark.parametrize("clip", [False, True])
+def test_batched_vectors_match_the_scalar_loop(clip, monkeypatch):
+    batched = plot_vectors(clip)
+    monkeypatch.setattr(curvipy._screen, "_np", None)
+    assert batched == plot_vectors(clip)